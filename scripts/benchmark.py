@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Data Pipeline Benchmarks
+Measures wall time, peak memory and throughput for each pipeline stage and
+compares runs against a saved baseline
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Optional, Tuple
+
+from ingest_data import (
+    DATA_DIR,
+    PFR_DATA_FILES,
+    FANTASY_PROS_DATA_FILES,
+    PROJECT_ROOT,
+    find_data_file,
+    normalize_pfr_file,
+    normalize_fantasy_pros_file,
+    read_pfr_csv,
+    to_columns,
+)
+from player_store import load_store
+from scoring import score_seasons
+from optimize_assets import analyze_assets
+
+RESULTS_FILE = PROJECT_ROOT / "benchmark_results.json"
+SCALE_SOURCE = "pff-nfl-regular-receiving-2024.csv"
+DEFAULT_THRESHOLD = 0.20
+
+# A case returns (function to time, rows it processes)
+Case = Tuple[Callable[[], Any], int]
+
+
+def _data_files() -> List[Path]:
+    return sorted(DATA_DIR.glob("*.csv"))
+
+
+def case_csv_parse(workdir: Path) -> Case:
+    """csv.reader over every file in public/data"""
+    files = _data_files()
+    rows = 0
+    for path in files:
+        with open(path, newline="", encoding="utf-8") as f:
+            rows += sum(1 for _ in csv.reader(f))
+
+    def run():
+        for path in files:
+            with open(path, newline="", encoding="utf-8") as f:
+                for _ in csv.reader(f):
+                    pass
+
+    return run, rows
+
+
+def case_normalize(workdir: Path) -> Case:
+    """Full ingest cleanup and typing for every known dataset"""
+    jobs = [(spec, normalize_pfr_file) for spec in PFR_DATA_FILES]
+    jobs += [(spec, normalize_fantasy_pros_file) for spec in FANTASY_PROS_DATA_FILES]
+    rows = sum(normalize(spec)["rowCount"] for spec, normalize in jobs)
+
+    def run():
+        for spec, normalize in jobs:
+            normalize(spec)
+
+    return run, rows
+
+
+def case_scoring(workdir: Path) -> Case:
+    """Batched scoring of every player-season under every profile"""
+    store = load_store()
+    rows = len(score_seasons(store))
+    return (lambda: score_seasons(store)), rows
+
+
+def case_json_export(workdir: Path) -> Case:
+    """Compact JSON serialization of every normalized payload"""
+    payloads = [normalize_pfr_file(spec) for spec in PFR_DATA_FILES]
+    payloads += [normalize_fantasy_pros_file(spec) for spec in FANTASY_PROS_DATA_FILES]
+    rows = sum(payload["rowCount"] for payload in payloads)
+
+    def run():
+        for payload in payloads:
+            json.dumps(payload, separators=(",", ":"))
+
+    return run, rows
+
+
+def case_asset_analysis(workdir: Path) -> Case:
+    """optimize_assets.analyze_assets() with output and report discarded"""
+    report_path = workdir / "asset_report.json"
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            analyze_assets(report_path)
+
+    return run, len(_data_files())
+
+
+def scaled_receiving_case(factor: int) -> Callable[[Path], Case]:
+    """Parse + normalize the 2024 receiving file repeated `factor` times"""
+
+    def build(workdir: Path) -> Case:
+        source = find_data_file(SCALE_SOURCE)
+        with open(source, newline="", encoding="utf-8") as f:
+            lines = f.read().splitlines(keepends=True)
+        header, body = lines[:2], lines[2:]
+
+        path = workdir / f"receiving_x{factor}.csv"
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            f.writelines(header)
+            for _ in range(factor):
+                f.writelines(body)
+        rows = len(read_pfr_csv(path)[1])
+
+        def run():
+            headers, data = read_pfr_csv(path)
+            to_columns(headers, data)
+
+        return run, rows
+
+    build.__doc__ = f"Parse + normalize {SCALE_SOURCE} scaled {factor}x"
+    return build
+
+
+BENCHMARKS: Dict[str, Callable[[Path], Case]] = {
+    "csv_parse_all": case_csv_parse,
+    "normalize_all": case_normalize,
+    "scoring_all_profiles": case_scoring,
+    "json_export": case_json_export,
+    "asset_analysis": case_asset_analysis,
+    "receiving_2024_x10": scaled_receiving_case(10),
+    "receiving_2024_x100": scaled_receiving_case(100),
+}
+
+
+def measure(run: Callable[[], Any], rows: int, repeat: int) -> Dict[str, Any]:
+    """Best-of-N wall time plus a separate traced run for peak memory"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    best = min(timings)
+    return {
+        "rows": rows,
+        "seconds": round(best, 6),
+        "mean_seconds": round(sum(timings) / len(timings), 6),
+        "rows_per_sec": round(rows / best, 1) if best > 0 else None,
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+
+def run_benchmarks(names: Optional[List[str]] = None, repeat: int = 5) -> Dict[str, Any]:
+    """Run the selected benchmarks and return a results document"""
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for name in names or list(BENCHMARKS):
+            run, rows = BENCHMARKS[name](Path(workdir))
+            results[name] = measure(run, rows, repeat)
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "python": sys.version.split()[0],
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any],
+            threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """Benchmarks whose best time grew by more than `threshold` over the baseline"""
+    regressions = []
+    for name, result in current["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous or not previous.get("seconds"):
+            continue
+        ratio = result["seconds"] / previous["seconds"]
+        if ratio > 1 + threshold:
+            regressions.append({
+                "name": name,
+                "baseline_seconds": previous["seconds"],
+                "seconds": result["seconds"],
+                "ratio": round(ratio, 3),
+            })
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the data pipeline")
+    parser.add_argument("names", nargs="*", help=f"benchmarks to run (default: all of {', '.join(BENCHMARKS)})")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per benchmark")
+    parser.add_argument("--output", type=Path, default=RESULTS_FILE, help="where to save results JSON")
+    parser.add_argument("--baseline", type=Path, help="results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown before failing (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+
+    print("\n" + "=" * 60)
+    print("⏱️  DATA PIPELINE BENCHMARKS")
+    print("=" * 60 + "\n")
+
+    report = run_benchmarks(args.names or None, args.repeat)
+
+    for name, result in report["results"].items():
+        print(f"  {name:<24} {result['seconds'] * 1000:9.2f} ms  "
+              f"{result['rows_per_sec'] or 0:>12,.0f} rows/s  {result['peak_kb']:>9,.1f} KB peak")
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\n📄 Results saved to: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) over {args.threshold:.0%}:")
+            for regression in regressions:
+                print(f"  - {regression['name']}: {regression['baseline_seconds'] * 1000:.2f} ms -> "
+                      f"{regression['seconds'] * 1000:.2f} ms ({regression['ratio']:.2f}x)")
+            sys.exit(1)
+        print(f"\n✅ No regressions over {args.threshold:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
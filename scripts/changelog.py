@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Data Changelog
+Diffs each data file against its last recorded snapshot, keyed by player, and writes the
+row-level changes (added, removed, changed fields as old -> new) as small patch files
+"""
+
+import argparse
+import csv
+import json
+import os
+import re
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+from hashing import file_hash
+from ingest_data import (
+    DATA_DIR,
+    PFR_DATA_FILES,
+    FANTASY_PROS_DATA_FILES,
+    PROJECT_ROOT,
+    read_pfr_csv,
+    read_fantasy_pros_csv,
+    to_columns,
+)
+from name_resolver import NameResolver, build_resolver
+from scrape_fantasy_pros import JSON_FILE
+
+CHANGELOG_DIR = DATA_DIR / "changelog"
+INDEX_FILE = "index.json"
+SNAPSHOT_FILE = "snapshot.json"
+
+# Single-table files (CSVs) diff under this table name
+ROWS_TABLE = "rows"
+
+# Scraped dataset lists are named "<position>_<year>", e.g. "wr_2024"
+SCRAPED_TABLE = re.compile(r"([a-z]+)_(\d{4})")
+
+Snapshot = Dict[str, Dict[str, Dict[str, Any]]]
+
+
+def row_key(row: Dict[str, Any], seen: Dict[str, int], code: Optional[str] = None) -> str:
+    """
+    Stable key for a row: the PFR player code when there is one, else the player name
+    PFR lists traded players once per team, so their key carries the team; FantasyPros rows pass
+    the code their name resolved to. Repeated keys get #2, #3...
+    """
+    if row.get("PlayerID"):
+        key = f"{row['PlayerID']}:{row.get('Team') or ''}"
+    elif code:
+        key = code
+    else:
+        key = str(row.get("Player") or row.get("Name") or "")
+    seen[key] = seen.get(key, 0) + 1
+    return key if seen[key] == 1 else f"{key}#{seen[key]}"
+
+
+def keyed_rows(rows: List[Dict[str, Any]], codes: Optional[List[Optional[str]]] = None) -> Dict[str, Dict[str, Any]]:
+    seen: Dict[str, int] = {}
+    codes = codes or [None] * len(rows)
+    return {row_key(row, seen, code): row for row, code in zip(rows, codes)}
+
+
+@lru_cache(maxsize=None)
+def _resolver() -> NameResolver:
+    return build_resolver()
+
+
+def fantasy_pros_codes(rows: List[Dict[str, Any]], year: Optional[int], position: Optional[str]) -> List[Optional[str]]:
+    """
+    PFR codes for FantasyPros rows (None where the name does not resolve), so a display-name
+    change such as an added "Jr." diffs as a changed row rather than a remove plus an add
+    """
+    records = ((str(row.get("Player") or ""), row.get("Team") or None, year, position) for row in rows)
+    return [match["code"] if match else None for match in _resolver().resolve_many(records)]
+
+
+def _columns_to_rows(headers: List[str], rows: List[List[str]]) -> List[Dict[str, Any]]:
+    payload = to_columns(headers, rows)
+    data = payload["data"]
+    keys = [column["key"] for column in payload["columns"]]
+    return [{key: data[key][i] for key in keys} for i in range(len(rows))]
+
+
+def load_snapshot(path: Path) -> Snapshot:
+    """
+    Tables of keyed rows for a data file
+    PFR and FantasyPros exports go through their ingest readers; the scraped JSON contributes
+    one table per dataset list, with scalar fields (timestamp) under "meta"
+    """
+    name = path.name.lower()
+    if path.suffix.lower() == ".json":
+        with open(path, "r", encoding="utf-8") as f:
+            document = json.load(f)
+        tables: Snapshot = {}
+        meta = {}
+        for key, value in document.items():
+            if isinstance(value, list):
+                scraped = SCRAPED_TABLE.fullmatch(key)
+                year, position = (int(scraped.group(2)), scraped.group(1).upper()) if scraped else (None, None)
+                tables[key] = keyed_rows(value, fantasy_pros_codes(value, year, position))
+            else:
+                meta[key] = value
+        if meta:
+            tables["meta"] = {"meta": meta}
+        return tables
+
+    fantasy_pros = next((spec for spec in FANTASY_PROS_DATA_FILES if spec["fileName"].lower() == name), None)
+    if any(spec["fileName"].lower() == name for spec in PFR_DATA_FILES):
+        headers, rows = read_pfr_csv(path)
+    elif fantasy_pros is not None:
+        headers, rows = read_fantasy_pros_csv(path)
+        records = _columns_to_rows(headers, rows)
+        codes = fantasy_pros_codes(records, int(fantasy_pros["year"]), fantasy_pros["position"])
+        return {ROWS_TABLE: keyed_rows(records, codes)}
+    else:
+        with open(path, "r", newline="", encoding="utf-8") as f:
+            lines = [line for line in csv.reader(f) if any(cell.strip() for cell in line)]
+        headers, rows = (lines[0], lines[1:]) if lines else ([], [])
+    return {ROWS_TABLE: keyed_rows(_columns_to_rows(headers, rows))}
+
+
+def diff_tables(old: Dict[str, Dict[str, Any]], new: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Row-level delta of one table (changed fields map to [old, new]); empty when nothing changed"""
+    delta: Dict[str, Any] = {}
+    added = {key: row for key, row in new.items() if key not in old}
+    removed = [key for key in old if key not in new]
+    changed = {}
+    for key, row in new.items():
+        previous = old.get(key)
+        if previous is None or previous == row:
+            continue
+        fields = {field: [previous.get(field), value] for field, value in row.items() if previous.get(field) != value}
+        # A field the new row no longer has is recorded as [old]
+        fields.update({field: [value] for field, value in previous.items() if field not in row})
+        changed[key] = fields
+
+    if added:
+        delta["added"] = added
+    if removed:
+        delta["removed"] = removed
+    if changed:
+        delta["changed"] = changed
+    if list(new) != [key for key in old if key in new] + list(added):
+        delta["order"] = list(new)
+    return delta
+
+
+def diff_snapshots(old: Snapshot, new: Snapshot) -> Dict[str, Dict[str, Any]]:
+    """Per-table deltas; tables that disappeared show every row removed"""
+    tables = {}
+    for table in list(new) + [table for table in old if table not in new]:
+        delta = diff_tables(old.get(table, {}), new.get(table, {}))
+        if delta:
+            tables[table] = delta
+    return tables
+
+
+def apply_patch(snapshot: Snapshot, patch: Dict[str, Any]) -> Snapshot:
+    """Replay a patch onto the snapshot it was made from"""
+    result = {table: dict(rows) for table, rows in snapshot.items()}
+    for table, delta in patch["tables"].items():
+        rows = result.setdefault(table, {})
+        for key in delta.get("removed", []):
+            rows.pop(key, None)
+        for key, fields in delta.get("changed", {}).items():
+            row = dict(rows[key])
+            for field, values in fields.items():
+                if len(values) == 1:
+                    row.pop(field, None)
+                else:
+                    row[field] = values[1]
+            rows[key] = row
+        rows.update(delta.get("added", {}))
+        if "order" in delta:
+            rows = {key: rows[key] for key in delta["order"]}
+        if rows:
+            result[table] = rows
+        else:
+            del result[table]
+    return result
+
+
+def patch_summary(patch: Dict[str, Any]) -> Dict[str, int]:
+    counts = {"added": 0, "removed": 0, "changed": 0}
+    for delta in patch["tables"].values():
+        for kind in counts:
+            counts[kind] += len(delta.get(kind, ()))
+    return counts
+
+
+def record_changes(path: Path, changelog_dir: Path = CHANGELOG_DIR) -> Optional[Dict[str, Any]]:
+    """
+    Compare a data file with its stored snapshot and write a patch when it changed
+    The first run only stores the baseline; returns the index entry of a new patch, else None
+    """
+    digest = file_hash(str(path))
+    directory = changelog_dir / path.stem
+    snapshot_path = directory / SNAPSHOT_FILE
+    index_path = changelog_dir / INDEX_FILE
+
+    index = _read_json(index_path, {})
+    entry = index.setdefault(path.name, {"hash": None, "patches": []})
+    if entry["hash"] == digest:
+        return None
+
+    new = load_snapshot(path)
+    stored = _read_json(snapshot_path, None)
+    result = None
+    if stored is not None and entry["hash"] is not None:
+        tables = diff_snapshots(stored, new)
+        if tables:
+            patch = {"source": path.name, "from": entry["hash"], "to": digest,
+                     "created": datetime.now().isoformat(timespec="seconds"), "tables": tables}
+            patch_name = f"{len(entry['patches']) + 1:04d}.json"
+            _write_json(directory / patch_name, patch)
+            result = {"file": f"{path.stem}/{patch_name}", "from": entry["hash"], "to": digest,
+                      "created": patch["created"], **patch_summary(patch)}
+            entry["patches"].append(result)
+
+    _write_json(snapshot_path, new)
+    entry["hash"] = digest
+    _write_json(index_path, index, indent=2)
+    return result
+
+
+def _read_json(path: Path, default: Any) -> Any:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def _write_json(path: Path, value: Any, indent: Optional[int] = None):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp = path.with_suffix(".tmp")
+    with open(temp, "w", encoding="utf-8") as f:
+        json.dump(value, f, indent=indent, separators=None if indent else (",", ":"), ensure_ascii=False)
+    os.replace(temp, path)
+
+
+def tracked_files(data_dir: Path = DATA_DIR) -> List[Path]:
+    """Every CSV in public/data plus the scraped JSON"""
+    files = sorted(data_dir.glob("*.csv"))
+    if (data_dir / JSON_FILE).exists():
+        files.append(data_dir / JSON_FILE)
+    return files
+
+
+def main():
+    """Record patches for every data file that changed since the last run"""
+    parser = argparse.ArgumentParser(description="Row-level changelog between data refreshes")
+    parser.add_argument("files", nargs="*", type=Path, help="data files (default: every CSV and the scraped JSON)")
+    args = parser.parse_args()
+
+    print("Data Changelog")
+    print("=" * 50)
+
+    files = args.files or tracked_files()
+    patches = 0
+    for path in files:
+        result = record_changes(path)
+        if result:
+            patches += 1
+            print(f"  📝 {path.name}: +{result['added']} -{result['removed']} ~{result['changed']} "
+                  f"-> {result['file']}")
+
+    print(f"  ✅ {len(files)} files checked, {patches} patches written to {CHANGELOG_DIR.relative_to(PROJECT_ROOT)}/")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Binary Columnar Export
+Writes each player-store table as fixed-width little-endian columns plus a string
+dictionary, and reads them back through mmap as zero-copy column views
+"""
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+from ingest_data import DATA_DIR
+from player_store import PlayerStore, StatTable, load_store
+
+COLUMNAR_DIR = DATA_DIR / "columnar"
+EXTENSION = ".ffcol"
+MAGIC = b"FFCOL\x00\x01\x00"
+ALIGNMENT = 8
+NULL_CODE = 0xFFFFFFFF
+
+# Column type -> array/memoryview typecode (all fixed-width, little-endian on disk)
+TYPECODES = {"f64": "d", "i32": "i", "i16": "h", "u32": "I", "u16": "H", "i8": "b"}
+
+# Integer-valued float columns are narrowed; the minimum value marks a missing cell
+NARROW_TYPES = [("i16", -(2 ** 15)), ("i32", -(2 ** 31))]
+
+
+def _pad(buffer: bytearray):
+    buffer.extend(b"\x00" * (-len(buffer) % ALIGNMENT))
+
+
+def narrow(values: array) -> tuple:
+    """Shrink an array('d') of whole numbers to i16/i32 with a null sentinel, else keep f64"""
+    present = [v for v in values if v == v]
+    if values.typecode != "d" or not all(v.is_integer() for v in present):
+        return values, None
+    low = min(present, default=0)
+    high = max(present, default=0)
+    for kind, sentinel in NARROW_TYPES:
+        if sentinel < low and high < -sentinel:
+            typecode = TYPECODES[kind]
+            return array(typecode, (int(v) if v == v else sentinel for v in values)), sentinel
+    return values, None
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+class StringDictionary:
+    """Deduplicated strings referenced by u32 codes"""
+
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def encode(self, value: Optional[str]) -> int:
+        if value is None:
+            return NULL_CODE
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+def write_columnar(path: Path, row_count: int, numeric: Dict[str, array],
+                   strings: Dict[str, List[Optional[str]]], metadata: Optional[Dict[str, Any]] = None):
+    """
+    Layout: MAGIC | u32 header length | JSON header | 8-byte aligned column blobs |
+    dictionary offsets (u32, count + 1) | dictionary UTF-8 bytes
+    """
+    dictionary = StringDictionary()
+    blobs: List[tuple] = []
+
+    for name, values in numeric.items():
+        values, null = narrow(values)
+        kind = next(kind for kind, code in TYPECODES.items() if code == values.typecode)
+        blobs.append((name, kind, null, _little_endian(values)))
+
+    for name, values in strings.items():
+        codes = array("I", (dictionary.encode(v) for v in values))
+        blobs.append((name, "dict", NULL_CODE, _little_endian(codes)))
+
+    encoded = [value.encode("utf-8") for value in dictionary.values]
+    offsets = array("I", [0])
+    for item in encoded:
+        offsets.append(offsets[-1] + len(item))
+    text = b"".join(encoded)
+
+    # Offsets are relative to the start of the data section, so the header can be sized first
+    columns = []
+    cursor = 0
+    for name, kind, null, blob in blobs:
+        columns.append({"name": name, "type": kind, "null": null, "offset": cursor, "length": len(blob)})
+        cursor += len(blob) + (-len(blob) % ALIGNMENT)
+    dictionary_info = {"count": len(encoded), "offsets": cursor, "data": cursor + len(offsets) * 4,
+                       "length": len(text)}
+
+    header = json.dumps({
+        "row_count": row_count,
+        "columns": columns,
+        "dictionary": dictionary_info,
+        "metadata": metadata or {},
+    }, separators=(",", ":")).encode("utf-8")
+
+    prefix = bytearray(MAGIC)
+    prefix.extend(struct.pack("<I", len(header)))
+    prefix.extend(header)
+    _pad(prefix)
+
+    body = bytearray()
+    for *_, blob in blobs:
+        body.extend(blob)
+        _pad(body)
+    body.extend(_little_endian(offsets))
+    body.extend(text)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(prefix)
+        f.write(body)
+
+
+class ColumnarFile:
+    """Memory-mapped reader handing out zero-copy memoryview columns"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+
+        if bytes(self._view[:len(MAGIC)]) != MAGIC:
+            self.close()
+            raise ValueError(f"{self.path} is not a columnar file")
+
+        (header_length,) = struct.unpack_from("<I", self._mmap, len(MAGIC))
+        header_start = len(MAGIC) + 4
+        header = json.loads(bytes(self._view[header_start:header_start + header_length]))
+        self._data_start = header_start + header_length + (-(header_start + header_length) % ALIGNMENT)
+
+        self.row_count: int = header["row_count"]
+        self.metadata: Dict[str, Any] = header["metadata"]
+        self._columns = {column["name"]: column for column in header["columns"]}
+        self._dictionary_info = header["dictionary"]
+        self._dictionary: Optional[List[str]] = None
+
+    def __enter__(self) -> "ColumnarFile":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Unmap the file; if column views are still alive the mapping is left to GC"""
+        try:
+            if getattr(self, "_view", None) is not None:
+                self._view.release()
+                self._view = None
+            if getattr(self, "_mmap", None) is not None:
+                self._mmap.close()
+                self._mmap = None
+        except BufferError:
+            pass
+        self._file.close()
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns)
+
+    def column_type(self, name: str) -> str:
+        return self._columns[name]["type"]
+
+    def _slice(self, start: int, length: int) -> memoryview:
+        return self._view[self._data_start + start:self._data_start + start + length]
+
+    def column(self, name: str) -> memoryview:
+        """
+        Zero-copy view of a numeric column (or the u32 codes of a string column)
+        Missing cells hold NaN for f64 columns and the column's null sentinel otherwise
+        """
+        info = self._columns[name]
+        typecode = "I" if info["type"] == "dict" else TYPECODES[info["type"]]
+        view = self._slice(info["offset"], info["length"]).cast(typecode)
+        if sys.byteorder == "big":
+            copy = array(typecode, view)
+            copy.byteswap()
+            return memoryview(copy)
+        return view
+
+    def null_value(self, name: str) -> Optional[int]:
+        """Sentinel marking missing cells in an integer column (None for f64)"""
+        return self._columns[name]["null"]
+
+    def values(self, name: str) -> List[Optional[Any]]:
+        """Materialized column with missing cells as None"""
+        if self.column_type(name) == "dict":
+            return self.strings(name)
+        null = self.null_value(name)
+        return [None if v == null or v != v else v for v in self.column(name)]
+
+    def dictionary(self) -> List[str]:
+        """Decode the shared string dictionary once"""
+        if self._dictionary is None:
+            info = self._dictionary_info
+            offsets = self._slice(info["offsets"], (info["count"] + 1) * 4).cast("I")
+            data = self._slice(info["data"], info["length"])
+            self._dictionary = [
+                bytes(data[offsets[i]:offsets[i + 1]]).decode("utf-8") for i in range(info["count"])
+            ]
+        return self._dictionary
+
+    def strings(self, name: str) -> List[Optional[str]]:
+        """Decoded values of a dictionary-encoded string column"""
+        dictionary = self.dictionary()
+        return [None if code == NULL_CODE else dictionary[code] for code in self.column(name)]
+
+
+def export_table(store: PlayerStore, table: StatTable, output_dir: Path = COLUMNAR_DIR) -> Path:
+    """Write one store table with its key columns and every stat column"""
+    numeric: Dict[str, array] = {
+        "player_id": table.player,
+        "year": table.year,
+        "season_type": table.season_type,
+    }
+    numeric.update(table.numeric)
+
+    strings: Dict[str, List[Optional[str]]] = {
+        "player": [store.player_names[p] for p in table.player],
+        "player_code": [store.player_codes[p] for p in table.player],
+        "team": [store.teams[t] for t in table.team],
+        "position": [store.positions[p] for p in table.position],
+    }
+    strings.update(table.text)
+
+    path = output_dir / f"{table.name}{EXTENSION}"
+    write_columnar(path, len(table), numeric, strings, {"table": table.name})
+    return path
+
+
+def export_all(store: Optional[PlayerStore] = None, output_dir: Path = COLUMNAR_DIR) -> List[Path]:
+    """Export every table of the player store"""
+    store = store or load_store()
+    return [export_table(store, table, output_dir) for table in store.tables.values()]
+
+
+def main():
+    """Export the store and show a zero-copy read back"""
+    print("Binary Columnar Export")
+    print("=" * 50)
+
+    for path in export_all():
+        with ColumnarFile(path) as columnar:
+            print(f"  ✅ {path.name}: {columnar.row_count} rows, {len(columnar.columns)} columns, "
+                  f"{path.stat().st_size / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
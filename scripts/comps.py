@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Player Comparables
+Standardized stat profiles per player-season, held column-major per position group, so the
+nearest historical seasons for one player (or a whole group) come from batched dot products
+"""
+
+import argparse
+import heapq
+import json
+import math
+import operator
+import time
+from array import array
+from itertools import repeat
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+from ingest_data import DATA_DIR, PROJECT_ROOT
+from player_store import SEASON_TYPES, PlayerStore, load_store
+
+COMPS_DIR = DATA_DIR / "comps"
+DEFAULT_K = 5
+
+# Profile stats per table; counting stats are taken per game so missed games don't skew a profile
+TABLE_FEATURES = {
+    "receiving": ["Tgt", "Y/Tgt", "Ctch%", "Succ%", "1D", "Y/G"],
+    "rushing": ["Att", "Y/A", "Succ%", "1D", "Y/G"],
+    "passing": ["Att", "Cmp%", "Y/A", "TD%", "Int%", "Succ%", "Y/G"],
+}
+PER_GAME = {"Tgt", "Att", "1D"}
+
+# Tables profiled for each position, primary table first (it decides who is in the group)
+POSITION_TABLES = {
+    "WR": ["receiving"],
+    "TE": ["receiving"],
+    "RB": ["rushing", "receiving"],
+    "QB": ["passing", "rushing"],
+}
+
+# Seasons below this volume in the primary table are too noisy to compare
+MIN_VOLUME = {"receiving": ("Tgt", 20), "rushing": ("Att", 30), "passing": ("Att", 100)}
+
+
+def feature_names(position: str) -> List[str]:
+    return ["Age"] + [f"{table}.{stat}" for table in POSITION_TABLES[position] for stat in TABLE_FEATURES[table]]
+
+
+def season_profiles(store: PlayerStore, position: str,
+                    season_type: str = "regular") -> List[Tuple[Tuple[int, int], List[Optional[float]]]]:
+    """((player, year), raw feature values) for every qualifying season at a position"""
+    tables = POSITION_TABLES[position]
+    primary = store.tables.get(tables[0])
+    if primary is None:
+        return []
+    volume_stat, min_volume = MIN_VOLUME[tables[0]]
+    wanted = SEASON_TYPES.index(season_type)
+
+    profiles = []
+    for (player, year, season_code), row in primary.season_rows():
+        if season_code != wanted or store.positions[primary.position[row]] != position:
+            continue
+        if (primary.value(volume_stat, row) or 0) < min_volume:
+            continue
+        values: List[Optional[float]] = [primary.value("Age", row)]
+        for name in tables:
+            table = store.tables.get(name)
+            line = table.row_index(player, year, season_type) if table is not None else None
+            games = (table.value("G", line) or 0) if line is not None else 0
+            for stat in TABLE_FEATURES[name]:
+                value = table.value(stat, line) if line is not None and stat in table.numeric else None
+                if value is not None and stat in PER_GAME:
+                    value = value / games if games else None
+                values.append(value)
+        profiles.append(((player, year), values))
+    return profiles
+
+
+class CompsIndex:
+    """
+    One position group's standardized feature matrix
+    Stored column-major (one array per feature) with squared row norms, so the distance from a
+    query to every season is |q|^2 + |x|^2 - 2 q.x with q.x accumulated a feature at a time
+    """
+
+    def __init__(self, position: str, keys: List[Tuple[int, int]], features: List[str],
+                 means: List[float], sds: List[float], columns: List[array]):
+        self.position = position
+        self.keys = keys
+        self.features = features
+        self.means = means
+        self.sds = sds
+        self.columns = columns
+        self.norms = array("d", [0.0]) * len(keys)
+        for column in columns:
+            self.norms = array("d", map(lambda norm, value: norm + value * value, self.norms, column))
+        self._rows = {key: i for i, key in enumerate(keys)}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @classmethod
+    def build(cls, store: PlayerStore, position: str, season_type: str = "regular") -> "CompsIndex":
+        """Standardize every qualifying season; a missing stat takes the group mean (z = 0)"""
+        profiles = season_profiles(store, position, season_type)
+        features = feature_names(position)
+        means, sds, columns = [], [], []
+        for f in range(len(features)):
+            values = [raw[f] for _, raw in profiles if raw[f] is not None]
+            mean = sum(values) / len(values) if values else 0.0
+            variance = sum((value - mean) ** 2 for value in values) / len(values) if values else 0.0
+            sd = math.sqrt(variance) or 1.0
+            means.append(mean)
+            sds.append(sd)
+            columns.append(array("d", (0.0 if raw[f] is None else (raw[f] - mean) / sd for _, raw in profiles)))
+        return cls(position, [key for key, _ in profiles], features, means, sds, columns)
+
+    def row(self, player: int, year: int) -> Optional[int]:
+        return self._rows.get((player, year))
+
+    def vector(self, row: int) -> List[float]:
+        return [column[row] for column in self.columns]
+
+    def standardize(self, raw: Dict[str, Optional[float]]) -> List[float]:
+        """Query vector for an arbitrary stat profile keyed like `features`"""
+        return [0.0 if raw.get(name) is None else (raw[name] - mean) / sd
+                for name, mean, sd in zip(self.features, self.means, self.sds)]
+
+    def distances(self, query: List[float]) -> array:
+        """Squared distance from the query to every season (one multiply-add pass per feature)"""
+        n = len(self.keys)
+        dots = array("d", [0.0]) * n
+        for weight, column in zip(query, self.columns):
+            if weight:
+                dots = array("d", map(operator.add, dots, map(operator.mul, column, repeat(weight, n))))
+        query_norm = sum(value * value for value in query)
+        return array("d", map(lambda norm, dot: max(query_norm + norm - 2.0 * dot, 0.0), self.norms, dots))
+
+    def nearest(self, query: List[float], k: int = DEFAULT_K,
+                exclude_player: Optional[int] = None) -> List[Tuple[int, float]]:
+        """(row, distance) of the k closest seasons, skipping every season of exclude_player"""
+        distances = self.distances(query)
+        rows = range(len(self.keys))
+        if exclude_player is not None:
+            rows = [i for i in rows if self.keys[i][0] != exclude_player]
+        best = heapq.nsmallest(k, rows, key=distances.__getitem__)
+        return [(i, math.sqrt(distances[i])) for i in best]
+
+    def comps(self, player: int, year: int, k: int = DEFAULT_K) -> List[Tuple[int, float]]:
+        """Closest seasons by other players to one player-season"""
+        row = self.row(player, year)
+        if row is None:
+            return []
+        return self.nearest(self.vector(row), k, exclude_player=player)
+
+    def batch_comps(self, rows: Optional[List[int]] = None, k: int = DEFAULT_K) -> Dict[int, List[Tuple[int, float]]]:
+        """
+        Comps for many seasons at once (default: the whole group)
+        Queries share the column-major matrix, so each costs len(features) vector passes
+        rather than a Python loop over every pair
+        """
+        rows = range(len(self.keys)) if rows is None else rows
+        return {row: self.nearest(self.vector(row), k, exclude_player=self.keys[row][0]) for row in rows}
+
+
+def build_indexes(store: PlayerStore, season_type: str = "regular") -> Dict[str, CompsIndex]:
+    return {position: CompsIndex.build(store, position, season_type) for position in POSITION_TABLES}
+
+
+def describe(store: PlayerStore, index: CompsIndex, row: int, distance: Optional[float] = None) -> Dict[str, Any]:
+    player, year = index.keys[row]
+    entry = {"player": store.player_names[player], "code": store.player_codes[player], "year": year}
+    if distance is not None:
+        entry["distance"] = round(distance, 3)
+    return entry
+
+
+def write_group_comps(store: PlayerStore, indexes: Dict[str, CompsIndex], year: Optional[int] = None,
+                      k: int = DEFAULT_K, output_dir: Path = COMPS_DIR) -> Dict[str, int]:
+    """Batch comps for every season (or every `year` season) per position group, one JSON per group"""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    counts = {}
+    for position, index in indexes.items():
+        rows = [i for i, (_, season) in enumerate(index.keys) if year is None or season == year]
+        results = index.batch_comps(rows, k)
+        document = {
+            "position": position,
+            "features": index.features,
+            "seasons": [{**describe(store, index, row),
+                         "comps": [describe(store, index, comp, distance) for comp, distance in comps]}
+                        for row, comps in results.items()],
+        }
+        with open(output_dir / f"{position}.json", "w", encoding="utf-8") as f:
+            json.dump(document, f, separators=(",", ":"), ensure_ascii=False)
+        counts[position] = len(rows)
+    return counts
+
+
+def main():
+    """Print comps for one player-season, or write batch comps for every position group"""
+    parser = argparse.ArgumentParser(description="Nearest historical player-seasons by stat profile")
+    parser.add_argument("player", nargs="?", help="player name, e.g. \"Puka Nacua\"")
+    parser.add_argument("--year", type=int, default=None, help="season to compare (default: latest)")
+    parser.add_argument("--k", type=int, default=DEFAULT_K)
+    parser.add_argument("--all", action="store_true", help=f"write comps for every group to {COMPS_DIR.name}/")
+    args = parser.parse_args()
+
+    print("Player Comparables")
+    print("=" * 50)
+
+    start = time.perf_counter()
+    store = load_store()
+    indexes = build_indexes(store)
+    print(f"  ✅ {', '.join(f'{position} {len(index)}' for position, index in indexes.items())} seasons "
+          f"indexed in {time.perf_counter() - start:.2f}s")
+
+    if args.all or not args.player:
+        start = time.perf_counter()
+        counts = write_group_comps(store, indexes, args.year, args.k)
+        print(f"  ✅ Comps for {sum(counts.values())} seasons in {time.perf_counter() - start:.2f}s")
+        print(f"  📄 {COMPS_DIR.relative_to(PROJECT_ROOT)}/")
+        if not args.player:
+            return
+
+    for position, index in indexes.items():
+        seasons = [(year, player) for player, year in index.keys
+                   if store.player_names[player] == args.player and (args.year is None or year == args.year)]
+        if not seasons:
+            continue
+        year, player = max(seasons)
+        print(f"\n{args.player} {year} ({position}) comps:")
+        for rank, (row, distance) in enumerate(index.comps(player, year, args.k), 1):
+            entry = describe(store, index, row, distance)
+            print(f"  {rank}. {entry['player']:<25} {entry['year']}  distance {entry['distance']:.2f}")
+        return
+
+    print(f"  ⚠️  No qualifying season for {args.player}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Draft Board
+Value over replacement (VORP) from the FantasyPros totals pool plus PFR quarterbacks and
+tight ends, updated pick by pick through a sorted availability index per position instead
+of a full recompute
+"""
+
+import argparse
+import bisect
+import heapq
+import itertools
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+
+from name_resolver import normalize_name
+from player_store import SEASON_TYPES, PlayerStore, load_store
+from scoring import FANTASY_PROS_STATS, SCORING_PROFILES, score_seasons
+
+DEFAULT_TEAMS = 12
+DEFAULT_YEAR = 2024
+
+# Starting lineup per team; FLEX takes any of FLEX_POSITIONS
+ROSTER_SLOTS = {"QB": 1, "RB": 2, "WR": 3, "TE": 1, "FLEX": 1}
+FLEX_POSITIONS = ("RB", "WR", "TE")
+
+# FantasyPros totals only cover WR and RB; the QB and TE slots draw from these PFR tables
+PFR_POSITION_TABLES = {"QB": "passing", "TE": "receiving"}
+
+
+def fantasy_pros_pool(store: PlayerStore, year: int = DEFAULT_YEAR,
+                      profile: str = "half_ppr") -> List[Dict[str, Any]]:
+    """
+    One record per FantasyPros totals player, plus every PFR QB and TE: {name, team, position, points}
+    Points are the player's PFR season under the profile (TDs included) when the name
+    resolved onto a PFR player, otherwise the yards and receptions FantasyPros carries
+    """
+    tables = store.fantasy_pros_tables("Totals")
+    if not tables:
+        return []
+    scored = score_seasons(store, {profile: SCORING_PROFILES[profile]})
+    weights = SCORING_PROFILES[profile]
+
+    pool = []
+    for table in tables:
+        for (player, row_year, _), row in table.season_rows():
+            if row_year != year:
+                continue
+            position = store.positions[table.position[row]]
+            scored_row = scored.row_index(player, year)
+            if scored_row is not None:
+                points = scored.points[profile][scored_row]
+            else:
+                points = sum(weights.get(stat, 0.0) * (table.value(column, row) or 0.0)
+                             for stat, column in FANTASY_PROS_STATS.get(position, {}).items())
+            pool.append({
+                "name": store.player_names[player],
+                "team": store.teams[table.team[row]],
+                "position": position,
+                "points": round(points, 2),
+            })
+
+    regular = SEASON_TYPES.index("regular")
+    for position, table_name in PFR_POSITION_TABLES.items():
+        table = store.tables.get(table_name)
+        if table is None:
+            continue
+        for (player, row_year, season_code), row in table.season_rows():
+            if row_year != year or season_code != regular or store.positions[table.position[row]] != position:
+                continue
+            scored_row = scored.row_index(player, year)
+            pool.append({
+                "name": store.player_names[player],
+                "team": store.teams[table.team[row]],
+                "position": position,
+                "points": round(scored.points[profile][scored_row], 2) if scored_row is not None else 0.0,
+            })
+    return pool
+
+
+def projection_pool(path: Path, profile: str = "half_ppr", stat: str = "median") -> List[Dict[str, Any]]:
+    """Player records valued by a projections.json season summary (see projections.py)"""
+    with open(path, "r", encoding="utf-8") as f:
+        players = json.load(f)["players"]
+    return [
+        {"name": player["name"], "team": None, "position": player["position"],
+         "points": player["season"][profile][stat]}
+        for player in players if profile in player["season"]
+    ]
+
+
+def starter_demand(available: Dict[str, List[Tuple[float, int]]], teams: int,
+                   slots: Dict[str, int]) -> Dict[str, int]:
+    """
+    League-wide starters still to be drafted per position
+    FLEX slots go one at a time to whichever eligible position has the best next player
+    """
+    demand = {position: teams * slots.get(position, 0) for position in available}
+    flex_positions = [position for position in FLEX_POSITIONS if position in available]
+    for _ in range(teams * slots.get("FLEX", 0) if flex_positions else 0):
+        best = max(flex_positions, key=lambda position: (
+            -available[position][demand[position]][0] if demand[position] < len(available[position])
+            else float("-inf")))
+        demand[best] += 1
+    return demand
+
+
+class DraftBoard:
+    """
+    Live draft state over a player pool
+    Each position keeps its available players sorted by (-points, index), so a pick is a
+    bisect plus one list delete, and the replacement level is a single index read
+    """
+
+    def __init__(self, players: List[Dict[str, Any]], teams: int = DEFAULT_TEAMS,
+                 slots: Optional[Dict[str, int]] = None):
+        self.players = players
+        self.teams = teams
+        self.slots = dict(slots or ROSTER_SLOTS)
+        self.available: Dict[str, List[Tuple[float, int]]] = {}
+        for index, player in enumerate(players):
+            self.available.setdefault(player["position"], []).append((-player["points"], index))
+        for entries in self.available.values():
+            entries.sort()
+
+        self.demand = starter_demand(self.available, teams, self.slots)
+        self.needs = [{slot: count for slot, count in self.slots.items()} for _ in range(teams)]
+        self.rosters: List[List[int]] = [[] for _ in range(teams)]
+        self.picks: List[Tuple[int, int, Optional[str], bool]] = []
+        self.taken: set = set()
+        self.replacement = {position: self._replacement(position) for position in self.available}
+        self._names: Dict[str, List[int]] = {}
+        for index, player in enumerate(players):
+            self._names.setdefault(normalize_name(player["name"]), []).append(index)
+
+    def _replacement(self, position: str) -> float:
+        """Points of the best player left once every remaining starter slot is filled"""
+        entries = self.available[position]
+        if not entries:
+            return 0.0
+        return -entries[min(self.demand[position], len(entries) - 1)][0]
+
+    def vorp(self, index: int) -> float:
+        player = self.players[index]
+        return round(player["points"] - self.replacement[player["position"]], 2)
+
+    def on_the_clock(self) -> int:
+        """Team index making the next pick in snake order"""
+        pick = len(self.picks)
+        draft_round, slot = divmod(pick, self.teams)
+        return slot if draft_round % 2 == 0 else self.teams - 1 - slot
+
+    def find(self, name: str) -> List[int]:
+        """Available players matching a name (exact normalized match, else substring)"""
+        key = normalize_name(name)
+        matches = self._names.get(key)
+        if not matches:
+            matches = [index for names_key, indices in self._names.items() if key in names_key
+                       for index in indices]
+        return [index for index in matches if index not in self.taken]
+
+    def _fill_slot(self, team: int, position: str) -> Optional[str]:
+        """Starting slot a pick fills on the team's roster (None for a bench pick)"""
+        needs = self.needs[team]
+        if needs.get(position, 0) > 0:
+            return position
+        if position in FLEX_POSITIONS and needs.get("FLEX", 0) > 0:
+            return "FLEX"
+        return None
+
+    def draft(self, index: int, team: Optional[int] = None) -> Dict[str, Any]:
+        """Take a player off the board; only starter picks lower the league's remaining demand"""
+        if index in self.taken:
+            raise ValueError(f"{self.players[index]['name']} was already drafted")
+        team = self.on_the_clock() if team is None else team
+        player = self.players[index]
+        position = player["position"]
+
+        entries = self.available[position]
+        del entries[bisect.bisect_left(entries, (-player["points"], index))]
+        self.taken.add(index)
+
+        slot = self._fill_slot(team, position)
+        counted = False
+        if slot is not None:
+            self.needs[team][slot] -= 1
+            if self.demand[position] > 0:
+                self.demand[position] -= 1
+                counted = True
+        self.replacement[position] = self._replacement(position)
+
+        self.rosters[team].append(index)
+        self.picks.append((index, team, slot, counted))
+        return {**player, "pick": len(self.picks), "owner": team, "slot": slot}
+
+    def undo(self) -> Optional[Dict[str, Any]]:
+        """Put the most recent pick back on the board"""
+        if not self.picks:
+            return None
+        index, team, slot, counted = self.picks.pop()
+        player = self.players[index]
+        position = player["position"]
+
+        bisect.insort(self.available[position], (-player["points"], index))
+        self.taken.discard(index)
+        self.rosters[team].pop()
+        if slot is not None:
+            self.needs[team][slot] += 1
+        if counted:
+            self.demand[position] += 1
+        self.replacement[position] = self._replacement(position)
+        return player
+
+    def _ranked(self, position: str) -> Iterator[Tuple[float, int]]:
+        replacement = self.replacement[position]
+        return ((negative + replacement, index) for negative, index in self.available[position])
+
+    def best_available(self, limit: int = 10, positions: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Top remaining players by VORP, merged lazily across the per-position orders"""
+        positions = [position for position in positions or self.available if position in self.available]
+        merged = heapq.merge(*(self._ranked(position) for position in positions))
+        return [{**self.players[index], "vorp": round(-negative, 2)}
+                for negative, index in itertools.islice(merged, limit)]
+
+    def recommend(self, team: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Best VORP among positions the team still needs to start, else the best overall"""
+        team = self.on_the_clock() if team is None else team
+        needed = [position for position in self.available if self._fill_slot(team, position)]
+        best = self.best_available(1, needed) or self.best_available(1)
+        return best[0] if best else None
+
+    def scarcity(self) -> Dict[str, Dict[str, Any]]:
+        """Per position: starters left to draft, replacement points, top VORP and the drop to the next player"""
+        result = {}
+        for position, entries in self.available.items():
+            top = -entries[0][0] if entries else 0.0
+            following = -entries[1][0] if len(entries) > 1 else self.replacement[position]
+            result[position] = {
+                "demand": self.demand[position],
+                "available": len(entries),
+                "replacement": round(self.replacement[position], 2),
+                "topVorp": round(top - self.replacement[position], 2) if entries else 0.0,
+                "dropoff": round(top - following, 2),
+            }
+        return result
+
+
+def print_board(board: DraftBoard, limit: int = 10, positions: Optional[List[str]] = None):
+    for rank, player in enumerate(board.best_available(limit, positions), 1):
+        print(f"  {rank:2d}. {player['name']:<25} {player['position']:<3} "
+              f"{player['points']:7.1f}  VORP {player['vorp']:6.1f}")
+    print("  " + "  ".join(f"{position} need {info['demand']} / repl {info['replacement']:.1f}"
+                           for position, info in sorted(board.scarcity().items())))
+
+
+def main():
+    """
+    Interactive draft: type a player name to draft them for the team on the clock
+    Commands: top [N] [POS], undo, quit
+    """
+    parser = argparse.ArgumentParser(description="Draft board with incremental VORP")
+    parser.add_argument("--year", type=int, default=DEFAULT_YEAR, help="FantasyPros totals season")
+    parser.add_argument("--profile", default="half_ppr", choices=list(SCORING_PROFILES))
+    parser.add_argument("--teams", type=int, default=DEFAULT_TEAMS)
+    parser.add_argument("--projections", type=Path, default=None,
+                        help="value players by a projections.json median instead of FantasyPros totals")
+    args = parser.parse_args()
+
+    print("Draft Board")
+    print("=" * 50)
+
+    if args.projections:
+        pool = projection_pool(args.projections, args.profile)
+    else:
+        pool = fantasy_pros_pool(load_store(), args.year, args.profile)
+    board = DraftBoard(pool, args.teams)
+    print(f"  ✅ {len(pool)} players, {args.teams} teams, {args.profile}\n")
+    print_board(board)
+
+    for line in sys.stdin:
+        command = line.strip()
+        if not command:
+            continue
+        words = command.split()
+        if words[0] in ("quit", "exit"):
+            break
+        if words[0] == "undo":
+            player = board.undo()
+            print(f"  ↩️  Restored {player['name']}" if player else "  Nothing to undo")
+        elif words[0] == "top":
+            limit = next((int(word) for word in words[1:] if word.isdigit()), 10)
+            positions = [word.upper() for word in words[1:] if not word.isdigit()] or None
+            print_board(board, limit, positions)
+            continue
+        else:
+            matches = board.find(command)
+            if len(matches) != 1:
+                names = ", ".join(board.players[index]["name"] for index in matches[:5])
+                print(f"  ⚠️  {len(matches)} matches for '{command}'{': ' + names if names else ''}")
+                continue
+            start = time.perf_counter()
+            pick = board.draft(matches[0])
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"  #{pick['pick']} team {pick['owner'] + 1}: {pick['name']} ({pick['position']}) "
+                  f"[{elapsed:.3f} ms]")
+        recommendation = board.recommend()
+        if recommendation:
+            print(f"  👉 Team {board.on_the_clock() + 1} on the clock, suggest {recommendation['name']} "
+                  f"({recommendation['position']}, VORP {recommendation['vorp']:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+Concurrent Data Fetcher
+Pulls every FantasyPros and PFR export in parallel with connection reuse,
+per-host rate limiting, retries with backoff and conditional requests
+"""
+
+import hashlib
+import http.client
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+from urllib.parse import urlsplit, quote
+
+from ingest_data import DATA_DIR, PFR_DATA_FILES, FANTASY_PROS_DATA_FILES, find_data_file
+from instrument import span
+
+VALIDATORS_FILE = "fetch_validators.json"
+USER_AGENT = "fantasy-football-2025-fetcher/1.0"
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Statuses whose Retry-After header replaces the exponential backoff, capped at MAX_RETRY_AFTER seconds
+RETRY_AFTER_STATUSES = {429, 503}
+MAX_RETRY_AFTER = 60.0
+
+# Export mirrors serving the files under their public/data names. Neither site publishes
+# the exports under those names, so there is no default: set FANTASY_PROS_BASE_URL and
+# PFR_BASE_URL, or use --serve to fetch from a local fixture server over public/data.
+BASE_URL_ENV = {"fantasypros": "FANTASY_PROS_BASE_URL", "pfr": "PFR_BASE_URL"}
+DEFAULT_BASE_URLS = {source: os.environ.get(name) for source, name in BASE_URL_ENV.items()}
+
+
+def build_jobs(base_urls: Optional[Dict[str, str]] = None) -> List[Dict[str, str]]:
+    """One job per position x year x totals/per-game page and per PFR export"""
+    base_urls = base_urls or DEFAULT_BASE_URLS
+    missing = [BASE_URL_ENV[source] for source in BASE_URL_ENV if not base_urls.get(source)]
+    if missing:
+        raise ValueError(f"No export base URL configured; set {' and '.join(missing)}")
+    jobs = []
+    sources = [("fantasypros", spec) for spec in FANTASY_PROS_DATA_FILES]
+    sources += [("pfr", spec) for spec in PFR_DATA_FILES]
+    for source, spec in sources:
+        # Keep the on-disk spelling (e.g. WR_2024_Per_game) so refreshes overwrite in place
+        existing = find_data_file(spec["fileName"])
+        file_name = existing.name if existing else spec["fileName"]
+        base = base_urls[source].rstrip("/") + "/"
+        jobs.append({"source": source, "fileName": file_name, "url": base + quote(file_name)})
+    return jobs
+
+
+class HostRateLimiter:
+    """Spaces requests to each host at least 1/rate seconds apart"""
+
+    def __init__(self, requests_per_second: float):
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, host: str):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+def retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date), capped"""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+class Fetcher:
+    """Bounded thread pool that reuses one keep-alive connection per host per worker"""
+
+    def __init__(self, output_dir: Path = DATA_DIR, max_workers: int = 8,
+                 requests_per_second: float = 10.0, max_retries: int = 3,
+                 backoff: float = 0.5, timeout: float = 10.0):
+        self.output_dir = Path(output_dir)
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.rate_limiter = HostRateLimiter(requests_per_second)
+        self._local = threading.local()
+        # Every worker's connections, so fetch_all can close them once the pool is done
+        self._connections: List[http.client.HTTPConnection] = []
+        self._connections_lock = threading.Lock()
+        self._validators_lock = threading.Lock()
+        self.validators = self._load_validators()
+
+    def _load_validators(self) -> Dict[str, Dict[str, str]]:
+        try:
+            with open(self.output_dir / VALIDATORS_FILE, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_validators(self):
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.output_dir / VALIDATORS_FILE, "w") as f:
+            json.dump(self.validators, f, indent=2, sort_keys=True)
+
+    def _connection(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = self._local.connections = {}
+        key = (scheme, netloc)
+        if key not in connections:
+            cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            connections[key] = cls(netloc, timeout=self.timeout)
+            with self._connections_lock:
+                self._connections.append(connections[key])
+        return connections[key]
+
+    def _drop_connection(self, scheme: str, netloc: str):
+        connections = getattr(self._local, "connections", {})
+        connection = connections.pop((scheme, netloc), None)
+        if connection is not None:
+            connection.close()
+
+    def close(self):
+        """Close every keep-alive connection opened by any worker"""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+
+    def fetch(self, job: Dict[str, str]) -> Dict[str, Any]:
+        """Fetch one job, honoring validators; returns a result record"""
+        with span("fetch", file=job["fileName"]) as stage:
+            result = self._fetch(job)
+            stage.add(bytes_read=result["bytes"], bytes_written=result["bytes"])
+        return result
+
+    def _fetch(self, job: Dict[str, str]) -> Dict[str, Any]:
+        url = job["url"]
+        parts = urlsplit(url)
+        path = parts.path + (f"?{parts.query}" if parts.query else "")
+        destination = self.output_dir / job["fileName"]
+
+        headers = {"User-Agent": USER_AGENT, "Connection": "keep-alive"}
+        cached = self.validators.get(url, {})
+        if destination.exists():
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        start = time.perf_counter()
+        error = None
+        retry_after = None
+        for attempt in range(1, self.max_retries + 2):
+            self.rate_limiter.wait(parts.netloc)
+            retry_after = None
+            try:
+                connection = self._connection(parts.scheme, parts.netloc)
+                connection.request("GET", path, headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+            except (OSError, http.client.HTTPException) as e:
+                self._drop_connection(parts.scheme, parts.netloc)
+                error = str(e)
+            else:
+                if response.status == 304:
+                    return self._result(job, "not_modified", 0, attempt, start)
+                if response.status == 200:
+                    self._write(destination, body)
+                    with self._validators_lock:
+                        self.validators[url] = {
+                            "etag": response.getheader("ETag", ""),
+                            "last_modified": response.getheader("Last-Modified", ""),
+                        }
+                    return self._result(job, "fetched", len(body), attempt, start)
+                error = f"HTTP {response.status}"
+                if response.status not in RETRY_STATUSES:
+                    break
+                if response.status in RETRY_AFTER_STATUSES:
+                    retry_after = retry_after_seconds(response.getheader("Retry-After"))
+
+            if attempt <= self.max_retries:
+                time.sleep(retry_after if retry_after is not None else self.backoff * (2 ** (attempt - 1)))
+
+        return self._result(job, "failed", 0, attempt, start, error)
+
+    def _write(self, destination: Path, body: bytes):
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix=f".{destination.name}.", suffix=".tmp",
+                                         dir=destination.parent)
+        with os.fdopen(fd, "wb") as f:
+            f.write(body)
+        os.replace(temp_path, destination)
+
+    def _result(self, job: Dict[str, str], status: str, size: int, attempts: int,
+                start: float, error: Optional[str] = None) -> Dict[str, Any]:
+        return {
+            "fileName": job["fileName"],
+            "url": job["url"],
+            "status": status,
+            "bytes": size,
+            "attempts": attempts,
+            "seconds": round(time.perf_counter() - start, 4),
+            "error": error,
+        }
+
+    def fetch_all(self, jobs: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """Fetch every job concurrently, then close the pool's connections and persist the new validators"""
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                results = list(pool.map(self.fetch, jobs))
+        finally:
+            self.close()
+            self._save_validators()
+        return results
+
+
+class FixtureHandler(SimpleHTTPRequestHandler):
+    """Static handler with keep-alive, strong ETags and 304 responses"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        path = Path(self.translate_path(self.path))
+        if not path.is_file():
+            self.send_error(404, "File not found")
+            return
+
+        body = path.read_bytes()
+        etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+        last_modified = formatdate(int(path.stat().st_mtime), usegmt=True)
+
+        not_modified = self.headers.get("If-None-Match") == etag
+        if not not_modified and "If-None-Match" not in self.headers and self.headers.get("If-Modified-Since"):
+            try:
+                since = parsedate_to_datetime(self.headers["If-Modified-Since"]).timestamp()
+                not_modified = int(path.stat().st_mtime) <= since
+            except (TypeError, ValueError):
+                pass
+
+        if not_modified:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", self.guess_type(str(path)))
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", last_modified)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class FixtureServer:
+    """Local HTTP stand-in for the export sources, serving a directory on a free port"""
+
+    def __init__(self, directory: Path = DATA_DIR, port: int = 0):
+        handler = lambda *args, **kwargs: FixtureHandler(*args, directory=str(directory), **kwargs)
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def __enter__(self) -> "FixtureServer":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def summarize(results: List[Dict[str, Any]]) -> Dict[str, int]:
+    counts = {"fetched": 0, "not_modified": 0, "failed": 0}
+    for result in results:
+        counts[result["status"]] += 1
+    return counts
+
+
+def main():
+    """Fetch every dataset; --serve runs against a fixture server over public/data"""
+    print("Data Fetcher")
+    print("=" * 50)
+
+    output_dir = DATA_DIR
+    if "--serve" in sys.argv[1:]:
+        output_dir = Path(tempfile.mkdtemp(prefix="fetch-"))
+        with FixtureServer(DATA_DIR) as server:
+            jobs = build_jobs({"fantasypros": server.base_url, "pfr": server.base_url})
+            start = time.perf_counter()
+            results = Fetcher(output_dir).fetch_all(jobs)
+            elapsed = time.perf_counter() - start
+    else:
+        try:
+            jobs = build_jobs()
+        except ValueError as e:
+            print(f"  ❌ {e} (or pass --serve to fetch from a local fixture server)")
+            sys.exit(2)
+        start = time.perf_counter()
+        results = Fetcher(output_dir).fetch_all(jobs)
+        elapsed = time.perf_counter() - start
+
+    for result in results:
+        icon = {"fetched": "✅", "not_modified": "⏭️ ", "failed": "❌"}[result["status"]]
+        detail = result["error"] or f"{result['bytes'] / 1024:.1f} KB"
+        print(f"  {icon} {result['fileName']}: {result['status']} ({detail})")
+
+    counts = summarize(results)
+    print(f"\n{len(results)} requests in {elapsed:.2f}s -> {output_dir}")
+    print(f"  fetched: {counts['fetched']}, not modified: {counts['not_modified']}, failed: {counts['failed']}")
+
+    sys.exit(1 if counts["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
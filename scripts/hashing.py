@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+File Hashing
+Content hashes of files on disk, shared by the scraper manifest, rollups, the SQLite
+loader and the changelog
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+# Bytes hashed per read, so large exports are never held in memory whole
+CHUNK_SIZE = 1 << 20
+
+
+def file_hash(filepath: Union[str, Path]) -> Optional[str]:
+    """SHA-256 of a file on disk, or None if it does not exist"""
+    if not os.path.exists(filepath):
+        return None
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
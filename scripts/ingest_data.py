@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Build-time Data Ingest
+Pre-normalizes every public/data CSV into compact, typed, column-oriented JSON
+"""
+
+import csv
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+from instrument import file_size, span
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DATA_DIR = PROJECT_ROOT / "public" / "data"
+NORMALIZED_DIR = DATA_DIR / "normalized"
+
+STAT_TYPES = ["receiving", "passing", "rushing"]
+SEASON_TYPES = ["regular", "playoff"]
+YEARS = ["2024", "2023", "2022"]
+FANTASY_PROS_POSITIONS = ["WR", "RB"]
+FANTASY_PROS_KINDS = ["Totals", "Per_Game"]
+
+# Mirrors `availableDataFiles` in src/utils/dataLoader.ts
+PFR_DATA_FILES = [
+    {
+        "statType": stat_type,
+        "seasonType": season_type,
+        "year": year,
+        "fileName": f"pff-nfl-{season_type}-{stat_type}-{year}.csv",
+    }
+    for stat_type in STAT_TYPES
+    for season_type in SEASON_TYPES
+    for year in YEARS
+]
+
+FANTASY_PROS_DATA_FILES = [
+    {
+        "position": position,
+        "kind": kind,
+        "year": year,
+        "fileName": f"FantasyPros_Fantasy_Football_{position}_{year}_{kind}.csv",
+    }
+    for position in FANTASY_PROS_POSITIONS
+    for kind in FANTASY_PROS_KINDS
+    for year in YEARS
+]
+
+# PFR exports put the player code under a junk header in the last column
+PLAYER_ID_HEADERS = {"-9999", "-additional", "Player-additional"}
+SUPER_HEADER_LABELS = ("Receiving", "Passing", "Rushing")
+PLAYER_TEAM_PATTERN = re.compile(r"^(.*?)\s*\(([A-Z]{2,3})\)\s*$")
+
+
+def find_data_file(file_name: str, data_dir: Path = DATA_DIR) -> Optional[Path]:
+    """Locate a data file, tolerating case differences (e.g. Per_game vs Per_Game)"""
+    exact = data_dir / file_name
+    if exact.exists():
+        return exact
+
+    lowered = file_name.lower()
+    if data_dir.exists():
+        for candidate in data_dir.iterdir():
+            if candidate.name.lower() == lowered:
+                return candidate
+    return None
+
+
+def dedupe_headers(headers: List[str]) -> List[str]:
+    """Rename repeated headers the way PapaParse does (Yds, Yds_1, ...)"""
+    seen: Dict[str, int] = {}
+    result = []
+    for header in headers:
+        if header in seen:
+            seen[header] += 1
+            result.append(f"{header}_{seen[header]}")
+        else:
+            seen[header] = 0
+            result.append(header)
+    return result
+
+
+def parse_number(value: str) -> Optional[Any]:
+    """Convert a raw CSV cell to int/float, or None if it is not numeric"""
+    text = value.strip().replace(",", "")
+    if text.endswith("%"):
+        text = text[:-1]
+    if not text:
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def to_columns(headers: List[str], rows: List[List[str]]) -> Dict[str, Any]:
+    """Transpose raw rows into typed columns ('number' or 'string')"""
+    columns = []
+    data = {}
+
+    with span("normalize", columns=len(headers)) as stage:
+        for index, header in enumerate(headers):
+            raw = [row[index].strip() if index < len(row) else "" for row in rows]
+            parsed = [parse_number(value) for value in raw]
+            is_numeric = all(
+                number is not None or value == "" for value, number in zip(raw, parsed)
+            ) and any(value != "" for value in raw)
+
+            if is_numeric:
+                columns.append({"key": header, "type": "number"})
+                data[header] = parsed
+            else:
+                columns.append({"key": header, "type": "string"})
+                data[header] = [value if value != "" else None for value in raw]
+        stage.add(rows=len(rows))
+
+    return {"columns": columns, "data": data}
+
+
+def read_pfr_csv(path: Path) -> Tuple[List[str], List[List[str]]]:
+    """Read a PFR export, dropping the super-header, junk columns and non-player rows"""
+    with span("parse", file=Path(path).name) as stage:
+        headers, rows = _parse_pfr_csv(path)
+        stage.add(rows=len(rows), bytes_read=file_size(path))
+    return headers, rows
+
+
+def _parse_pfr_csv(path: Path) -> Tuple[List[str], List[List[str]]]:
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        lines = list(csv.reader(f))
+
+    # Skip citation line, blank lines and the "Receiving,Receiving,..." super-header
+    start = 0
+    while start < len(lines):
+        line = lines[start]
+        if "When using SR data" in ",".join(line) or not any(cell.strip() for cell in line):
+            start += 1
+        elif any(cell in SUPER_HEADER_LABELS for cell in line):
+            start += 1
+        else:
+            break
+
+    if start >= len(lines):
+        return [], []
+
+    headers = ["PlayerID" if h in PLAYER_ID_HEADERS else h for h in lines[start]]
+    headers = dedupe_headers(headers)
+
+    rk_index = headers.index("Rk")
+    player_index = headers.index("Player")
+
+    rows = []
+    for line in lines[start + 1:]:
+        if len(line) <= player_index:
+            continue
+        player = line[player_index].strip()
+        if not player or player in ("League Average", "Player"):
+            continue
+        if not line[rk_index].strip().isdigit():
+            continue
+        rows.append(line)
+
+    return headers, rows
+
+
+def read_fantasy_pros_csv(path: Path) -> Tuple[List[str], List[List[str]]]:
+    """Read a FantasyPros export, splitting "Name (TEAM)" into Player and Team"""
+    with span("parse", file=Path(path).name) as stage:
+        headers, rows = _parse_fantasy_pros_csv(path)
+        stage.add(rows=len(rows), bytes_read=file_size(path))
+    return headers, rows
+
+
+def _parse_fantasy_pros_csv(path: Path) -> Tuple[List[str], List[List[str]]]:
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        lines = [line for line in csv.reader(f) if any(cell.strip() for cell in line)]
+
+    if not lines:
+        return [], []
+
+    headers = dedupe_headers(lines[0])
+    player_index = headers.index("Player")
+    headers = headers[:player_index + 1] + ["Team"] + headers[player_index + 1:]
+
+    rows = []
+    for line in lines[1:]:
+        if len(line) <= player_index or not line[0].strip().isdigit():
+            continue
+        name, team = split_player_team(line[player_index])
+        rows.append(line[:player_index] + [name, team] + line[player_index + 1:])
+
+    return headers, rows
+
+
+def split_player_team(value: str) -> Tuple[str, str]:
+    """Split "Saquon Barkley (PHI)" into ("Saquon Barkley", "PHI")"""
+    match = PLAYER_TEAM_PATTERN.match(value.strip())
+    if match:
+        return match.group(1), match.group(2)
+    return value.strip(), ""
+
+
+def normalize_pfr_file(spec: Dict[str, str], data_dir: Path = DATA_DIR) -> Optional[Dict[str, Any]]:
+    """Normalize a single PFR dataset into a columnar payload"""
+    path = find_data_file(spec["fileName"], data_dir)
+    if path is None:
+        return None
+
+    headers, rows = read_pfr_csv(path)
+    payload = {
+        "source": spec["fileName"],
+        "statType": spec["statType"],
+        "seasonType": spec["seasonType"],
+        "year": spec["year"],
+        "rowCount": len(rows),
+    }
+    payload.update(to_columns(headers, rows))
+    return payload
+
+
+def normalize_fantasy_pros_file(spec: Dict[str, str], data_dir: Path = DATA_DIR) -> Optional[Dict[str, Any]]:
+    """Normalize a single FantasyPros dataset into a columnar payload"""
+    path = find_data_file(spec["fileName"], data_dir)
+    if path is None:
+        return None
+
+    headers, rows = read_fantasy_pros_csv(path)
+    payload = {
+        "source": spec["fileName"],
+        "position": spec["position"],
+        "kind": spec["kind"],
+        "year": spec["year"],
+        "rowCount": len(rows),
+    }
+    payload.update(to_columns(headers, rows))
+    return payload
+
+
+def normalized_name(file_name: str) -> str:
+    """Output file name for a source CSV (same stem, .json extension)"""
+    return os.path.splitext(file_name)[0] + ".json"
+
+
+def write_payload(payload: Dict[str, Any], output_dir: Path = NORMALIZED_DIR) -> Path:
+    """Write a payload as compact JSON"""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / normalized_name(payload["source"])
+    with span("write", file=path.name) as stage:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, separators=(",", ":"), ensure_ascii=False)
+        stage.add(rows=payload.get("rowCount", 0), bytes_written=file_size(path))
+    return path
+
+
+def ingest_all(data_dir: Path = DATA_DIR, output_dir: Path = NORMALIZED_DIR) -> List[Dict[str, Any]]:
+    """Normalize every known dataset and write an index of what was produced"""
+    index = []
+
+    jobs = [(spec, normalize_pfr_file) for spec in PFR_DATA_FILES]
+    jobs += [(spec, normalize_fantasy_pros_file) for spec in FANTASY_PROS_DATA_FILES]
+
+    for spec, normalize in jobs:
+        payload = normalize(spec, data_dir)
+        if payload is None:
+            print(f"  ⚠️  Missing {spec['fileName']}")
+            continue
+
+        path = write_payload(payload, output_dir)
+        size_kb = os.path.getsize(path) / 1024
+        print(f"  ✅ {path.name}: {payload['rowCount']} rows, {size_kb:.1f} KB")
+
+        entry = {key: value for key, value in payload.items() if key not in ("columns", "data")}
+        entry["file"] = path.name
+        index.append(entry)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    with open(output_dir / "index.json", "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2)
+
+    return index
+
+
+def main():
+    """Normalize all CSVs in public/data"""
+    print("Data Ingest")
+    print("=" * 50)
+
+    index = ingest_all()
+
+    print(f"\nNormalized {len(index)} datasets into {NORMALIZED_DIR.relative_to(PROJECT_ROOT)}/")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Pipeline Instrumentation
+Spans for pipeline stages (fetch, parse, normalize, score, write, compress) recording
+duration, rows, bytes read/written and memory delta, exported as a Chrome trace
+"""
+
+import argparse
+import atexit
+import cProfile
+import functools
+import io
+import json
+import os
+import pstats
+import runpy
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Optional
+
+# Set to a file path to trace any script run (the trace is written at exit)
+TRACE_ENV = "PIPELINE_TRACE"
+# Set to a file path to also capture a cProfile of the run
+PROFILE_ENV = "PIPELINE_PROFILE"
+# Set to 1 to measure memory with tracemalloc (exact Python allocations, but slower)
+MEMORY_ENV = "PIPELINE_TRACE_MEMORY"
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def current_memory() -> int:
+    """Bytes in use: tracemalloc's count when it is on, else resident set size (0 if unknown)"""
+    if tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[0]
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def file_size(path: Any) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+class Span:
+    """One timed stage; callers add the rows and bytes it handled"""
+
+    __slots__ = ("name", "category", "args", "rows", "bytes_read", "bytes_written",
+                 "start", "duration", "memory_delta", "thread")
+
+    def __init__(self, name: str, category: str, args: Dict[str, Any]):
+        self.name = name
+        self.category = category
+        self.args = args
+        self.rows = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.start = 0.0
+        self.duration = 0.0
+        self.memory_delta = 0
+        self.thread = threading.get_ident()
+
+    def add(self, rows: int = 0, bytes_read: int = 0, bytes_written: int = 0):
+        self.rows += rows
+        self.bytes_read += bytes_read
+        self.bytes_written += bytes_written
+
+
+class _NullSpan:
+    """Stand-in while tracing is off, so instrumented code costs one attribute check"""
+
+    def add(self, rows: int = 0, bytes_read: int = 0, bytes_written: int = 0):
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """Collects spans from every thread of the process"""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.spans: List[Span] = []
+        self.origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, category: str = "pipeline", **args):
+        if not self.enabled:
+            yield NULL_SPAN
+            return
+        span = Span(name, category, args)
+        memory = current_memory()
+        span.start = time.perf_counter()
+        try:
+            yield span
+        finally:
+            span.duration = time.perf_counter() - span.start
+            span.memory_delta = current_memory() - memory
+            with self._lock:
+                self.spans.append(span)
+
+    def reset(self):
+        with self._lock:
+            self.spans = []
+        self.origin = time.perf_counter()
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Trace Event Format document (open in chrome://tracing or ui.perfetto.dev)"""
+        threads: Dict[int, int] = {}
+        events = []
+        for span in sorted(self.spans, key=lambda span: span.start):
+            tid = threads.setdefault(span.thread, len(threads))
+            events.append({
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": round((span.start - self.origin) * 1e6, 1),
+                "dur": round(span.duration * 1e6, 1),
+                "pid": os.getpid(),
+                "tid": tid,
+                "args": {**span.args, "rows": span.rows, "bytesRead": span.bytes_read,
+                         "bytesWritten": span.bytes_written, "memoryDelta": span.memory_delta},
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: Path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f, default=str)
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Totals per span name, slowest first"""
+        totals: Dict[str, Dict[str, Any]] = {}
+        for span in self.spans:
+            entry = totals.setdefault(span.name, {"name": span.name, "count": 0, "seconds": 0.0, "rows": 0,
+                                                  "bytesRead": 0, "bytesWritten": 0, "memoryDelta": 0})
+            entry["count"] += 1
+            entry["seconds"] += span.duration
+            entry["rows"] += span.rows
+            entry["bytesRead"] += span.bytes_read
+            entry["bytesWritten"] += span.bytes_written
+            entry["memoryDelta"] += span.memory_delta
+        return sorted(totals.values(), key=lambda entry: -entry["seconds"])
+
+    def print_summary(self):
+        print(f"\n{'stage':<12} {'calls':>6} {'ms':>10} {'rows':>9} {'read KB':>9} {'written KB':>11} {'mem KB':>8}")
+        for entry in self.summary():
+            print(f"{entry['name']:<12} {entry['count']:>6} {entry['seconds'] * 1000:>10.1f} {entry['rows']:>9} "
+                  f"{entry['bytesRead'] / 1024:>9.1f} {entry['bytesWritten'] / 1024:>11.1f} "
+                  f"{entry['memoryDelta'] / 1024:>8.1f}")
+
+
+TRACER = Tracer(enabled=bool(os.environ.get(TRACE_ENV)))
+
+
+def span(name: str, category: str = "pipeline", **args):
+    """Time a block on the process tracer: `with span("parse", file=name) as s: s.add(rows=n)`"""
+    return TRACER.span(name, category, **args)
+
+
+def traced(name: Optional[str] = None, category: str = "pipeline") -> Callable:
+    """Decorator form of span() for whole functions"""
+    def decorate(func: Callable) -> Callable:
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not TRACER.enabled:
+                return func(*args, **kwargs)
+            with TRACER.span(label, category):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+@contextmanager
+def profiled(path: Optional[Path] = None, top: int = 15):
+    """cProfile the block; dumps pstats to `path` (if given) and prints the top cumulative entries"""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        if path:
+            profiler.dump_stats(str(path))
+        output = io.StringIO()
+        pstats.Stats(profiler, stream=output).sort_stats("cumulative").print_stats(top)
+        print(output.getvalue())
+
+
+def _write_on_exit(path: str):
+    TRACER.write_chrome_trace(Path(path))
+    TRACER.print_summary()
+
+
+def _dump_profile(profiler: cProfile.Profile, path: str):
+    profiler.disable()
+    profiler.dump_stats(path)
+
+
+def _enable_from_env():
+    """Trace or profile any script run with the environment variables set, without touching its code"""
+    if os.environ.get(MEMORY_ENV) and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    if TRACER.enabled:
+        atexit.register(_write_on_exit, os.environ[TRACE_ENV])
+    if os.environ.get(PROFILE_ENV):
+        profiler = cProfile.Profile()
+        profiler.enable()
+        atexit.register(_dump_profile, profiler, os.environ[PROFILE_ENV])
+
+
+_enable_from_env()
+
+
+def main():
+    """
+    Run a pipeline script under the tracer, e.g.
+    python3 scripts/instrument.py --trace trace.json --profile run.prof scripts/ingest_data.py
+    """
+    parser = argparse.ArgumentParser(description="Trace and profile a pipeline script")
+    parser.add_argument("--trace", type=Path, default=Path("trace.json"), help="Chrome trace output")
+    parser.add_argument("--profile", type=Path, default=None, help="also capture cProfile stats here")
+    parser.add_argument("--memory", action="store_true", help="measure memory with tracemalloc")
+    parser.add_argument("script", type=Path)
+    parser.add_argument("args", nargs=argparse.REMAINDER)
+    args = parser.parse_args()
+
+    if args.memory:
+        tracemalloc.start()
+    TRACER.enabled = True
+    TRACER.reset()
+    sys.argv = [str(args.script)] + args.args
+    sys.path.insert(0, str(args.script.resolve().parent))
+
+    # Scripts import this module by name; share one tracer with them
+    sys.modules.setdefault("instrument", sys.modules[__name__])
+
+    try:
+        if args.profile:
+            with profiled(args.profile):
+                runpy.run_path(str(args.script), run_name="__main__")
+        else:
+            runpy.run_path(str(args.script), run_name="__main__")
+    except SystemExit:
+        pass
+    finally:
+        TRACER.write_chrome_trace(args.trace)
+        print("\nPipeline Trace")
+        print("=" * 50)
+        TRACER.print_summary()
+        print(f"\n  📄 {args.trace} ({len(TRACER.spans)} spans)")
+
+
+if __name__ == "__main__":
+    main()
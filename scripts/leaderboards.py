@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Precomputed Leaderboards
+Writes descending and ascending row permutations and a top-N leader slice for every
+numeric table column of every PFR dataset, so sorting and leader lookups need no client-side sort
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+from ingest_data import DATA_DIR, PFR_DATA_FILES, PROJECT_ROOT, normalize_pfr_file
+
+LEADERBOARD_DIR = DATA_DIR / "leaderboards"
+TOP_N = 25
+
+# Mirrors the numeric columns of `getColumnsByStatType` in src/utils/dataLoader.ts
+STAT_COLUMNS: Dict[str, List[str]] = {
+    "receiving": ["Rk", "Age", "G", "Tgt", "Rec", "Yds", "Y/R", "TD", "1D", "Ctch%", "Y/G", "Y/Tgt"],
+    "passing": ["Rk", "Age", "G", "GS", "Cmp", "Att", "Cmp%", "Yds", "TD", "Int", "Y/A", "Y/G", "Rate", "QBR"],
+    "rushing": ["Rk", "Age", "G", "Att", "Yds", "TD", "1D", "Lng", "Y/A", "Y/G", "Fmb"],
+}
+
+
+def argsort_desc(values: List[Optional[float]]) -> List[int]:
+    """
+    Row indices ordered by value, largest first, missing values last
+    Ties keep file order, matching a stable client-side sort
+    """
+    present = [row for row, value in enumerate(values) if value is not None]
+    present.sort(key=values.__getitem__, reverse=True)
+    missing = [row for row, value in enumerate(values) if value is None]
+    return present + missing
+
+
+def argsort_asc(values: List[Optional[float]]) -> List[int]:
+    """
+    Row indices ordered by value, smallest first, missing values last
+    Sorted separately rather than reversing argsort_desc so ties still keep file order
+    """
+    present = [row for row, value in enumerate(values) if value is not None]
+    present.sort(key=values.__getitem__)
+    missing = [row for row, value in enumerate(values) if value is None]
+    return present + missing
+
+
+def top_rows(order: List[int], count: int, player_ids: List[Optional[str]], limit: int = TOP_N) -> List[int]:
+    """
+    First `limit` rows of a descending order, one per player
+    Multi-team players keep their combined 2TM/3TM line and drop the per-team splits
+    """
+    seen = set()
+    rows = []
+    for row in order[:count]:
+        player_id = player_ids[row]
+        if player_id is not None:
+            if player_id in seen:
+                continue
+            seen.add(player_id)
+        rows.append(row)
+        if len(rows) == limit:
+            break
+    return rows
+
+
+def build_leaderboard(payload: Dict[str, Any], limit: int = TOP_N) -> Dict[str, Any]:
+    """Sorted permutations plus top-N leaders for each numeric table column of a payload"""
+    data = payload["data"]
+    numeric = {column["key"] for column in payload["columns"] if column["type"] == "number"}
+    players = data.get("Player", [None] * payload["rowCount"])
+    teams = data.get("Team", [None] * payload["rowCount"])
+    player_ids = data.get("PlayerID", [None] * payload["rowCount"])
+
+    columns = {}
+    for key in STAT_COLUMNS[payload["statType"]]:
+        if key not in numeric:
+            continue
+        values = data[key]
+        order = argsort_desc(values)
+        count = sum(1 for value in values if value is not None)
+        columns[key] = {
+            "count": count,
+            "order": order,
+            "ascending": argsort_asc(values),
+            "top": [
+                {"row": row, "Player": players[row], "Team": teams[row], "PlayerID": player_ids[row],
+                 "value": values[row]}
+                for row in top_rows(order, count, player_ids, limit)
+            ],
+        }
+
+    return {
+        "source": payload["source"],
+        "statType": payload["statType"],
+        "seasonType": payload["seasonType"],
+        "year": payload["year"],
+        "rowCount": payload["rowCount"],
+        "columns": columns,
+    }
+
+
+def leaderboard_name(file_name: str) -> str:
+    """Sidecar file name for a source CSV"""
+    return os.path.splitext(file_name)[0] + ".json"
+
+
+def build_all(data_dir: Path = DATA_DIR, output_dir: Path = LEADERBOARD_DIR,
+              limit: int = TOP_N) -> List[Dict[str, Any]]:
+    """Write a leaderboard sidecar for every PFR dataset plus an index of them"""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    index = []
+
+    for spec in PFR_DATA_FILES:
+        payload = normalize_pfr_file(spec, data_dir)
+        if payload is None:
+            print(f"  ⚠️  Missing {spec['fileName']}")
+            continue
+
+        leaderboard = build_leaderboard(payload, limit)
+        path = output_dir / leaderboard_name(spec["fileName"])
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(leaderboard, f, separators=(",", ":"), ensure_ascii=False)
+        print(f"  ✅ {path.name}: {len(leaderboard['columns'])} columns, "
+              f"{os.path.getsize(path) / 1024:.1f} KB")
+
+        index.append({
+            "source": spec["fileName"],
+            "file": path.name,
+            "rowCount": payload["rowCount"],
+            "columns": list(leaderboard["columns"]),
+        })
+
+    with open(output_dir / "index.json", "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2)
+
+    return index
+
+
+def main():
+    """Build leaderboard sidecars for every dataset in public/data"""
+    print("Leaderboard Index Build")
+    print("=" * 50)
+
+    index = build_all()
+
+    print(f"\nIndexed {len(index)} datasets into {LEADERBOARD_DIR.relative_to(PROJECT_ROOT)}/")
+
+
+if __name__ == "__main__":
+    main()
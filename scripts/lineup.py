@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Weekly Lineup Optimizer
+Exact start/sit for a roster under a league's slot rules, solved as a DP over slot fill
+counts, with batches of rosters spread across a process pool
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+from player_store import PlayerStore, load_store
+from projections import fit_players, profile_moments
+from scoring import SCORING_PROFILES
+
+LINEUP_SLOTS = {"QB": 1, "RB": 2, "WR": 2, "TE": 1, "FLEX": 1}
+
+# Positions each slot accepts
+SLOT_POSITIONS = {
+    "QB": {"QB"},
+    "RB": {"RB"},
+    "WR": {"WR"},
+    "TE": {"TE"},
+    "FLEX": {"RB", "WR", "TE"},
+    "SUPERFLEX": {"QB", "RB", "WR", "TE"},
+}
+
+
+def weekly_points(store: PlayerStore, profile: str = "half_ppr", year: int = 2024) -> Dict[str, Dict[str, Any]]:
+    """Projected points per game for every fitted player, keyed by PFR code"""
+    weights = {profile: SCORING_PROFILES[profile]}
+    return {
+        model["code"]: {
+            "code": model["code"],
+            "name": model["name"],
+            "position": model["position"],
+            "points": round(profile_moments(model, weights)[profile][0], 2),
+        }
+        for model in fit_players(store, year)
+    }
+
+
+def startable(players: List[Dict[str, Any]], slots: Dict[str, int]) -> Tuple[List[int], List[int]]:
+    """
+    Split roster indices into (candidates, never started)
+    A position can fill at most the slots that accept it, so anyone ranked below that many
+    teammates at their position can never start in an optimal lineup
+    """
+    limits: Dict[str, int] = {}
+    for slot, count in slots.items():
+        for position in SLOT_POSITIONS[slot]:
+            limits[position] = limits.get(position, 0) + count
+
+    order = sorted(range(len(players)), key=lambda i: (-(players[i]["points"] or 0.0), i))
+    seen: Dict[str, int] = {}
+    candidates, bench = [], []
+    for index in order:
+        position = players[index]["position"]
+        if players[index]["points"] is None or seen.get(position, 0) >= limits.get(position, 0):
+            bench.append(index)
+            continue
+        seen[position] = seen.get(position, 0) + 1
+        candidates.append(index)
+    return candidates, bench
+
+
+def optimize_lineup(players: List[Dict[str, Any]], slots: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+    """
+    Highest-scoring lineup for one roster
+    State is the fill count of every slot, packed into one integer; each candidate either sits
+    or takes an open slot that accepts their position. Exact for any slot rules (FLEX, SUPERFLEX, ...)
+    """
+    slots = slots or LINEUP_SLOTS
+    names = [slot for slot, count in slots.items() if count > 0]
+    capacity = [slots[slot] for slot in names]
+    strides = []
+    stride = 1
+    for count in capacity:
+        strides.append(stride)
+        stride *= count + 1
+
+    candidates, bench = startable(players, slots)
+
+    # best[state] = (points, previous state, slot index or -1); one layer per candidate
+    layers: List[Dict[int, Tuple[float, int, int]]] = []
+    frontier: Dict[int, float] = {0: 0.0}
+    for index in candidates:
+        player = players[index]
+        eligible = [s for s, slot in enumerate(names) if player["position"] in SLOT_POSITIONS[slot]]
+        layer: Dict[int, Tuple[float, int, int]] = {}
+        for state, total in frontier.items():
+            best = layer.get(state)
+            if best is None or total > best[0]:
+                layer[state] = (total, state, -1)
+            for s in eligible:
+                if state // strides[s] % (capacity[s] + 1) < capacity[s]:
+                    target = state + strides[s]
+                    value = total + player["points"]
+                    best = layer.get(target)
+                    if best is None or value > best[0]:
+                        layer[target] = (value, state, s)
+        layers.append(layer)
+        frontier = {state: entry[0] for state, entry in layer.items()}
+
+    state = max(frontier, key=lambda key: (frontier[key], -key)) if frontier else 0
+    total = frontier.get(state, 0.0)
+    starters = []
+    for index, layer in zip(reversed(candidates), reversed(layers)):
+        _, previous, s = layer[state]
+        if s >= 0:
+            starters.append({"slot": names[s], **players[index]})
+        else:
+            bench.append(index)
+        state = previous
+
+    order = {slot: i for i, slot in enumerate(names)}
+    starters.sort(key=lambda starter: (order[starter["slot"]], -starter["points"]))
+    return {
+        "points": round(total, 2),
+        "starters": starters,
+        "bench": [players[index] for index in sorted(bench)],
+    }
+
+
+def _solve_batch(args: Tuple[List[List[Dict[str, Any]]], Dict[str, int]]) -> List[Dict[str, Any]]:
+    rosters, slots = args
+    return [optimize_lineup(players, slots) for players in rosters]
+
+
+def optimize_rosters(rosters: List[List[Dict[str, Any]]], slots: Optional[Dict[str, int]] = None,
+                     max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Solve many rosters in one call, batched across a process pool; results keep roster order"""
+    slots = slots or LINEUP_SLOTS
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1 or len(rosters) < 2:
+        return _solve_batch((rosters, slots))
+
+    batch_size = max(1, math.ceil(len(rosters) / (max_workers * 4)))
+    batches = [(rosters[i:i + batch_size], slots) for i in range(0, len(rosters), batch_size)]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return [result for batch in pool.map(_solve_batch, batches) for result in batch]
+
+
+def roster_players(store: PlayerStore, entries: List[str], points: Dict[str, Dict[str, Any]],
+                   year: int = 2024) -> List[Dict[str, Any]]:
+    """Roster entries (PFR codes or names) to player records; unknown players project to None"""
+    players = []
+    for entry in entries:
+        code = entry if entry in points or store.player_id(entry) is not None else None
+        if code is None:
+            player_id = store.resolve_name(entry, year)
+            code = store.player_codes[player_id] if player_id is not None else None
+        if code in points:
+            players.append(points[code])
+        else:
+            players.append({"code": code, "name": entry, "position": None, "points": None})
+    return players
+
+
+def parse_slots(text: str) -> Dict[str, int]:
+    """'QB=1,RB=2,WR=3,TE=1,FLEX=2' -> slot counts"""
+    slots = {}
+    for part in text.split(","):
+        slot, _, count = part.partition("=")
+        slot = slot.strip().upper()
+        if slot not in SLOT_POSITIONS:
+            raise ValueError(f"Unknown slot {slot}; expected one of {', '.join(SLOT_POSITIONS)}")
+        slots[slot] = int(count)
+    return slots
+
+
+def main():
+    """
+    Set lineups for a JSON file of rosters: [{"team": ..., "players": [code or name, ...]}, ...]
+    Without a file, solves --demo random rosters dealt from the player pool as a benchmark
+    """
+    parser = argparse.ArgumentParser(description="Weekly lineup optimizer")
+    parser.add_argument("rosters", nargs="?", type=Path, help="JSON list of rosters")
+    parser.add_argument("--profile", default="half_ppr", choices=list(SCORING_PROFILES))
+    parser.add_argument("--slots", type=parse_slots, default=LINEUP_SLOTS, help="e.g. QB=1,RB=2,WR=3,TE=1,FLEX=1")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--demo", type=int, default=500, help="random rosters to solve without a file")
+    parser.add_argument("--output", type=Path, default=None, help="write lineups as JSON")
+    args = parser.parse_args()
+
+    print("Weekly Lineup Optimizer")
+    print("=" * 50)
+
+    store = load_store()
+    points = weekly_points(store, args.profile)
+
+    if args.rosters:
+        with open(args.rosters, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+        teams = [entry.get("team", f"Team {i + 1}") for i, entry in enumerate(entries)]
+        rosters = [roster_players(store, entry["players"], points) for entry in entries]
+    else:
+        rng = random.Random(2025)
+        pool = list(points.values())
+        teams = [f"Demo {i + 1}" for i in range(args.demo)]
+        rosters = [rng.sample(pool, 16) for _ in teams]
+
+    start = time.perf_counter()
+    results = optimize_rosters(rosters, args.slots, args.workers)
+    elapsed = time.perf_counter() - start
+    print(f"  ✅ {len(results)} lineups in {elapsed:.2f}s ({elapsed / max(len(results), 1) * 1000:.2f} ms each)")
+
+    for team, result in list(zip(teams, results))[:3]:
+        print(f"\n  {team}: {result['points']:.1f} projected")
+        for starter in result["starters"]:
+            print(f"    {starter['slot']:<9} {starter['name']:<25} {starter['points']:5.1f}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump([{"team": team, **result} for team, result in zip(teams, results)], f, indent=2)
+        print(f"\n  📄 {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Player Name Resolver
+Matches FantasyPros "Name (TEAM)" rows to PFR player IDs through a normalized-name
+and trigram index, with team aliases and a persisted override table
+"""
+
+import json
+import re
+import sys
+import unicodedata
+from pathlib import Path
+from typing import Dict, Iterable, List, Any, Optional, Tuple
+
+from ingest_data import (
+    DATA_DIR,
+    PFR_DATA_FILES,
+    FANTASY_PROS_DATA_FILES,
+    find_data_file,
+    read_pfr_csv,
+    read_fantasy_pros_csv,
+    to_columns,
+)
+
+OVERRIDES_FILE = DATA_DIR / "name_overrides.json"
+
+NAME_SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "v"}
+
+# FantasyPros / common abbreviations -> PFR team codes
+TEAM_ALIASES = {
+    "JAC": "JAX",
+    "KC": "KAN",
+    "GB": "GNB",
+    "LV": "LVR",
+    "OAK": "LVR",
+    "SF": "SFO",
+    "TB": "TAM",
+    "NO": "NOR",
+    "NE": "NWE",
+    "LA": "LAR",
+    "STL": "LAR",
+    "SD": "LAC",
+    "WSH": "WAS",
+}
+
+# Free agents and multi-team markers carry no team signal
+NO_TEAM = {"", "FA", "2TM", "3TM", "4TM"}
+
+MIN_SCORE = 0.6
+MIN_MARGIN = 0.05
+LAST_NAME_BONUS = 0.15
+TEAM_BONUS = 0.15
+POSITION_BONUS = 0.05
+
+
+def normalize_name(name: str) -> str:
+    """'D.J. Moore' / 'DJ Moore', 'Brian Thomas Jr.' / 'Brian Thomas' -> same key"""
+    text = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii").lower()
+    text = re.sub(r"['’.]", "", text)
+    tokens = [token for token in re.split(r"[^a-z0-9]+", text) if token and token not in NAME_SUFFIXES]
+    return " ".join(tokens)
+
+
+def normalize_team(team: Optional[str]) -> Optional[str]:
+    """PFR team code for any known alias; None for free agents and nTM lines"""
+    team = (team or "").strip().upper()
+    if team in NO_TEAM:
+        return None
+    return TEAM_ALIASES.get(team, team)
+
+
+def trigrams(key: str) -> set:
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameResolver:
+    """Prebuilt index over PFR players; resolve() and resolve_many() return match records"""
+
+    def __init__(self, overrides_path: Optional[Path] = OVERRIDES_FILE):
+        self.codes: List[str] = []
+        self.names: List[str] = []
+        self.keys: List[str] = []
+        self.teams: List[Dict[int, set]] = []
+        self.positions: List[set] = []
+        self._by_code: Dict[str, int] = {}
+        self._by_key: Dict[str, List[int]] = {}
+        self._grams: List[set] = []
+        self._postings: Dict[str, List[int]] = {}
+        self.overrides_path = Path(overrides_path) if overrides_path else None
+        self.overrides: Dict[str, Optional[str]] = self._load_overrides()
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def _load_overrides(self) -> Dict[str, Optional[str]]:
+        if self.overrides_path is None:
+            return {}
+        try:
+            with open(self.overrides_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_overrides(self):
+        """Persist the override table (sorted for stable diffs)"""
+        if self.overrides_path is None:
+            return
+        self.overrides_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.overrides_path, "w", encoding="utf-8") as f:
+            json.dump(self.overrides, f, indent=2, sort_keys=True, ensure_ascii=False)
+            f.write("\n")
+
+    def add_override(self, name: str, code: Optional[str], team: Optional[str] = None):
+        """Pin a name (optionally a name + team) to a PFR code; None forces "no match\""""
+        key = f"{name} ({team})" if team else name
+        self.overrides[key] = code
+
+    def add_player(self, code: str, name: str, year: Optional[int] = None,
+                   team: Optional[str] = None, position: Optional[str] = None):
+        """Register a PFR player (repeat calls add team/position history)"""
+        index = self._by_code.get(code)
+        if index is None:
+            index = len(self.codes)
+            self._by_code[code] = index
+            self.codes.append(code)
+            self.names.append(name)
+            key = normalize_name(name)
+            self.keys.append(key)
+            self.teams.append({})
+            self.positions.append(set())
+            self._by_key.setdefault(key, []).append(index)
+            grams = trigrams(key)
+            self._grams.append(grams)
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(index)
+
+        team = normalize_team(team)
+        if year is not None and team:
+            self.teams[index].setdefault(year, set()).add(team)
+        if position:
+            self.positions[index].add(position)
+
+    def _context_score(self, index: int, team: Optional[str], year: Optional[int],
+                       position: Optional[str]) -> float:
+        score = 0.0
+        if team:
+            history = self.teams[index]
+            if year is not None and team in history.get(year, ()):
+                score += TEAM_BONUS
+            elif any(team in teams for teams in history.values()):
+                score += TEAM_BONUS / 2
+        if position and position in self.positions[index]:
+            score += POSITION_BONUS
+        return score
+
+    def _match(self, index: int, score: float, method: str) -> Dict[str, Any]:
+        return {"code": self.codes[index], "name": self.names[index], "score": round(score, 3), "method": method}
+
+    def resolve(self, name: str, team: Optional[str] = None, year: Optional[int] = None,
+                position: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Best PFR match for a name, or None when nothing is close or the top two are too close"""
+        for key in (f"{name} ({team})" if team else None, name):
+            if key is not None and key in self.overrides:
+                code = self.overrides[key]
+                if code is None or code not in self._by_code:
+                    return None
+                return self._match(self._by_code[code], 1.0, "override")
+
+        team = normalize_team(team)
+        key = normalize_name(name)
+
+        exact = self._by_key.get(key, [])
+        if len(exact) == 1:
+            return self._match(exact[0], 1.0, "exact")
+        if exact:
+            ranked = sorted(exact, key=lambda i: self._context_score(i, team, year, position), reverse=True)
+            best, second = (self._context_score(i, team, year, position) for i in ranked[:2])
+            return self._match(ranked[0], 1.0, "exact") if best > second else None
+
+        grams = trigrams(key)
+        overlap: Dict[int, int] = {}
+        for gram in grams:
+            for index in self._postings.get(gram, ()):
+                overlap[index] = overlap.get(index, 0) + 1
+
+        last_name = key.rsplit(" ", 1)[-1]
+        scored = []
+        for index, shared in overlap.items():
+            score = 2 * shared / (len(grams) + len(self._grams[index]))
+            if self.keys[index].rsplit(" ", 1)[-1] == last_name:
+                score += LAST_NAME_BONUS
+            score += self._context_score(index, team, year, position)
+            scored.append((score, index))
+
+        if not scored:
+            return None
+        scored.sort(reverse=True)
+        best_score, best = scored[0]
+        runner_up = scored[1][0] if len(scored) > 1 else 0.0
+        if best_score < MIN_SCORE or best_score - runner_up < MIN_MARGIN:
+            return None
+        return self._match(best, best_score, "fuzzy")
+
+    def resolve_many(self, records: Iterable[Tuple[str, Optional[str], Optional[int], Optional[str]]]
+                     ) -> List[Optional[Dict[str, Any]]]:
+        """Bulk resolve (name, team, year, position) records, memoizing repeats"""
+        cache: Dict[Tuple, Optional[Dict[str, Any]]] = {}
+        results = []
+        for record in records:
+            if record not in cache:
+                cache[record] = self.resolve(*record)
+            results.append(cache[record])
+        return results
+
+
+def build_resolver(data_dir: Path = DATA_DIR, overrides_path: Optional[Path] = OVERRIDES_FILE) -> NameResolver:
+    """Index every player in the PFR files"""
+    resolver = NameResolver(overrides_path)
+    for spec in PFR_DATA_FILES:
+        path = find_data_file(spec["fileName"], data_dir)
+        if path is None:
+            continue
+        headers, rows = read_pfr_csv(path)
+        data = to_columns(headers, rows)["data"]
+        positions = data.get("Pos", [None] * len(rows))
+        for i, code in enumerate(data["PlayerID"]):
+            if code:
+                resolver.add_player(code, data["Player"][i], int(spec["year"]), data["Team"][i], positions[i])
+    return resolver
+
+
+def fantasy_pros_records(data_dir: Path = DATA_DIR) -> List[Tuple[str, Optional[str], int, str]]:
+    """(name, team, year, position) for every FantasyPros row"""
+    records = []
+    for spec in FANTASY_PROS_DATA_FILES:
+        path = find_data_file(spec["fileName"], data_dir)
+        if path is None:
+            continue
+        headers, rows = read_fantasy_pros_csv(path)
+        data = to_columns(headers, rows)["data"]
+        for name, team in zip(data["Player"], data["Team"]):
+            records.append((name, team or None, int(spec["year"]), spec["position"]))
+    return records
+
+
+def main():
+    """
+    Resolve every FantasyPros row and report how each was matched
+    --override "Name (TEAM)" CODE pins a name in the override table (CODE "none" blocks a match)
+    """
+    print("Player Name Resolver")
+    print("=" * 50)
+
+    resolver = build_resolver()
+
+    args = sys.argv[1:]
+    if "--override" in args:
+        position = args.index("--override")
+        if len(args) < position + 3:
+            print("Usage: name_resolver.py --override \"Name (TEAM)\" CODE")
+            sys.exit(2)
+        name, code = args[position + 1], args[position + 2]
+        resolver.add_override(name, None if code.lower() == "none" else code)
+        resolver.save_overrides()
+        print(f"  ✅ Override saved: {name} -> {code}")
+    records = fantasy_pros_records()
+    matches = resolver.resolve_many(records)
+
+    methods: Dict[str, int] = {}
+    unresolved = set()
+    for record, match in zip(records, matches):
+        method = match["method"] if match else "unresolved"
+        methods[method] = methods.get(method, 0) + 1
+        if match is None:
+            unresolved.add(f"{record[0]} ({record[1] or 'FA'})")
+        elif match["method"] == "fuzzy" and "-v" in sys.argv[1:]:
+            print(f"  ~ {record[0]} ({record[1]}) -> {match['name']} [{match['code']}] {match['score']}")
+
+    print(f"  Indexed {len(resolver)} PFR players, resolved {len(records)} FantasyPros rows")
+    for method, count in sorted(methods.items()):
+        print(f"  {'⚠️ ' if method == 'unresolved' else '✅'} {method}: {count}")
+    for name in sorted(unresolved):
+        print(f"    - {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,11 +5,35 @@ Ensures optimal loading performance
 """
 
 import os
+import sys
+import gzip
 import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Any, Optional
 
-def analyze_assets():
+from instrument import span
+
+try:
+    from PIL import Image, features
+except ImportError:  # Pillow is only needed for the optimize step
+    Image = None
+    features = None
+
+try:
+    import brotli
+except ImportError:  # brotli sidecars are skipped without it
+    brotli = None
+
+# Responsive widths generated for every PNG (never upscaled past the original)
+IMAGE_WIDTHS = [320, 640, 1280]
+WEBP_QUALITY = 80
+AVIF_QUALITY = 55
+
+# Text assets that get precompressed .gz/.br sidecars
+COMPRESSIBLE_EXTENSIONS = {".csv", ".json", ".js", ".css", ".html", ".svg"}
+
+def analyze_assets(report_path: Optional[Path] = None):
     """Analyze current asset sizes and provide optimization recommendations"""
     
     print("\n" + "="*60)
@@ -93,12 +117,12 @@ def analyze_assets():
     if large_images:
         recommendations.append(
             f"Compress these images: {', '.join(large_images)}\n"
-            f"     Use: TinyPNG.com or 'pip install pillow' for Python compression"
+            f"     Use: 'python3 scripts/optimize_assets.py optimize' (requires pillow)"
         )
     
     # Check if we're using the right formats
     if images_dir.exists() and list(images_dir.glob("*.png")):
-        if not list(images_dir.glob("*.webp")):
+        if not list(images_dir.glob("*.webp")) and not list(images_dir.glob("optimized/*.webp")):
             recommendations.append(
                 "Consider WebP format for 25-35% smaller files\n"
                 "     Modern browsers support it with PNG fallback"
@@ -110,7 +134,7 @@ def analyze_assets():
             "Consider data minification:\n"
             "     - Remove unnecessary columns\n"
             "     - Use shorter column names\n"
-            "     - Compress with gzip (GitHub Pages does this automatically)"
+            "     - Precompress with: python3 scripts/optimize_assets.py compress"
         )
     
     if recommendations:
@@ -123,13 +147,13 @@ def analyze_assets():
     print("\n🚀 GITHUB PAGES BEST PRACTICES:")
     print("-" * 40)
     print("  1. Assets < 100KB load instantly")
-    print("  2. GitHub Pages automatically gzips text files")
+    print("  2. Precompressed .gz/.br sidecars come from the compress step")
     print("  3. Use relative paths (/images/...) for CDN benefits")
     print("  4. Browser caching works automatically")
     print("  5. No need for external CDN under 10MB total")
     
-    # Create optimization report
-    report = {
+    # Analysis keys of the report
+    analysis = {
         "timestamp": "2025-08-16",
         "total_size_kb": round(total_size, 2),
         "images": {
@@ -146,15 +170,20 @@ def analyze_assets():
         "github_pages_ready": True
     }
     
-    # Save report
-    report_path = project_root / "asset_report.json"
+    # Merge into the existing report so the optimize/compress sections survive
+    report_path = report_path or project_root / "asset_report.json"
+    report = {}
+    if report_path.exists():
+        with open(report_path, 'r') as f:
+            report = json.load(f)
+    report.update(analysis)
     with open(report_path, 'w') as f:
         json.dump(report, f, indent=2)
     
-    print(f"\n📄 Report saved to: asset_report.json")
+    print(f"\n📄 Report saved to: {report_path.name}")
     print("="*60 + "\n")
     
-    return report
+    return analysis
 
 def optimize_for_github_pages():
     """Specific optimizations for GitHub Pages hosting"""
@@ -194,7 +223,259 @@ def optimize_for_github_pages():
     
     print("\n✅ GitHub Pages optimization complete!")
 
+def avif_supported() -> bool:
+    """True if the installed Pillow can encode AVIF"""
+    if features is None:
+        return False
+    try:
+        return bool(features.check("avif"))
+    except (ValueError, KeyError):
+        return False
+
+def target_widths(original_width: int) -> List[int]:
+    """Responsive widths for an image, capped at (and including) its own width"""
+    widths = [w for w in IMAGE_WIDTHS if w < original_width]
+    return widths + [original_width]
+
+def _is_up_to_date(source: Path, output: Path) -> bool:
+    return output.exists() and output.stat().st_mtime >= source.stat().st_mtime
+
+def optimize_image(source: str, output_dir: str, formats: List[str], force: bool = False) -> Dict[str, Any]:
+    """Encode one PNG into every width x format; runs in a worker process"""
+    source_path = Path(source)
+    out_dir = Path(output_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    
+    variants = []
+    with Image.open(source_path) as img:
+        img.load()
+        original_width, original_height = img.size
+        
+        for width in target_widths(original_width):
+            height = max(1, round(original_height * width / original_width))
+            resized = None
+            
+            for fmt in formats:
+                output = out_dir / f"{source_path.stem}-{width}.{fmt}"
+                skipped = not force and _is_up_to_date(source_path, output)
+                
+                if not skipped:
+                    if resized is None:
+                        resized = img if width == original_width else img.resize((width, height), Image.LANCZOS)
+                    if fmt == "webp":
+                        resized.save(output, "WEBP", quality=WEBP_QUALITY, method=6)
+                    else:
+                        resized.save(output, "AVIF", quality=AVIF_QUALITY)
+                
+                variants.append({
+                    "file": output.name,
+                    "format": fmt,
+                    "width": width,
+                    "size_kb": round(os.path.getsize(output) / 1024, 2),
+                    "skipped": skipped,
+                })
+    
+    original_kb = os.path.getsize(source_path) / 1024
+    full_size = [v for v in variants if v["width"] == original_width]
+    best_kb = min(v["size_kb"] for v in full_size)
+    return {
+        "name": source_path.name,
+        "original_kb": round(original_kb, 2),
+        "best_full_size_kb": best_kb,
+        "saved_kb": round(original_kb - best_kb, 2),
+        "variants": variants,
+    }
+
+def write_image_manifest(results: List[Dict[str, Any]], manifest_path: Path):
+    """
+    Widths and formats generated per image, read by src/components/ResponsiveImage.tsx at build
+    time; without the manifest the UI serves the original PNGs
+    """
+    manifest = {}
+    for result in results:
+        formats = sorted({v["format"] for v in result["variants"]}, key=lambda fmt: fmt != "avif")
+        manifest[result["name"]] = {
+            "widths": sorted({v["width"] for v in result["variants"]}),
+            "formats": formats,
+        }
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(manifest_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+def optimize_images(images_dir: Optional[Path] = None, output_dir: Optional[Path] = None,
+                    report_path: Optional[Path] = None, max_workers: Optional[int] = None,
+                    force: bool = False, manifest_path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """Generate WebP/AVIF responsive variants for every PNG, keeping the PNGs as fallbacks"""
+    
+    print("\n🖼️  OPTIMIZING IMAGES...")
+    print("-" * 40)
+    
+    if Image is None:
+        print("  ⚠️  Pillow is not installed: pip install pillow")
+        return None
+    
+    project_root = Path(__file__).parent.parent
+    images_dir = images_dir or project_root / "public" / "images"
+    output_dir = output_dir or images_dir / "optimized"
+    report_path = report_path or project_root / "asset_report.json"
+    
+    formats = ["webp"] + (["avif"] if avif_supported() else [])
+    if "avif" not in formats:
+        print("  ⚠️  AVIF encoder unavailable, generating WebP only")
+    
+    sources = sorted(images_dir.glob("*.png"))
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(optimize_image, str(src), str(output_dir), formats, force) for src in sources]
+        results = [future.result() for future in futures]
+    
+    for result in results:
+        encoded = sum(1 for v in result["variants"] if not v["skipped"])
+        status = "✅" if encoded else "⏭️ "
+        print(f"  {status} {result['name']}: {result['original_kb']:.1f} KB -> "
+              f"{result['best_full_size_kb']:.1f} KB ({encoded} encoded, "
+              f"{len(result['variants']) - encoded} up to date)")
+    
+    summary = {
+        "formats": formats,
+        "widths": IMAGE_WIDTHS,
+        "quality": {"webp": WEBP_QUALITY, "avif": AVIF_QUALITY},
+        "original_kb": round(sum(r["original_kb"] for r in results), 2),
+        "optimized_kb": round(sum(r["best_full_size_kb"] for r in results), 2),
+        "saved_kb": round(sum(r["saved_kb"] for r in results), 2),
+        "files": results,
+    }
+    
+    write_image_manifest(results, manifest_path or project_root / "src" / "generated" / "imageVariants.json")
+    
+    # Merge into the existing report rather than replacing the size analysis
+    report = {}
+    if report_path.exists():
+        with open(report_path, 'r') as f:
+            report = json.load(f)
+    report["image_optimization"] = summary
+    with open(report_path, 'w') as f:
+        json.dump(report, f, indent=2)
+    
+    print(f"\n  Saved {summary['saved_kb']:.1f} KB at full size "
+          f"({summary['original_kb']:.1f} KB -> {summary['optimized_kb']:.1f} KB)")
+    print(f"📄 Savings recorded in: {report_path.name}")
+    
+    return summary
+
+def compress_file(source: str, force: bool = False) -> Dict[str, Any]:
+    """Write max-level .gz (and .br) sidecars for one file; runs in a worker process"""
+    path = Path(source)
+    raw = None
+    sizes = {"raw": path.stat().st_size}
+    
+    sidecars = [("gzip", path.with_name(path.name + ".gz"))]
+    if brotli is not None:
+        sidecars.append(("brotli", path.with_name(path.name + ".br")))
+    
+    skipped = True
+    for encoding, sidecar in sidecars:
+        if force or not _is_up_to_date(path, sidecar):
+            if raw is None:
+                raw = path.read_bytes()
+            # mtime=0 keeps gzip output byte-identical across runs
+            data = gzip.compress(raw, compresslevel=9, mtime=0) if encoding == "gzip" \
+                else brotli.compress(raw, quality=11)
+            sidecar.write_bytes(data)
+            skipped = False
+        sizes[encoding] = sidecar.stat().st_size
+    
+    return {"path": str(path), "sizes": sizes, "skipped": skipped}
+
+def find_compressible(directories: List[Path]) -> List[Path]:
+    """Every compressible text asset under the given directories"""
+    files = []
+    for directory in directories:
+        if directory.exists():
+            files.extend(
+                p for p in sorted(directory.rglob("*"))
+                if p.is_file() and p.suffix.lower() in COMPRESSIBLE_EXTENSIONS
+            )
+    return files
+
+def compress_assets(directories: Optional[List[Path]] = None, report_path: Optional[Path] = None,
+                    max_workers: Optional[int] = None, force: bool = False) -> Dict[str, Any]:
+    """Precompress the build output so any static host can serve .gz/.br directly"""
+    
+    print("\n🗜️  PRECOMPRESSING TEXT ASSETS...")
+    print("-" * 40)
+    
+    project_root = Path(__file__).parent.parent
+    # Vite copies public/ into dist/, so compressing dist alone covers the data files once
+    directories = directories or [project_root / "dist"]
+    report_path = report_path or project_root / "asset_report.json"
+    
+    if brotli is None:
+        print("  ⚠️  brotli is not installed (pip install brotli), writing .gz only")
+    
+    files = find_compressible(directories)
+    # Workers run in other processes, so the span covers the whole pool and sums their sizes
+    with span("compress", files=len(files)) as stage:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(compress_file, [str(f) for f in files], [force] * len(files)))
+        for result in results:
+            if not result["skipped"]:
+                sizes = result["sizes"]
+                stage.add(bytes_read=sizes["raw"],
+                          bytes_written=sum(size for encoding, size in sizes.items() if encoding != "raw"))
+    
+    entries = []
+    totals = {"raw_kb": 0.0, "gzip_kb": 0.0, "brotli_kb": 0.0}
+    for result in results:
+        path = Path(result["path"])
+        sizes = result["sizes"]
+        relative = next(
+            (str(path.relative_to(d.parent)) for d in directories if d in path.parents),
+            path.name,
+        )
+        entry = {"name": relative}
+        for encoding in ("raw", "gzip", "brotli"):
+            if encoding in sizes:
+                entry[f"{encoding}_kb"] = round(sizes[encoding] / 1024, 2)
+                totals[f"{encoding}_kb"] += sizes[encoding] / 1024
+        entries.append(entry)
+        
+        status = "⏭️ " if result["skipped"] else "✅"
+        transfer = entry.get("brotli_kb", entry["gzip_kb"])
+        print(f"  {status} {relative}: {entry['raw_kb']:.1f} KB -> {transfer:.1f} KB")
+    
+    summary = {
+        "encodings": ["gzip"] + (["brotli"] if brotli is not None else []),
+        "file_count": len(entries),
+        "raw_kb": round(totals["raw_kb"], 2),
+        "gzip_kb": round(totals["gzip_kb"], 2),
+        "files": entries,
+    }
+    if brotli is not None:
+        summary["brotli_kb"] = round(totals["brotli_kb"], 2)
+    
+    report = {}
+    if report_path.exists():
+        with open(report_path, 'r') as f:
+            report = json.load(f)
+    report["compression"] = summary
+    with open(report_path, 'w') as f:
+        json.dump(report, f, indent=2)
+    
+    best = summary.get("brotli_kb", summary["gzip_kb"])
+    print(f"\n  {len(entries)} files: {summary['raw_kb']:.1f} KB raw -> "
+          f"{summary['gzip_kb']:.1f} KB gzip" + (f", {best:.1f} KB brotli" if brotli is not None else ""))
+    print(f"📄 Transfer sizes recorded in: {report_path.name}")
+    
+    return summary
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "optimize":
+        optimize_images(force="--force" in sys.argv[2:])
+        sys.exit(0)
+    if len(sys.argv) > 1 and sys.argv[1] == "compress":
+        compress_assets(force="--force" in sys.argv[2:])
+        sys.exit(0)
+    
     # Run analysis
     report = analyze_assets()
     
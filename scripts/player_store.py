@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Unified Player-Season Store
+Loads every PFR and FantasyPros CSV into array-backed tables keyed by integer player IDs
+"""
+
+import math
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+from ingest_data import (
+    DATA_DIR,
+    PFR_DATA_FILES,
+    FANTASY_PROS_DATA_FILES,
+    find_data_file,
+    read_pfr_csv,
+    read_fantasy_pros_csv,
+    to_columns,
+)
+from name_resolver import NameResolver, OVERRIDES_FILE
+
+SEASON_TYPES = ["regular", "playoff"]
+KEY_COLUMNS = {"Rk", "Rank", "Player", "Team", "Pos", "PlayerID"}
+MISSING = float("nan")
+
+
+def _as_float(value: Any) -> float:
+    if isinstance(value, (int, float)):
+        return float(value)
+    return MISSING
+
+
+class StringPool:
+    """Interns repeated strings (teams, positions) as small integer codes"""
+
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def intern(self, value: Optional[str]) -> int:
+        value = value or ""
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.codes[value] = code
+            self.values.append(value)
+        return code
+
+    def __getitem__(self, code: int) -> str:
+        return self.values[code]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class StatTable:
+    """
+    Column-oriented stat lines for one source (receiving, passing, FantasyPros totals, ...)
+    Numeric stats live in array('d') columns with NaN for missing values
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.player = array("i")
+        self.year = array("H")
+        self.season_type = array("b")
+        self.team = array("H")
+        self.position = array("H")
+        self.numeric: Dict[str, array] = {}
+        self.text: Dict[str, List[Optional[str]]] = {}
+        self._index: Dict[Tuple[int, int, int], int] = {}
+        self._team_index: Dict[Tuple[int, int, int, int], int] = {}
+
+    def __len__(self) -> int:
+        return len(self.player)
+
+    def append_rows(self, keys: List[Tuple[int, int, int, int, int]], columns: List[Dict[str, str]],
+                    data: Dict[str, List[Any]]):
+        """Append a batch of rows; keys are (player, year, season_type, team, position)"""
+        start = len(self)
+        count = len(keys)
+
+        for player, year, season_type, team, position in keys:
+            self.player.append(player)
+            self.year.append(year)
+            self.season_type.append(season_type)
+            self.team.append(team)
+            self.position.append(position)
+
+        for column in columns:
+            key = column["key"]
+            if key in KEY_COLUMNS:
+                continue
+            values = data[key]
+            if key in self.numeric or (column["type"] == "number" and key not in self.text):
+                target = self.numeric.get(key)
+                if target is None:
+                    target = self.numeric[key] = array("d", [MISSING]) * start
+                target.extend(_as_float(v) for v in values)
+            else:
+                target = self.text.get(key)
+                if target is None:
+                    target = self.text[key] = [None] * start
+                target.extend(None if v is None else str(v) for v in values)
+
+        # Pad columns this batch did not carry (e.g. QBR missing from playoff passing)
+        total = start + count
+        for key, target in self.numeric.items():
+            if len(target) < total:
+                target.extend(array("d", [MISSING]) * (total - len(target)))
+        for key, target in self.text.items():
+            if len(target) < total:
+                target.extend([None] * (total - len(target)))
+
+        # Multi-team players list the combined "2TM" line first, then each team split
+        for offset, (player, year, season_type, team, _) in enumerate(keys):
+            row = start + offset
+            self._index.setdefault((player, year, season_type), row)
+            self._team_index.setdefault((player, year, season_type, team), row)
+
+    def row_index(self, player: int, year: int, season_type: str = "regular",
+                  team: Optional[int] = None) -> Optional[int]:
+        """O(1) lookup of the row for a player-season (optionally a single-team split)"""
+        season_code = SEASON_TYPES.index(season_type)
+        if team is None:
+            return self._index.get((player, year, season_code))
+        return self._team_index.get((player, year, season_code, team))
+
+    def season_rows(self):
+        """Iterate ((player, year, season_type), row) for each player-season total line"""
+        return iter(self._index.items())
+
+    def column(self, key: str) -> array:
+        """Return the backing array for a numeric column"""
+        return self.numeric[key]
+
+    def value(self, key: str, row: int) -> Optional[Any]:
+        """Read a single cell, mapping NaN back to None"""
+        if key in self.numeric:
+            number = self.numeric[key][row]
+            return None if math.isnan(number) else number
+        return self.text[key][row]
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the array columns"""
+        arrays = [self.player, self.year, self.season_type, self.team, self.position]
+        arrays += list(self.numeric.values())
+        return sum(a.itemsize * len(a) for a in arrays)
+
+
+class PlayerStore:
+    """All player-seasons from every data file, joined on integer player IDs"""
+
+    def __init__(self, overrides_path: Optional[Path] = OVERRIDES_FILE):
+        self.player_codes: List[Optional[str]] = []
+        self.player_names: List[str] = []
+        self.teams = StringPool()
+        self.positions = StringPool()
+        self.tables: Dict[str, StatTable] = {}
+        self._ids_by_code: Dict[str, int] = {}
+        self._ids_by_name: Dict[str, List[int]] = {}
+        self._active: Dict[int, set] = {}
+        self.resolver = NameResolver(overrides_path)
+
+    def __len__(self) -> int:
+        return len(self.player_names)
+
+    def _new_player(self, name: str, code: Optional[str]) -> int:
+        player_id = len(self.player_names)
+        self.player_names.append(name)
+        self.player_codes.append(code)
+        if code:
+            self._ids_by_code[code] = player_id
+        self._ids_by_name.setdefault(name, []).append(player_id)
+        return player_id
+
+    def _table(self, name: str) -> StatTable:
+        if name not in self.tables:
+            self.tables[name] = StatTable(name)
+        return self.tables[name]
+
+    def player_id(self, code: str) -> Optional[int]:
+        """Integer ID for a PFR player code such as 'ChasJa00'"""
+        return self._ids_by_code.get(code)
+
+    def find_players(self, name: str) -> List[int]:
+        """All player IDs carrying an exact display name"""
+        return list(self._ids_by_name.get(name, []))
+
+    def resolve_name(self, name: str, year: int, team: Optional[str] = None,
+                     position: Optional[str] = None) -> Optional[int]:
+        """
+        Map a FantasyPros name onto a known player
+        PFR players go through the fuzzy resolver; FantasyPros-only players match by exact name,
+        preferring one active that year
+        """
+        match = self.resolver.resolve(name, team, year, position)
+        if match is not None:
+            return self._ids_by_code[match["code"]]
+
+        candidates = [i for i in self._ids_by_name.get(name, []) if not self.player_codes[i]]
+        if len(candidates) == 1:
+            return candidates[0]
+        active = self._active.get(year, set())
+        for player_id in candidates:
+            if player_id in active:
+                return player_id
+        return candidates[0] if candidates else None
+
+    def add_pfr_file(self, spec: Dict[str, str], path: Path):
+        """Load one PFR export into its stat-type table"""
+        headers, rows = read_pfr_csv(path)
+        payload = to_columns(headers, rows)
+        data = payload["data"]
+        year = int(spec["year"])
+        season_code = SEASON_TYPES.index(spec["seasonType"])
+
+        positions = data.get("Pos", [None] * len(rows))
+
+        keys = []
+        for i, code in enumerate(data["PlayerID"]):
+            player_id = self._ids_by_code.get(code) if code else None
+            if player_id is None:
+                player_id = self._new_player(data["Player"][i], code)
+            if code:
+                self.resolver.add_player(code, data["Player"][i], year, data["Team"][i], positions[i])
+            self._active.setdefault(year, set()).add(player_id)
+            keys.append((
+                player_id,
+                year,
+                season_code,
+                self.teams.intern(data["Team"][i]),
+                self.positions.intern(positions[i]),
+            ))
+
+        self._table(spec["statType"]).append_rows(keys, payload["columns"], data)
+
+    def add_fantasy_pros_file(self, spec: Dict[str, str], path: Path):
+        """Load one FantasyPros export, joining names onto PFR player IDs"""
+        headers, rows = read_fantasy_pros_csv(path)
+        payload = to_columns(headers, rows)
+        data = payload["data"]
+        year = int(spec["year"])
+        position = self.positions.intern(spec["position"])
+
+        keys = []
+        for i, name in enumerate(data["Player"]):
+            player_id = self.resolve_name(name, year, data["Team"][i], spec["position"])
+            if player_id is None:
+                player_id = self._new_player(name, None)
+                self._active.setdefault(year, set()).add(player_id)
+            keys.append((player_id, year, 0, self.teams.intern(data["Team"][i]), position))
+
+        self._table(fantasy_pros_table_name(spec["kind"], spec["position"])).append_rows(keys, payload["columns"], data)
+
+    def fantasy_pros_tables(self, kind: str) -> List[StatTable]:
+        """Every position's FantasyPros table of one kind ("Totals" or "Per_Game")"""
+        prefix = fantasy_pros_table_name(kind, "")
+        return [table for name, table in self.tables.items() if name.startswith(prefix)]
+
+    def lookup(self, player_id: int, year: int, season_type: str = "regular") -> Dict[str, Dict[str, Any]]:
+        """Every stat line for a player-season, grouped by table"""
+        result = {}
+        for name, table in self.tables.items():
+            row = table.row_index(player_id, year, season_type)
+            if row is None:
+                continue
+            line = {key: table.value(key, row) for key in table.numeric}
+            line.update({key: table.value(key, row) for key in table.text})
+            line["Team"] = self.teams[table.team[row]]
+            line["Pos"] = self.positions[table.position[row]]
+            result[name] = line
+        return result
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the array columns across all tables"""
+        return sum(table.nbytes() for table in self.tables.values())
+
+
+def fantasy_pros_table_name(kind: str, position: str) -> str:
+    """
+    One table per kind and position: YDS is receiving yards in WR files but rushing yards in
+    RB files, and a player listed in both would otherwise collide on (player, year)
+    """
+    return f"fantasypros_{kind.lower()}_{position.lower()}"
+
+
+def load_store(data_dir: Path = DATA_DIR, overrides_path: Optional[Path] = OVERRIDES_FILE) -> PlayerStore:
+    """Build the store from every known data file (PFR first so IDs come from PFR codes)"""
+    store = PlayerStore(overrides_path)
+
+    for spec in PFR_DATA_FILES:
+        path = find_data_file(spec["fileName"], data_dir)
+        if path is not None:
+            store.add_pfr_file(spec, path)
+
+    for spec in FANTASY_PROS_DATA_FILES:
+        path = find_data_file(spec["fileName"], data_dir)
+        if path is not None:
+            store.add_fantasy_pros_file(spec, path)
+
+    return store
+
+
+def main():
+    """Load the store and print a summary"""
+    print("Player-Season Store")
+    print("=" * 50)
+
+    store = load_store()
+
+    for name, table in store.tables.items():
+        print(f"  ✅ {name}: {len(table)} rows, {len(table.numeric)} numeric columns")
+
+    linked = sum(1 for code in store.player_codes if code)
+    print(f"\n  Players: {len(store)} ({linked} with PFR IDs)")
+    print(f"  Teams: {len(store.teams)}, Positions: {len(store.positions)}")
+    print(f"  Column memory: {store.nbytes() / 1024:.1f} KB")
+
+    if len(sys.argv) > 1:
+        for code in sys.argv[1:]:
+            player_id = store.player_id(code)
+            if player_id is None:
+                print(f"\n  ⚠️  Unknown player code {code}")
+                continue
+            print(f"\n  {store.player_names[player_id]} ({code}):")
+            for year in (2024, 2023, 2022):
+                for table, line in store.lookup(player_id, year).items():
+                    print(f"    {year} {table}: {line}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Query Cache
+Derived stat views (position / min-target filters, advanced metrics, sorts) behind a keyed
+result cache: a size-capped memory LRU plus an optional disk tier, both keyed by the
+content hash of the source CSVs so edits invalidate entries automatically
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Optional, Tuple
+
+from ingest_data import (
+    DATA_DIR,
+    PFR_DATA_FILES,
+    FANTASY_PROS_DATA_FILES,
+    PROJECT_ROOT,
+    find_data_file,
+    normalize_pfr_file,
+    normalize_fantasy_pros_file,
+)
+from hashing import file_hash
+from scoring import FANTASY_PROS_STATS, SCORING_PROFILES, score_line, table_stat_columns
+from team_metrics import share_columns
+
+QUERY_CACHE_DIR = DATA_DIR / "query_cache"
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+# Bump when view output changes so old disk entries stop matching
+QUERY_VERSION = 3
+
+
+class SourceHashes:
+    """Content hashes of source files, re-read only when a file's size or mtime changes"""
+
+    def __init__(self):
+        self._hashes: Dict[str, Tuple[int, int, str]] = {}
+
+    def get(self, path: Path) -> Optional[str]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        key = str(path)
+        cached = self._hashes.get(key)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+        digest = file_hash(path)
+        if digest is None:
+            return None
+        self._hashes[key] = (stat.st_size, stat.st_mtime_ns, digest)
+        return digest
+
+
+class QueryCache:
+    """
+    Two-tier result cache
+    Keys combine the query name, its parameters and the content hash of every source file;
+    cached results are shared objects and must be treated as read-only
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, disk_dir: Optional[Path] = None):
+        self.max_bytes = max_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.hashes = SourceHashes()
+        self._entries: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self.bytes = 0
+        self.counts = {"memory": 0, "disk": 0, "miss": 0, "evicted": 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(self, name: str, sources: List[Path], params: Dict[str, Any]) -> Optional[str]:
+        """Cache key, or None when a source is missing (nothing to key the result on)"""
+        hashes = [self.hashes.get(Path(source)) for source in sources]
+        if any(digest is None for digest in hashes):
+            return None
+        material = json.dumps([QUERY_VERSION, name, params, hashes], sort_keys=True, default=str)
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _remember(self, key: str, value: Any, size: int):
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self.bytes -= self._entries.pop(key)[1]
+        self._entries[key] = (value, size)
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.bytes -= evicted
+            self.counts["evicted"] += 1
+
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / key[:2] / f"{key}.json"
+
+    def get_or_compute(self, name: str, sources: List[Path], params: Dict[str, Any],
+                       compute: Callable[[], Any]) -> Any:
+        """Cached result of `compute()` for this query against the current source contents"""
+        key = self.key(name, sources, params)
+        if key is None:
+            self.counts["miss"] += 1
+            return compute()
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.counts["memory"] += 1
+            return entry[0]
+
+        if self.disk_dir is not None:
+            path = self._disk_path(key)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    text = f.read()
+                value = json.loads(text)
+                self._remember(key, value, len(text))
+                self.counts["disk"] += 1
+                return value
+            except (OSError, ValueError):
+                pass
+
+        value = compute()
+        self.counts["miss"] += 1
+        text = json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+        self._remember(key, value, len(text))
+        if self.disk_dir is not None:
+            path = self._disk_path(key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp = path.with_suffix(".tmp")
+            with open(temp, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(temp, path)
+        return value
+
+    def clear(self, disk: bool = False):
+        """Drop memory entries (and disk entries when asked)"""
+        self._entries.clear()
+        self.bytes = 0
+        if disk and self.disk_dir is not None and self.disk_dir.exists():
+            for path in self.disk_dir.glob("*/*.json"):
+                path.unlink()
+
+    def stats(self) -> Dict[str, int]:
+        return {**self.counts, "entries": len(self._entries), "bytes": self.bytes}
+
+
+def dataset_spec(file_name: str) -> Optional[Dict[str, str]]:
+    """The PFR or FantasyPros spec for a data file name"""
+    for spec in PFR_DATA_FILES + FANTASY_PROS_DATA_FILES:
+        if spec["fileName"].lower() == file_name.lower():
+            return spec
+    return None
+
+
+def dataset_payload(spec: Dict[str, str], data_dir: Path = DATA_DIR) -> Optional[Dict[str, Any]]:
+    normalize = normalize_pfr_file if "statType" in spec else normalize_fantasy_pros_file
+    return normalize(spec, data_dir)
+
+
+def payload_rows(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    data = payload["data"]
+    keys = [column["key"] for column in payload["columns"]]
+    return [{key: data[key][i] for key in keys} for i in range(payload["rowCount"])]
+
+
+def dataset_rows(spec: Dict[str, str], data_dir: Path = DATA_DIR) -> List[Dict[str, Any]]:
+    """Typed row dicts for a dataset"""
+    payload = dataset_payload(spec, data_dir)
+    return payload_rows(payload) if payload is not None else []
+
+
+def scoring_columns(spec: Dict[str, str]) -> Dict[str, str]:
+    """Scoring stat -> column for a dataset (a PFR table, or a FantasyPros position file)"""
+    if "statType" in spec:
+        return table_stat_columns(spec["statType"])
+    return FANTASY_PROS_STATS.get(spec.get("position"), {})
+
+
+def advanced_metrics(row: Dict[str, Any], target_share: Optional[float] = None,
+                     points: float = 0.0) -> Dict[str, Optional[float]]:
+    """
+    targetShare is the player's real share of team targets from team_metrics (None without a
+    team total) and fantasyPoints comes from scoring.py; the PFR files carry no air yards or
+    routes, so aDOT and YPRR are the UI's rough estimates and are named as such
+    """
+    return {
+        "estimatedAdot": round((row.get("Y/Tgt") or 0) * 1.2, 2),
+        "estimatedYprr": round((row.get("Y/G") or 0) / 30, 2),
+        "targetShare": target_share,
+        "fantasyPoints": round(points, 2),
+    }
+
+
+def derived_view(file_name: str, position: Optional[str] = None, min_targets: float = 0,
+                 advanced: bool = False, sort: Optional[str] = None, limit: Optional[int] = None,
+                 profile: str = "half_ppr", data_dir: Path = DATA_DIR) -> List[Dict[str, Any]]:
+    """Filtered, optionally enriched and sorted rows of one dataset (the uncached computation)"""
+    spec = dataset_spec(file_name)
+    if spec is None:
+        raise ValueError(f"Unknown dataset {file_name}")
+
+    payload = dataset_payload(spec, data_dir)
+    if payload is None:
+        return []
+    target_shares = [None] * payload["rowCount"]
+    if advanced and spec.get("statType") == "receiving":
+        target_shares = share_columns(payload)[0].get("TgtShare", target_shares)
+    weights = SCORING_PROFILES[profile]
+    columns = scoring_columns(spec)
+
+    rows = []
+    for row, target_share in zip(payload_rows(payload), target_shares):
+        if min_targets and (row.get("Tgt", row.get("TGT")) or 0) < min_targets:
+            continue
+        row_position = row.get("Pos") or spec.get("position")
+        if position and row_position != position:
+            continue
+        if advanced:
+            row.update(advanced_metrics(row, target_share, score_line(row, columns, row_position, weights)))
+        rows.append(row)
+
+    if sort:
+        present = [row for row in rows if isinstance(row.get(sort), (int, float))]
+        missing = [row for row in rows if not isinstance(row.get(sort), (int, float))]
+        rows = sorted(present, key=lambda row: row[sort], reverse=True) + missing
+    return rows[:limit] if limit else rows
+
+
+def cached_view(cache: QueryCache, file_name: str, data_dir: Path = DATA_DIR, **params) -> List[Dict[str, Any]]:
+    """derived_view() through the cache, keyed on the dataset's current contents"""
+    spec = dataset_spec(file_name)
+    path = find_data_file(spec["fileName"], data_dir) if spec else None
+    return cache.get_or_compute("derived_view", [path] if path else [Path(data_dir) / file_name],
+                                {"file": file_name, **params},
+                                lambda: derived_view(file_name, data_dir=data_dir, **params))
+
+
+def main():
+    """Run a derived view query through the disk-backed cache and report hit/miss timings"""
+    parser = argparse.ArgumentParser(description="Cached derived stat views")
+    parser.add_argument("dataset", nargs="?", default="pff-nfl-regular-receiving-2024.csv")
+    parser.add_argument("--position", default=None)
+    parser.add_argument("--min-targets", type=float, default=0)
+    parser.add_argument("--advanced", action="store_true", help="add target share, fantasy points and estimated aDOT/YPRR")
+    parser.add_argument("--profile", default="half_ppr", choices=list(SCORING_PROFILES),
+                        help="scoring profile for fantasy points")
+    parser.add_argument("--sort", default=None)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--no-disk", action="store_true", help="memory cache only")
+    parser.add_argument("--clear", action="store_true", help="empty the disk cache first")
+    args = parser.parse_args()
+
+    print("Query Cache")
+    print("=" * 50)
+
+    cache = QueryCache(disk_dir=None if args.no_disk else QUERY_CACHE_DIR)
+    if args.clear:
+        cache.clear(disk=True)
+
+    params = {"position": args.position, "min_targets": args.min_targets, "advanced": args.advanced,
+              "sort": args.sort, "limit": args.limit, "profile": args.profile}
+    for attempt in ("first", "repeat"):
+        start = time.perf_counter()
+        rows = cached_view(cache, args.dataset, **params)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"  {attempt}: {len(rows)} rows in {elapsed:.2f} ms {cache.stats()}")
+
+    for row in rows:
+        value = row.get(args.sort) if args.sort else ""
+        print(f"    {row.get('Player', ''):<25} {row.get('Team') or '':<4} {value}")
+    if cache.disk_dir is not None:
+        print(f"  📁 {cache.disk_dir.relative_to(PROJECT_ROOT)}/")
+
+
+if __name__ == "__main__":
+    main()
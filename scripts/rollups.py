@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Multi-Season Player Rollups
+Builds per-season, regular+playoff combined and career aggregates for every player
+in one pass over the PFR files, caching each season so only changed sources are re-read
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+from hashing import file_hash
+from ingest_data import DATA_DIR, PFR_DATA_FILES, SEASON_TYPES, find_data_file, read_pfr_csv, to_columns
+
+ROLLUP_DIR = DATA_DIR / "rollups"
+HISTORY_FILE = "player_history.json"
+
+# Bump when the partial layout changes so every cached season is rebuilt once
+ROLLUP_VERSION = 1
+
+COMBINED_TEAM_PATTERN = re.compile(r"^\dTM$")
+
+# Counting stats that add across seasons (passing Yds_1 is sack yards)
+SUM_COLUMNS = {
+    "receiving": ["G", "GS", "Tgt", "Rec", "Yds", "TD", "1D", "Fmb"],
+    "rushing": ["G", "GS", "Att", "Yds", "TD", "1D", "Fmb"],
+    "passing": ["G", "GS", "Cmp", "Att", "Yds", "TD", "Int", "1D", "Sk", "Yds_1"],
+}
+
+MAX_COLUMNS = ["Lng"]
+
+# Percentages PFR reports per play, re-weighted by their volume column
+WEIGHTED_COLUMNS = {
+    "receiving": {"Succ%": "Tgt"},
+    "rushing": {"Succ%": "Att"},
+    "passing": {"Succ%": "Att"},
+}
+
+# Rate -> (numerator, denominator, scale), recomputed from the summed stats
+RATE_COLUMNS = {
+    "receiving": {
+        "Ctch%": ("Rec", "Tgt", 100), "Y/R": ("Yds", "Rec", 1), "Y/Tgt": ("Yds", "Tgt", 1),
+        "R/G": ("Rec", "G", 1), "Y/G": ("Yds", "G", 1),
+    },
+    "rushing": {
+        "Y/A": ("Yds", "Att", 1), "Y/G": ("Yds", "G", 1), "A/G": ("Att", "G", 1),
+    },
+    "passing": {
+        "Cmp%": ("Cmp", "Att", 100), "TD%": ("TD", "Att", 100), "Int%": ("Int", "Att", 100),
+        "Y/A": ("Yds", "Att", 1), "Y/C": ("Yds", "Cmp", 1), "Y/G": ("Yds", "G", 1),
+    },
+}
+
+
+def season_key(year: str, season_type: str) -> str:
+    return f"{year}-{season_type}"
+
+
+def season_specs(year: str, season_type: str) -> List[Dict[str, str]]:
+    """The receiving, passing and rushing files that make up one season"""
+    return [spec for spec in PFR_DATA_FILES if spec["year"] == year and spec["seasonType"] == season_type]
+
+
+def season_sources(year: str, season_type: str, data_dir: Path = DATA_DIR) -> Dict[str, Optional[str]]:
+    """Content hash of each source file of a season (None when missing)"""
+    hashes = {}
+    for spec in season_specs(year, season_type):
+        path = find_data_file(spec["fileName"], data_dir)
+        hashes[spec["fileName"]] = file_hash(str(path)) if path else None
+    return hashes
+
+
+def _add(target: Dict[str, float], key: str, value: Any):
+    if isinstance(value, (int, float)):
+        target[key] = target.get(key, 0) + value
+
+
+def aggregate_season(year: str, season_type: str, data_dir: Path = DATA_DIR) -> Dict[str, Any]:
+    """
+    Summable partials for every player in one season, keyed by PFR player code
+    Multi-team players contribute their combined 2TM/3TM line once; the splits only add teams
+    """
+    players: Dict[str, Dict[str, Any]] = {}
+
+    for spec in season_specs(year, season_type):
+        path = find_data_file(spec["fileName"], data_dir)
+        if path is None:
+            continue
+        headers, rows = read_pfr_csv(path)
+        data = to_columns(headers, rows)["data"]
+        table = spec["statType"]
+        seen = set()
+
+        for i, code in enumerate(data["PlayerID"]):
+            if not code:
+                continue
+            player = players.setdefault(code, {"name": data["Player"][i], "position": None,
+                                               "teams": [], "tables": {}})
+            team = data["Team"][i]
+            if team and not COMBINED_TEAM_PATTERN.match(team) and team not in player["teams"]:
+                player["teams"].append(team)
+            if code in seen:
+                continue
+            seen.add(code)
+            player["position"] = player["position"] or data.get("Pos", [None] * len(rows))[i]
+
+            sums: Dict[str, float] = {}
+            for key in SUM_COLUMNS[table]:
+                if key in data:
+                    _add(sums, key, data[key][i])
+            for key in MAX_COLUMNS:
+                if key in data and isinstance(data[key][i], (int, float)):
+                    sums[key] = data[key][i]
+            for key, weight in WEIGHTED_COLUMNS[table].items():
+                value, volume = data.get(key, [None] * len(rows))[i], sums.get(weight, 0)
+                if isinstance(value, (int, float)) and volume:
+                    sums[f"{key}*{weight}"] = value * volume
+                    sums[f"{key}:{weight}"] = volume
+            player["tables"][table] = sums
+
+    return {
+        "version": ROLLUP_VERSION,
+        "year": year,
+        "seasonType": season_type,
+        "sources": season_sources(year, season_type, data_dir),
+        "players": players,
+    }
+
+
+def merge_sums(parts: List[Dict[str, Dict[str, float]]]) -> Dict[str, Dict[str, float]]:
+    """Add per-table partials together (max for longest plays)"""
+    merged: Dict[str, Dict[str, float]] = {}
+    for tables in parts:
+        for table, sums in tables.items():
+            target = merged.setdefault(table, {})
+            for key, value in sums.items():
+                if key in MAX_COLUMNS:
+                    target[key] = max(target.get(key, value), value)
+                else:
+                    target[key] = target.get(key, 0) + value
+    return merged
+
+
+def passer_rating(cmp: float, att: float, yds: float, td: float, ints: float) -> Optional[float]:
+    """NFL passer rating from counting stats"""
+    if not att:
+        return None
+    clamp = lambda value: max(0.0, min(2.375, value))
+    parts = [
+        clamp((cmp / att - 0.3) * 5),
+        clamp((yds / att - 3) * 0.25),
+        clamp(td / att * 20),
+        clamp(2.375 - ints / att * 25),
+    ]
+    return round(sum(parts) / 6 * 100, 1)
+
+
+def finalize(tables: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, Any]]:
+    """Counting stats plus rates and volume-weighted percentages recomputed from the sums"""
+    result = {}
+    for table, sums in tables.items():
+        stats: Dict[str, Any] = {key: value for key, value in sums.items() if "*" not in key and ":" not in key}
+        for key, (numerator, denominator, scale) in RATE_COLUMNS[table].items():
+            if sums.get(denominator):
+                stats[key] = round(sums.get(numerator, 0) / sums[denominator] * scale, 1)
+        for key, weight in WEIGHTED_COLUMNS[table].items():
+            volume = sums.get(f"{key}:{weight}")
+            if volume:
+                stats[key] = round(sums[f"{key}*{weight}"] / volume, 1)
+        if table == "passing":
+            rating = passer_rating(sums.get("Cmp", 0), sums.get("Att", 0), sums.get("Yds", 0),
+                                   sums.get("TD", 0), sums.get("Int", 0))
+            if rating is not None:
+                stats["Rate"] = rating
+        result[table] = stats
+    return result
+
+
+def load_season(year: str, season_type: str, data_dir: Path = DATA_DIR,
+                cache_dir: Path = ROLLUP_DIR, force: bool = False) -> Tuple[Dict[str, Any], bool]:
+    """Cached season partials, rebuilt when any source hash changed; returns (partial, rebuilt)"""
+    path = cache_dir / "seasons" / f"{season_key(year, season_type)}.json"
+    if not force and path.exists():
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if (cached.get("version") == ROLLUP_VERSION
+                    and cached.get("sources") == season_sources(year, season_type, data_dir)):
+                return cached, False
+        except (OSError, ValueError):
+            pass
+
+    partial = aggregate_season(year, season_type, data_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(partial, f, separators=(",", ":"), ensure_ascii=False)
+    return partial, True
+
+
+def build_history(partials: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Per-player seasons (regular, playoff, combined) and career rollups from season partials"""
+    grouped: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for partial in partials:
+        for code, player in partial["players"].items():
+            grouped.setdefault(code, {}).setdefault(partial["year"], {})[partial["seasonType"]] = player
+
+    history = {}
+    for code, years in grouped.items():
+        seasons = {}
+        career_parts: Dict[str, List[Dict[str, Any]]] = {season_type: [] for season_type in SEASON_TYPES}
+        name = position = None
+
+        for year in sorted(years, reverse=True):
+            entry = {}
+            for season_type in SEASON_TYPES:
+                player = years[year].get(season_type)
+                if player is None:
+                    continue
+                name = name or player["name"]
+                position = position or player["position"]
+                entry[season_type] = {"teams": player["teams"], **finalize(player["tables"])}
+                career_parts[season_type].append(player["tables"])
+            entry["combined"] = finalize(merge_sums([years[year][t]["tables"] for t in SEASON_TYPES
+                                                      if t in years[year]]))
+            seasons[year] = entry
+
+        career = {season_type: finalize(merge_sums(parts)) for season_type, parts in career_parts.items() if parts}
+        career["combined"] = finalize(merge_sums([tables for parts in career_parts.values() for tables in parts]))
+        history[code] = {"name": name, "position": position, "seasons": seasons, "career": career}
+
+    return history
+
+
+def build_rollups(data_dir: Path = DATA_DIR, cache_dir: Path = ROLLUP_DIR,
+                  force: bool = False) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+    """Refresh stale seasons, then write the full player history; returns (history, rebuilt seasons)"""
+    partials = []
+    rebuilt = []
+    seasons = sorted({(spec["year"], spec["seasonType"]) for spec in PFR_DATA_FILES}, reverse=True)
+    for year, season_type in seasons:
+        partial, changed = load_season(year, season_type, data_dir, cache_dir, force)
+        partials.append(partial)
+        if changed:
+            rebuilt.append(season_key(year, season_type))
+
+    history = build_history(partials)
+    with open(cache_dir / HISTORY_FILE, "w", encoding="utf-8") as f:
+        json.dump(history, f, separators=(",", ":"), ensure_ascii=False)
+    return history, rebuilt
+
+
+def main():
+    """Refresh rollups; pass PFR codes (e.g. ChasJa00) to print their history"""
+    print("Player Rollups")
+    print("=" * 50)
+
+    force = "--force" in sys.argv[1:]
+    history, rebuilt = build_rollups(force=force)
+
+    print(f"  ✅ {len(history)} players rolled up")
+    print(f"  Rebuilt seasons: {', '.join(rebuilt) if rebuilt else 'none (cache up to date)'}")
+
+    for code in (arg for arg in sys.argv[1:] if not arg.startswith("--")):
+        player = history.get(code)
+        if player is None:
+            print(f"\n  ⚠️  Unknown player code {code}")
+            continue
+        print(f"\n  {player['name']} ({code}) career, regular + playoff:")
+        for table, stats in player["career"]["combined"].items():
+            print(f"    {table}: {stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Fantasy Scoring Engine
+Computes fantasy points from raw PFR stat columns for every player-season and scoring profile
+"""
+
+import sys
+from array import array
+from typing import Dict, List, Any, Optional, Tuple
+
+from instrument import span
+from player_store import PlayerStore, SEASON_TYPES, load_store
+
+# Stat name -> (table, column) in the player store
+STAT_SOURCES = {
+    "pass_yds": ("passing", "Yds"),
+    "pass_td": ("passing", "TD"),
+    "int": ("passing", "Int"),
+    "rush_yds": ("rushing", "Yds"),
+    "rush_td": ("rushing", "TD"),
+    "rec": ("receiving", "Rec"),
+    "rec_yds": ("receiving", "Yds"),
+    "rec_td": ("receiving", "TD"),
+    # PFR repeats total fumbles in the rushing and receiving tables; count them once
+    "fumbles": ("rushing", "Fmb"),
+}
+
+# Derived stats that only count for one position (e.g. TE premium receptions)
+POSITION_STATS = {
+    "te_rec": ("TE", "rec"),
+}
+
+# FantasyPros columns that map onto scoring stats, for players with no PFR season to score
+# (FantasyPros exports cover WR and RB and carry no touchdowns)
+FANTASY_PROS_STATS = {
+    "WR": {"rec": "REC", "rec_yds": "YDS"},
+    "RB": {"rec": "REC", "rush_yds": "YDS"},
+}
+
+BASE_SCORING = {
+    "pass_yds": 0.04,
+    "pass_td": 4.0,
+    "int": -2.0,
+    "rush_yds": 0.1,
+    "rush_td": 6.0,
+    "rec_yds": 0.1,
+    "rec_td": 6.0,
+    "fumbles": -2.0,
+}
+
+SCORING_PROFILES: Dict[str, Dict[str, float]] = {
+    "standard": dict(BASE_SCORING),
+    "half_ppr": dict(BASE_SCORING, rec=0.5),
+    "ppr": dict(BASE_SCORING, rec=1.0),
+    "six_pt_pass_td": dict(BASE_SCORING, rec=1.0, pass_td=6.0),
+    "te_premium": dict(BASE_SCORING, rec=1.0, te_rec=0.5),
+}
+
+
+class ScoredSeasons:
+    """Fantasy points for every player-season, one points column per scoring profile"""
+
+    def __init__(self, keys: List[Tuple[int, int, int]], positions: List[str], games: array,
+                 points: Dict[str, array]):
+        self.keys = keys
+        self.positions = positions
+        self.games = games
+        self.points = points
+        self._rows = {key: row for row, key in enumerate(keys)}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def row_index(self, player: int, year: int, season_type: str = "regular") -> Optional[int]:
+        return self._rows.get((player, year, SEASON_TYPES.index(season_type)))
+
+    def per_game(self, profile: str) -> array:
+        """Points per game for a profile (0 where no games were played)"""
+        return array("d", (p / g if g > 0 else 0.0 for p, g in zip(self.points[profile], self.games)))
+
+    def leaderboard(self, profile: str, year: int, season_type: str = "regular",
+                    position: Optional[str] = None, limit: int = 25) -> List[Tuple[int, float]]:
+        """Top (player_id, points) pairs for a season under a profile"""
+        season_code = SEASON_TYPES.index(season_type)
+        points = self.points[profile]
+        rows = [
+            row for row, (_, row_year, row_season) in enumerate(self.keys)
+            if row_year == year and row_season == season_code
+            and (position is None or self.positions[row] == position)
+        ]
+        rows.sort(key=points.__getitem__, reverse=True)
+        return [(self.keys[row][0], round(points[row], 2)) for row in rows[:limit]]
+
+
+def table_stat_columns(table: str) -> Dict[str, str]:
+    """Scoring stat -> column for the stats STAT_SOURCES takes from one table"""
+    return {stat: column for stat, (source, column) in STAT_SOURCES.items() if source == table}
+
+
+def score_line(line: Dict[str, Any], columns: Dict[str, str], position: Optional[str],
+               weights: Dict[str, float]) -> float:
+    """
+    Points from a single stat line under one profile, given its stat -> column mapping
+    (table_stat_columns or FANTASY_PROS_STATS); a table's line scores only what that table contributes
+    """
+    stats = {stat: line.get(column) or 0.0 for stat, column in columns.items()}
+    for stat, (stat_position, base) in POSITION_STATS.items():
+        if base in stats:
+            stats[stat] = stats[base] if position == stat_position else 0.0
+    return sum(weights.get(stat, 0.0) * value for stat, value in stats.items())
+
+
+def build_stat_matrix(store: PlayerStore) -> Tuple[List[Tuple[int, int, int]], List[str], array, Dict[str, array]]:
+    """
+    Align the receiving, rushing and passing tables on (player, year, season_type)
+    Returns the row keys, positions, games played and one array per scoring stat
+    """
+    keys: List[Tuple[int, int, int]] = []
+    rows: Dict[Tuple[int, int, int], int] = {}
+    positions: List[str] = []
+
+    for table_name in ("receiving", "rushing", "passing"):
+        table = store.tables.get(table_name)
+        if table is None:
+            continue
+        for key, row in table.season_rows():
+            if key not in rows:
+                rows[key] = len(keys)
+                keys.append(key)
+                positions.append(store.positions[table.position[row]])
+
+    count = len(keys)
+    games = array("d", [0.0]) * count
+    stats: Dict[str, array] = {}
+
+    for stat, (table_name, column_name) in STAT_SOURCES.items():
+        column = array("d", [0.0]) * count
+        table = store.tables.get(table_name)
+        if table is not None and column_name in table.numeric:
+            source = table.numeric[column_name]
+            for key, row in table.season_rows():
+                value = source[row]
+                if value == value:  # skip NaN
+                    column[rows[key]] = value
+        stats[stat] = column
+
+    for table_name in ("receiving", "rushing", "passing"):
+        table = store.tables.get(table_name)
+        if table is None or "G" not in table.numeric:
+            continue
+        source = table.numeric["G"]
+        for key, row in table.season_rows():
+            value = source[row]
+            target = rows[key]
+            if value == value and value > games[target]:
+                games[target] = value
+
+    for stat, (position, base) in POSITION_STATS.items():
+        base_column = stats[base]
+        stats[stat] = array("d", (v if pos == position else 0.0 for v, pos in zip(base_column, positions)))
+
+    return keys, positions, games, stats
+
+
+def score_matrix(stats: Dict[str, array], profiles: Dict[str, Dict[str, float]]) -> Dict[str, array]:
+    """
+    Batched scoring: points[profile] = sum(weight * stat column)
+    Each stat column is read once and accumulated into every profile that weights it
+    """
+    unknown = {stat for weights in profiles.values() for stat in weights} - set(stats)
+    if unknown:
+        raise ValueError(f"Unknown scoring stats: {', '.join(sorted(unknown))}")
+
+    count = len(next(iter(stats.values()))) if stats else 0
+    points = {name: array("d", [0.0]) * count for name in profiles}
+
+    for stat, column in stats.items():
+        for name, weights in profiles.items():
+            weight = weights.get(stat, 0.0)
+            if weight:
+                acc = points[name]
+                points[name] = array("d", map(lambda total, value: total + weight * value, acc, column))
+
+    return points
+
+
+def score_seasons(store: PlayerStore, profiles: Optional[Dict[str, Dict[str, float]]] = None) -> ScoredSeasons:
+    """Score every player-season in the store under every profile in one pass"""
+    profiles = profiles or SCORING_PROFILES
+    with span("score", profiles=len(profiles)) as stage:
+        keys, positions, games, stats = build_stat_matrix(store)
+        scored = ScoredSeasons(keys, positions, games, score_matrix(stats, profiles))
+        stage.add(rows=len(keys))
+    return scored
+
+
+def main():
+    """Print 2024 regular-season leaders for each scoring profile"""
+    print("Fantasy Scoring Engine")
+    print("=" * 50)
+
+    store = load_store()
+    scored = score_seasons(store)
+    year = int(sys.argv[1]) if len(sys.argv) > 1 else 2024
+
+    print(f"Scored {len(scored)} player-seasons under {len(SCORING_PROFILES)} profiles")
+
+    for profile in SCORING_PROFILES:
+        print(f"\n{profile} ({year} regular season):")
+        for rank, (player_id, points) in enumerate(scored.leaderboard(profile, year, limit=10), 1):
+            print(f"  {rank:2d}. {store.player_names[player_id]:<25} {points:7.1f}")
+
+
+if __name__ == "__main__":
+    main()
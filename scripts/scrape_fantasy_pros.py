@@ -6,9 +6,27 @@ Fetches NFL player statistics from Fantasy Pros or similar sources
 
 import json
 import csv
+import hashlib
+import io
+import itertools
 import os
+import sys
+import tempfile
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterable, Optional, Sequence, Union
+
+from hashing import file_hash
+from instrument import file_size, span
+
+OUTPUT_DIR = "public/data"
+MANIFEST_FILE = "scrape_manifest.json"
+JSON_FILE = "fantasy_pros_data.json"
+
+# Bump when the output layout changes so every dataset is rebuilt once
+SCHEMA_VERSION = 1
+
+# Rows buffered per writerows() call when streaming
+CSV_CHUNK_SIZE = 5000
 
 # For now, we'll use static data that matches the screenshot format
 # In production, this would scrape from Fantasy Pros or use their API
@@ -238,25 +256,206 @@ def get_sample_rb_data_2024() -> List[Dict[str, Any]]:
         }
     ]
 
-def save_to_csv(data: List[Dict[str, Any]], filename: str):
+def render_csv(data: List[Dict[str, Any]]) -> str:
+    """Render rows to CSV text exactly as save_to_csv writes them"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(data[0].keys()))
+    writer.writeheader()
+    writer.writerows(data)
+    return buffer.getvalue()
+
+def save_to_csv(data: List[Dict[str, Any]], filename: str, output_dir: str = OUTPUT_DIR):
     """Save data to CSV file"""
     if not data:
         print(f"No data to save for {filename}")
         return
     
-    output_dir = "public/data"
+    count = stream_to_csv(data, filename, output_dir)
+    
+    print(f"Saved {count} rows to {os.path.join(output_dir, filename)}")
+
+def stream_to_csv(rows: Iterable[Union[Dict[str, Any], Sequence[Any]]], filename: str,
+                  output_dir: str = OUTPUT_DIR, fieldnames: Optional[Sequence[str]] = None,
+                  chunk_size: int = CSV_CHUNK_SIZE, atomic: bool = False) -> int:
+    """
+    Write rows from any iterable or generator in constant memory
+    Dict rows take their header from the first row unless fieldnames is given;
+    tuple/list rows require fieldnames. With atomic=True the file is written to a
+    temp file in the same directory and renamed into place when complete.
+    Returns the number of rows written.
+    """
+    iterator = iter(rows)
+    first = next(iterator, None)
+    if first is None and fieldnames is None:
+        return 0
+    
+    dict_rows = isinstance(first, dict)
+    if fieldnames is None:
+        if not dict_rows:
+            raise ValueError("fieldnames are required when rows are tuples or lists")
+        fieldnames = list(first.keys())
+    if first is not None:
+        iterator = itertools.chain([first], iterator)
+    
     os.makedirs(output_dir, exist_ok=True)
     filepath = os.path.join(output_dir, filename)
     
-    # Get column names from first row
-    fieldnames = list(data[0].keys())
+    if atomic:
+        fd, temp_path = tempfile.mkstemp(prefix=f".{filename}.", suffix=".tmp", dir=output_dir)
+        csvfile = os.fdopen(fd, 'w', newline='', buffering=1 << 16)
+    else:
+        temp_path = None
+        csvfile = open(filepath, 'w', newline='', buffering=1 << 16)
     
-    with open(filepath, 'w', newline='') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(data)
+    count = 0
+    try:
+        with csvfile:
+            if dict_rows:
+                writer = csv.DictWriter(csvfile, fieldnames=list(fieldnames))
+                writer.writeheader()
+            else:
+                writer = csv.writer(csvfile)
+                writer.writerow(fieldnames)
+            
+            while True:
+                chunk = list(itertools.islice(iterator, chunk_size))
+                if not chunk:
+                    break
+                writer.writerows(chunk)
+                count += len(chunk)
+        
+        if temp_path is not None:
+            os.replace(temp_path, filepath)
+    except BaseException:
+        if temp_path is not None and os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
     
-    print(f"Saved {len(data)} rows to {filepath}")
+    return count
+
+def content_hash(data: Any) -> str:
+    """Stable hash of scraped source data"""
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+def load_manifest(output_dir: str = OUTPUT_DIR) -> Dict[str, Any]:
+    """Load the per-dataset manifest (empty if missing or unreadable)"""
+    path = os.path.join(output_dir, MANIFEST_FILE)
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_manifest(manifest: Dict[str, Any], output_dir: str = OUTPUT_DIR):
+    """Write the manifest with stable key order so it only diffs on real changes"""
+    path = os.path.join(output_dir, MANIFEST_FILE)
+    with open(path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+def is_up_to_date(entry: Optional[Dict[str, Any]], source_hash: str, filepath: str) -> bool:
+    """True if the dataset was built from the same source and its output is untouched"""
+    return (
+        entry is not None
+        and entry.get("schema_version") == SCHEMA_VERSION
+        and entry.get("source_hash") == source_hash
+        and entry.get("output_hash") == file_hash(filepath)
+    )
+
+def manifest_entry(source_hash: str, filepath: str, row_count: int) -> Dict[str, Any]:
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "source_hash": source_hash,
+        "output_hash": file_hash(filepath),
+        "row_count": row_count,
+    }
+
+def update_csv_dataset(name: str, data: List[Dict[str, Any]], filename: str,
+                       manifest: Dict[str, Any], output_dir: str = OUTPUT_DIR,
+                       force: bool = False) -> bool:
+    """Regenerate one CSV dataset only if its source changed; returns True if the file was written"""
+    filepath = os.path.join(output_dir, filename)
+    source_hash = content_hash(data)
+
+    if not force and is_up_to_date(manifest.get(name), source_hash, filepath):
+        return False
+
+    # Leave byte-identical files alone so mtimes and caches survive a manifest reset
+    existing = file_hash(filepath)
+    rendered = hashlib.sha256(render_csv(data).encode("utf-8")).hexdigest() if data else None
+    written = force or existing != rendered
+    if written:
+        with span("write", file=filename) as stage:
+            save_to_csv(data, filename, output_dir)
+            stage.add(rows=len(data), bytes_written=file_size(filepath))
+
+    manifest[name] = manifest_entry(source_hash, filepath, len(data))
+    return written
+
+def update_json_dataset(datasets: Dict[str, List[Dict[str, Any]]], manifest: Dict[str, Any],
+                        output_dir: str = OUTPUT_DIR, force: bool = False) -> bool:
+    """Regenerate the combined JSON only if any source changed; returns True if the file was written"""
+    filepath = os.path.join(output_dir, JSON_FILE)
+    source_hash = content_hash(datasets)
+
+    if not force and is_up_to_date(manifest.get("json"), source_hash, filepath):
+        return False
+
+    # Keep the previous timestamp when the data itself is unchanged
+    timestamp = datetime.now().isoformat()
+    try:
+        with open(filepath, "r") as f:
+            previous = json.load(f)
+        if all(previous.get(key) == value for key, value in datasets.items()):
+            timestamp = previous.get("timestamp", timestamp)
+    except (OSError, ValueError):
+        previous = None
+
+    json_output = {"timestamp": timestamp}
+    json_output.update(datasets)
+
+    row_count = sum(len(rows) for rows in datasets.values())
+    written = force or previous != json_output
+    if written:
+        os.makedirs(output_dir, exist_ok=True)
+        with span("write", file=JSON_FILE) as stage:
+            with open(filepath, "w") as f:
+                json.dump(json_output, f, indent=2)
+            stage.add(rows=row_count, bytes_written=file_size(filepath))
+
+    manifest["json"] = manifest_entry(source_hash, filepath, row_count)
+    return written
+
+def run_pipeline(output_dir: str = OUTPUT_DIR, force: bool = False) -> List[str]:
+    """Fetch every dataset and rebuild only what changed; returns the names of datasets rewritten"""
+    with span("fetch", source="sample") as stage:
+        datasets = {
+            "wr_2024": get_sample_wr_data_2024(),
+            "rb_2024": get_sample_rb_data_2024(),
+        }
+        stage.add(rows=sum(len(rows) for rows in datasets.values()))
+    csv_files = {
+        "wr_2024": "FantasyPros_WR_2024_Totals_Corrected.csv",
+        "rb_2024": "FantasyPros_RB_2024_Totals_Corrected.csv",
+    }
+
+    manifest = load_manifest(output_dir)
+    previous_manifest = json.loads(json.dumps(manifest))
+    rebuilt = []
+
+    for name, data in datasets.items():
+        if update_csv_dataset(name, data, csv_files[name], manifest, output_dir, force):
+            rebuilt.append(name)
+
+    if update_json_dataset(datasets, manifest, output_dir, force):
+        rebuilt.append("json")
+
+    if manifest != previous_manifest:
+        os.makedirs(output_dir, exist_ok=True)
+        save_manifest(manifest, output_dir)
+
+    return rebuilt
 
 def main():
     """Main function to orchestrate data fetching and saving"""
@@ -265,30 +464,16 @@ def main():
     
     # For now, use sample data
     # In production, this would fetch from Fantasy Pros
-    
-    # Get WR data
-    wr_data_2024 = get_sample_wr_data_2024()
-    save_to_csv(wr_data_2024, "FantasyPros_WR_2024_Totals_Corrected.csv")
-    
-    # Get RB data  
-    rb_data_2024 = get_sample_rb_data_2024()
-    save_to_csv(rb_data_2024, "FantasyPros_RB_2024_Totals_Corrected.csv")
-    
-    # Also save as JSON for easier consumption
-    json_output = {
-        "timestamp": datetime.now().isoformat(),
-        "wr_2024": wr_data_2024,
-        "rb_2024": rb_data_2024
-    }
-    
-    with open("public/data/fantasy_pros_data.json", "w") as f:
-        json.dump(json_output, f, indent=2)
+    force = "--force" in sys.argv[1:]
+    rebuilt = run_pipeline(force=force)
     
     print("\nData scraping complete!")
-    print("Files created:")
-    print("  - FantasyPros_WR_2024_Totals_Corrected.csv")
-    print("  - FantasyPros_RB_2024_Totals_Corrected.csv")
-    print("  - fantasy_pros_data.json")
+    if rebuilt:
+        print("Datasets rebuilt:")
+        for name in rebuilt:
+            print(f"  - {name}")
+    else:
+        print("All datasets up to date, nothing rewritten")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
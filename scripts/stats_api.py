@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+"""
+Local Stats API
+Read-only asyncio HTTP server over the normalized datasets: filter, sort, paginate and project
+rows in memory, with rendered responses cached per query behind strong ETags and gzip
+"""
+
+import argparse
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from email.utils import formatdate
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from ingest_data import (
+    DATA_DIR,
+    PFR_DATA_FILES,
+    FANTASY_PROS_DATA_FILES,
+    find_data_file,
+    normalize_pfr_file,
+    normalize_fantasy_pros_file,
+)
+from query_cache import SourceHashes
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8787
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+
+# Rendered responses kept in memory (each holds the identity and gzip bodies)
+MAX_CACHED_RESPONSES = 2048
+# Bodies smaller than this are sent uncompressed; gzip framing would outweigh the savings
+MIN_GZIP_BYTES = 512
+# A dataset's source file is re-checked for changes at most this often
+RELOAD_CHECK_SECONDS = 1.0
+KEEP_ALIVE_SECONDS = 15
+MAX_HEADER_LINES = 100
+
+QUERY_PARAMS = {"position", "team", "min_targets", "sort", "order", "offset", "limit", "fields"}
+
+STATUS_TEXT = {200: "OK", 206: "Partial Content", 304: "Not Modified", 400: "Bad Request",
+               404: "Not Found", 405: "Method Not Allowed", 416: "Range Not Satisfiable"}
+
+
+class ApiError(Exception):
+    """A request the API refuses, answered with a JSON error body"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class Response:
+    """A rendered body with its strong ETag and precompressed gzip variant"""
+
+    __slots__ = ("status", "body", "gzipped", "etag", "headers")
+
+    def __init__(self, status: int, value: Any, headers: Optional[Dict[str, str]] = None):
+        self.status = status
+        self.body = json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        # mtime=0 keeps the gzip bytes (and so their ETag) identical across renders
+        self.gzipped = gzip.compress(self.body, compresslevel=6, mtime=0) if len(self.body) >= MIN_GZIP_BYTES else None
+        self.etag = '"' + hashlib.sha256(self.body).hexdigest()[:32] + '"'
+        self.headers = headers or {}
+
+    def etag_for(self, encoded: bool) -> str:
+        return self.etag[:-1] + '-gz"' if encoded else self.etag
+
+
+class Dataset:
+    """One normalized file held as columns, with per-column sort orders built on first use"""
+
+    def __init__(self, spec: Dict[str, str], payload: Dict[str, Any], digest: str):
+        self.spec = spec
+        self.digest = digest
+        self.columns = [column["key"] for column in payload["columns"]]
+        self.types = {column["key"]: column["type"] for column in payload["columns"]}
+        self.data = payload["data"]
+        self.row_count = payload["rowCount"]
+        self.checked = time.monotonic()
+        self._orders: Dict[Tuple[str, bool], List[int]] = {}
+
+    @property
+    def name(self) -> str:
+        return os.path.splitext(self.spec["fileName"])[0]
+
+    def describe(self) -> Dict[str, Any]:
+        info = {key: value for key, value in self.spec.items() if key != "fileName"}
+        return {"dataset": self.name, "file": self.spec["fileName"], "rowCount": self.row_count,
+                "columns": [{"key": key, "type": self.types[key]} for key in self.columns], **info}
+
+    def order(self, column: str, descending: bool = False) -> List[int]:
+        """Row indexes sorted by a column, ties in file order and rows without a value last"""
+        key = (column, descending)
+        if key not in self._orders:
+            values = self.data[column]
+            present = [i for i, value in enumerate(values) if value is not None]
+            # sort(reverse=True) is still stable, unlike reversing the ascending order
+            present.sort(key=values.__getitem__, reverse=descending)
+            self._orders[key] = present + [i for i, value in enumerate(values) if value is None]
+        return self._orders[key]
+
+    def select(self, position: Optional[str] = None, team: Optional[str] = None,
+               min_targets: float = 0) -> List[int]:
+        """Row indexes passing the filters, in file order"""
+        rows = range(self.row_count)
+        if position:
+            positions = self.data.get("Pos")
+            if positions is not None:
+                rows = [i for i in rows if positions[i] == position]
+            elif position != self.spec.get("position"):
+                rows = []
+        if team:
+            teams = self.data.get("Team") or [None] * self.row_count
+            rows = [i for i in rows if teams[i] == team]
+        if min_targets:
+            targets = self.data.get("Tgt") or self.data.get("TGT") or [None] * self.row_count
+            rows = [i for i in rows if (targets[i] or 0) >= min_targets]
+        return list(rows)
+
+
+def load_dataset(spec: Dict[str, str], data_dir: Path, hashes: SourceHashes) -> Optional[Dataset]:
+    path = find_data_file(spec["fileName"], data_dir)
+    if path is None:
+        return None
+    normalize = normalize_pfr_file if "statType" in spec else normalize_fantasy_pros_file
+    payload = normalize(spec, data_dir)
+    return Dataset(spec, payload, hashes.get(path)) if payload else None
+
+
+def parse_range(header: str, total: int) -> Tuple[int, int]:
+    """(offset, limit) for a `Range: rows=<first>-<last>` header"""
+    unit, _, span = header.partition("=")
+    first, dash, last = span.strip().partition("-")
+    if unit.strip() != "rows" or not dash or not first.strip().isdigit():
+        raise ApiError(416, f"Unsupported range {header!r}; use rows=<first>-<last>")
+    start = int(first)
+    end = int(last) if last.strip().isdigit() else start + MAX_LIMIT - 1
+    if start >= total or end < start:
+        raise ApiError(416, f"Range {header!r} outside 0-{total - 1}")
+    return start, min(end - start + 1, MAX_LIMIT)
+
+
+class StatsAPI:
+    """
+    Datasets and the response cache; HTTP-agnostic so handlers and tests call `respond()` directly
+    Cache keys are the dataset's content hash plus the canonical query, so a refreshed file
+    serves new ETags while its old responses age out of the LRU
+    """
+
+    def __init__(self, data_dir: Path = DATA_DIR, max_cached: int = MAX_CACHED_RESPONSES):
+        self.data_dir = data_dir
+        self.max_cached = max_cached
+        self.hashes = SourceHashes()
+        self.specs = {os.path.splitext(spec["fileName"])[0].lower(): spec
+                      for spec in PFR_DATA_FILES + FANTASY_PROS_DATA_FILES}
+        self.datasets: Dict[str, Dataset] = {}
+        self._responses: "OrderedDict[Tuple[Any, ...], Response]" = OrderedDict()
+        self.counts = {"requests": 0, "cached": 0, "rendered": 0, "not_modified": 0}
+
+    def load(self, precompute: bool = True) -> int:
+        """Load every dataset; with precompute, render each one's default page up front"""
+        for name, spec in self.specs.items():
+            dataset = load_dataset(spec, self.data_dir, self.hashes)
+            if dataset is not None:
+                self.datasets[name] = dataset
+        if precompute:
+            self.respond("/datasets")
+            for dataset in self.datasets.values():
+                self.respond(f"/datasets/{dataset.name}")
+        return len(self.datasets)
+
+    def dataset(self, name: str) -> Dataset:
+        """A loaded dataset, reloaded when its source file changed since the last check"""
+        key = name.lower()
+        if key not in self.specs:
+            raise ApiError(404, f"Unknown dataset {name!r}")
+        dataset = self.datasets.get(key)
+        now = time.monotonic()
+        if dataset is None or now - dataset.checked >= RELOAD_CHECK_SECONDS:
+            path = find_data_file(self.specs[key]["fileName"], self.data_dir)
+            digest = self.hashes.get(path) if path else None
+            if digest is None:
+                self.datasets.pop(key, None)
+                raise ApiError(404, f"Dataset {name!r} has no data file")
+            if dataset is None or dataset.digest != digest:
+                dataset = load_dataset(self.specs[key], self.data_dir, self.hashes)
+                if dataset is None:
+                    # The file went away (or stopped parsing) between hashing and loading
+                    self.datasets.pop(key, None)
+                    raise ApiError(404, f"Dataset {name!r} has no data file")
+                self.datasets[key] = dataset
+            dataset.checked = now
+        return dataset
+
+    def respond(self, target: str, range_header: Optional[str] = None) -> Response:
+        """Cached response for a request target (path plus query string)"""
+        self.counts["requests"] += 1
+        parts = urlsplit(target)
+        path = parts.path.rstrip("/") or "/"
+        params = dict(parse_qsl(parts.query, keep_blank_values=True))
+
+        if path in ("/", "/datasets"):
+            key: Tuple[Any, ...] = ("index", tuple(sorted((name, dataset.digest) for name, dataset in self.datasets.items())))
+            return self._cached(key, lambda: Response(200, {
+                "datasets": [self.datasets[name].describe() for name in sorted(self.datasets)]}))
+
+        if not path.startswith("/datasets/"):
+            raise ApiError(404, f"No route for {path}")
+        dataset = self.dataset(path[len("/datasets/"):])
+        unknown = set(params) - QUERY_PARAMS
+        if unknown:
+            raise ApiError(400, f"Unknown parameter(s): {', '.join(sorted(unknown))}")
+        key = (dataset.name, dataset.digest, tuple(sorted(params.items())), range_header)
+        return self._cached(key, lambda: self._render(dataset, params, range_header))
+
+    def _cached(self, key: Tuple[Any, ...], render) -> Response:
+        response = self._responses.get(key)
+        if response is not None:
+            self._responses.move_to_end(key)
+            self.counts["cached"] += 1
+            return response
+        response = render()
+        self.counts["rendered"] += 1
+        self._responses[key] = response
+        if len(self._responses) > self.max_cached:
+            self._responses.popitem(last=False)
+        return response
+
+    def _render(self, dataset: Dataset, params: Dict[str, str], range_header: Optional[str]) -> Response:
+        """Filter, sort, paginate and project one query"""
+        try:
+            min_targets = float(params.get("min_targets") or 0)
+            offset = int(params.get("offset") or 0)
+            limit = int(params.get("limit") or DEFAULT_LIMIT)
+        except ValueError:
+            raise ApiError(400, "min_targets, offset and limit must be numbers")
+        if offset < 0 or not 0 < limit <= MAX_LIMIT:
+            raise ApiError(400, f"offset must be >= 0 and limit between 1 and {MAX_LIMIT}")
+
+        fields = [field for field in (params.get("fields") or "").split(",") if field] or dataset.columns
+        missing = [field for field in fields if field not in dataset.types]
+        if missing:
+            raise ApiError(400, f"Unknown field(s): {', '.join(missing)}")
+
+        rows = dataset.select(params.get("position", "").upper() or None,
+                              params.get("team", "").upper() or None, min_targets)
+        sort = params.get("sort")
+        if sort:
+            if sort not in dataset.types:
+                raise ApiError(400, f"Unknown sort column {sort!r}")
+            order = params.get("order", "desc")
+            if order not in ("asc", "desc"):
+                raise ApiError(400, "order must be asc or desc")
+            # Walk the column's prebuilt order and keep the selected rows, missing values last
+            selected = set(rows)
+            rows = [i for i in dataset.order(sort, descending=order == "desc") if i in selected]
+
+        status, headers = 200, {}
+        if range_header:
+            offset, limit = parse_range(range_header, len(rows))
+            status = 206
+            last = min(offset + limit, len(rows)) - 1
+            headers["Content-Range"] = f"rows {offset}-{last}/{len(rows)}"
+
+        page = rows[offset:offset + limit]
+        columns = [dataset.data[field] for field in fields]
+        body = {
+            "dataset": dataset.name,
+            "total": len(rows),
+            "offset": offset,
+            "limit": limit,
+            "fields": fields,
+            "rows": [dict(zip(fields, (column[i] for column in columns))) for i in page],
+        }
+        if offset + limit < len(rows):
+            headers["Link"] = f'<{self._page_link(dataset, params, offset + limit, limit)}>; rel="next"'
+        return Response(status, body, headers)
+
+    @staticmethod
+    def _page_link(dataset: Dataset, params: Dict[str, str], offset: int, limit: int) -> str:
+        query = {**params, "offset": str(offset), "limit": str(limit)}
+        return f"/datasets/{dataset.name}?" + urlencode(sorted(query.items()))
+
+    def stats(self) -> Dict[str, int]:
+        return {**self.counts, "cachedResponses": len(self._responses), "datasets": len(self.datasets)}
+
+
+def render_http(api: StatsAPI, method: str, target: str, headers: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+    """(status, headers, body) for one request, applying ETag/304 and content negotiation"""
+    if method not in ("GET", "HEAD"):
+        return _error(405, f"{method} not allowed", {"Allow": "GET, HEAD"})
+    try:
+        response = api.respond(target, headers.get("range"))
+    except ApiError as e:
+        return _error(e.status, str(e))
+
+    encoded = response.gzipped is not None and "gzip" in headers.get("accept-encoding", "")
+    etag = response.etag_for(encoded)
+    out = {"ETag": etag, "Vary": "Accept-Encoding", "Cache-Control": "no-cache", **response.headers}
+    if response.status == 200:
+        out["Accept-Ranges"] = "rows"
+
+    # Either representation's tag counts: the rows behind them are the same
+    tags = {tag.strip() for tag in headers.get("if-none-match", "").split(",")}
+    if "*" in tags or etag in tags or response.etag_for(not encoded) in tags:
+        api.counts["not_modified"] += 1
+        return 304, out, b""
+
+    out["Content-Type"] = "application/json; charset=utf-8"
+    if encoded:
+        out["Content-Encoding"] = "gzip"
+        return response.status, out, response.gzipped
+    return response.status, out, response.body
+
+
+def _error(status: int, message: str, headers: Optional[Dict[str, str]] = None) -> Tuple[int, Dict[str, str], bytes]:
+    body = json.dumps({"error": message}).encode("utf-8")
+    return status, {"Content-Type": "application/json; charset=utf-8", **(headers or {})}, body
+
+
+async def handle_connection(api: StatsAPI, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """Serve keep-alive HTTP/1.1 requests on one connection until it closes or idles out"""
+    try:
+        while True:
+            try:
+                request_line = await asyncio.wait_for(reader.readline(), KEEP_ALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                break
+            if not request_line.strip():
+                break
+            try:
+                method, target, version = request_line.decode("latin-1").split()
+            except ValueError:
+                break
+
+            headers: Dict[str, str] = {}
+            for _ in range(MAX_HEADER_LINES):
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            status, out, body = render_http(api, method, target, headers)
+            keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+            lines = [f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}",
+                     f"Date: {formatdate(usegmt=True)}",
+                     f"Content-Length: {len(body)}",
+                     f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+            lines += [f"{name}: {value}" for name, value in out.items()]
+            writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+            if method != "HEAD":
+                writer.write(body)
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+        # Cancellation (server shutdown) ends the connection like a client close
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(api: StatsAPI, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> asyncio.AbstractServer:
+    return await asyncio.start_server(lambda reader, writer: handle_connection(api, reader, writer), host, port)
+
+
+class ApiServer:
+    """Runs the API on its own event loop thread, for notebooks and tests (port 0 picks a free port)"""
+
+    def __init__(self, api: StatsAPI, host: str = DEFAULT_HOST, port: int = 0):
+        self.api = api
+        self.loop = asyncio.new_event_loop()
+        self.server = self.loop.run_until_complete(serve(api, host, port))
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "ApiServer":
+        self.thread.start()
+        return self
+
+    async def _shutdown(self):
+        self.server.close()
+        connections = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in connections:
+            task.cancel()
+        await asyncio.gather(*connections, return_exceptions=True)
+
+    def __exit__(self, *exc):
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+
+def main():
+    """Load the datasets and serve them until interrupted"""
+    parser = argparse.ArgumentParser(description="Read-only stats API over the normalized datasets")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+
+    print("Local Stats API")
+    print("=" * 50)
+
+    start = time.perf_counter()
+    api = StatsAPI()
+    count = api.load()
+    print(f"  ✅ {count} datasets loaded and precomputed in {time.perf_counter() - start:.2f}s")
+    print(f"  🌐 http://{args.host}:{args.port}/datasets/pff-nfl-regular-receiving-2024"
+          f"?position=WR&min_targets=80&sort=Y/Tgt&fields=Player,Team,Tgt,Y/Tgt&limit=10")
+
+    async def run():
+        server = await serve(api, args.host, args.port)
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        print(f"\n  {api.stats()}")
+
+
+if __name__ == "__main__":
+    main()
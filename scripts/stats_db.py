@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+SQLite Stats Database
+Loads every PFR and FantasyPros CSV into normalized, indexed SQLite tables, reloading only
+the files whose contents changed, so ad-hoc questions run as SQL
+"""
+
+import argparse
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+
+from hashing import file_hash
+from ingest_data import (
+    DATA_DIR,
+    PFR_DATA_FILES,
+    FANTASY_PROS_DATA_FILES,
+    PROJECT_ROOT,
+    find_data_file,
+    read_pfr_csv,
+    read_fantasy_pros_csv,
+    to_columns,
+)
+from name_resolver import build_resolver
+
+DB_FILE = DATA_DIR / "stats.db"
+
+# Identify the row rather than describe it; stored as foreign keys instead of stat columns
+KEY_COLUMNS = {"Player", "Team", "PlayerID"}
+COMBINED_TEAM_PATTERN = re.compile(r"^\dTM$")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    source_id INTEGER PRIMARY KEY,
+    file_name TEXT NOT NULL UNIQUE,
+    hash TEXT NOT NULL,
+    row_count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS players (
+    player_id INTEGER PRIMARY KEY,
+    code TEXT UNIQUE,
+    name TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_players_name ON players (name);
+CREATE TABLE IF NOT EXISTS teams (
+    team_id INTEGER PRIMARY KEY,
+    code TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS seasons (
+    year INTEGER NOT NULL,
+    season_type TEXT NOT NULL,
+    PRIMARY KEY (year, season_type)
+);
+"""
+
+EXAMPLE_QUERY = """
+SELECT p.name, r.year, t.code AS team, r."Tgt", r."Y/Tgt"
+FROM receiving r JOIN players p USING (player_id) JOIN teams t USING (team_id)
+WHERE r.season_type = 'regular' AND r.split = 0 AND r."Tgt" >= 80
+ORDER BY r."Y/Tgt" DESC LIMIT 10
+"""
+
+
+def quote(identifier: str) -> str:
+    """SQL identifier for a CSV header such as Y/Tgt or 1D"""
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def file_jobs() -> List[Tuple[str, Dict[str, str], str]]:
+    """(table, spec, season type) for every data file, PFR first so FantasyPros names can resolve"""
+    jobs = [(spec["statType"], spec, spec["seasonType"]) for spec in PFR_DATA_FILES]
+    jobs += [(f"fantasypros_{spec['kind'].lower()}", spec, "regular") for spec in FANTASY_PROS_DATA_FILES]
+    return jobs
+
+
+def connect(path: Path = DB_FILE) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def ensure_table(conn: sqlite3.Connection, table: str, columns: List[Dict[str, str]]):
+    """Create a stat table with its indexes, adding any stat columns it does not have yet"""
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {table} (
+            player_id INTEGER NOT NULL REFERENCES players (player_id),
+            team_id INTEGER REFERENCES teams (team_id),
+            year INTEGER NOT NULL,
+            season_type TEXT NOT NULL,
+            split INTEGER NOT NULL DEFAULT 0,
+            source_id INTEGER NOT NULL REFERENCES sources (source_id),
+            FOREIGN KEY (year, season_type) REFERENCES seasons (year, season_type)
+        )""")
+    conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_player ON {table} (player_id, year, season_type)")
+    conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_team ON {table} (team_id, year)")
+    conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_source ON {table} (source_id)")
+
+    existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+    for column in columns:
+        if column["key"] not in existing and column["key"] not in KEY_COLUMNS:
+            kind = "REAL" if column["type"] == "number" else "TEXT"
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {quote(column['key'])} {kind}")
+
+
+class Loader:
+    """Loads data files into an open connection, reusing player/team IDs already in the database"""
+
+    def __init__(self, conn: sqlite3.Connection, data_dir: Path = DATA_DIR):
+        self.conn = conn
+        self.data_dir = data_dir
+        self.players = {code: player_id for code, player_id in conn.execute(
+            "SELECT code, player_id FROM players WHERE code IS NOT NULL")}
+        self.unmatched = {name: player_id for name, player_id in conn.execute(
+            "SELECT name, player_id FROM players WHERE code IS NULL")}
+        self.teams = {code: team_id for code, team_id in conn.execute("SELECT code, team_id FROM teams")}
+        self._resolver = None
+
+    def team_id(self, code: Optional[str]) -> Optional[int]:
+        if not code:
+            return None
+        if code not in self.teams:
+            self.teams[code] = self.conn.execute("INSERT INTO teams (code) VALUES (?)", (code,)).lastrowid
+        return self.teams[code]
+
+    def player_id(self, code: Optional[str], name: str) -> int:
+        if code:
+            if code not in self.players:
+                self.players[code] = self.conn.execute(
+                    "INSERT INTO players (code, name) VALUES (?, ?)", (code, name)).lastrowid
+            return self.players[code]
+        if name not in self.unmatched:
+            self.unmatched[name] = self.conn.execute(
+                "INSERT INTO players (code, name) VALUES (NULL, ?)", (name,)).lastrowid
+        return self.unmatched[name]
+
+    def resolve(self, name: str, team: Optional[str], year: int, position: str) -> Optional[str]:
+        """PFR code for a FantasyPros name (the resolver is only built when a FantasyPros file loads)"""
+        if self._resolver is None:
+            self._resolver = build_resolver(self.data_dir)
+        match = self._resolver.resolve(name, team, year, position)
+        return match["code"] if match else None
+
+    def load_file(self, table: str, spec: Dict[str, str], season_type: str, path: Path, digest: str) -> int:
+        """Replace one file's rows in a single transaction; returns the row count"""
+        fantasy_pros = table.startswith("fantasypros")
+        headers, rows = (read_fantasy_pros_csv if fantasy_pros else read_pfr_csv)(path)
+        payload = to_columns(headers, rows)
+        data = payload["data"]
+        year = int(spec["year"])
+        stat_keys = [column["key"] for column in payload["columns"] if column["key"] not in KEY_COLUMNS]
+
+        with self.conn:
+            ensure_table(self.conn, table, payload["columns"])
+            self.conn.execute("INSERT OR IGNORE INTO seasons (year, season_type) VALUES (?, ?)", (year, season_type))
+            row = self.conn.execute("SELECT source_id FROM sources WHERE file_name = ?", (spec["fileName"],)).fetchone()
+            if row:
+                source_id = row[0]
+                self.conn.execute(f"DELETE FROM {table} WHERE source_id = ?", (source_id,))
+                self.conn.execute("UPDATE sources SET hash = ?, row_count = ? WHERE source_id = ?",
+                                  (digest, len(rows), source_id))
+            else:
+                source_id = self.conn.execute("INSERT INTO sources (file_name, hash, row_count) VALUES (?, ?, ?)",
+                                              (spec["fileName"], digest, len(rows))).lastrowid
+
+            records = []
+            seen = set()
+            for i, name in enumerate(data["Player"]):
+                team = data["Team"][i]
+                if fantasy_pros:
+                    code = self.resolve(name, team, year, spec["position"])
+                else:
+                    code = data["PlayerID"][i]
+                player_id = self.player_id(code, name)
+                # Multi-team players: the 2TM/3TM line (listed first) is the season total, the rest are splits
+                split = 1 if player_id in seen and not COMBINED_TEAM_PATTERN.match(team or "") else 0
+                seen.add(player_id)
+                records.append((player_id, self.team_id(team), year, season_type, split, source_id,
+                                *(data[key][i] for key in stat_keys)))
+
+            columns = ["player_id", "team_id", "year", "season_type", "split", "source_id"] + stat_keys
+            placeholders = ", ".join("?" for _ in columns)
+            self.conn.executemany(
+                f"INSERT INTO {table} ({', '.join(quote(c) for c in columns)}) VALUES ({placeholders})", records)
+        return len(records)
+
+    def remove_file(self, table: str, file_name: str):
+        """Drop the rows of a data file that no longer exists"""
+        with self.conn:
+            row = self.conn.execute("SELECT source_id FROM sources WHERE file_name = ?", (file_name,)).fetchone()
+            if row:
+                if self.conn.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (table,)).fetchone():
+                    self.conn.execute(f"DELETE FROM {table} WHERE source_id = ?", row)
+                self.conn.execute("DELETE FROM sources WHERE source_id = ?", row)
+
+
+def build_database(db_path: Path = DB_FILE, data_dir: Path = DATA_DIR, force: bool = False) -> Dict[str, List[str]]:
+    """Bring the database up to date with the data files; returns loaded, skipped and removed file names"""
+    conn = connect(db_path)
+    try:
+        loader = Loader(conn, data_dir)
+        hashes = dict(conn.execute("SELECT file_name, hash FROM sources"))
+        result: Dict[str, List[str]] = {"loaded": [], "skipped": [], "removed": []}
+        # FantasyPros names resolve against the PFR files, so any PFR change re-resolves every FantasyPros file
+        pfr_changed = False
+
+        for table, spec, season_type in file_jobs():
+            name = spec["fileName"]
+            fantasy_pros = table.startswith("fantasypros")
+            path = find_data_file(name, data_dir)
+            if path is None:
+                if name in hashes:
+                    loader.remove_file(table, name)
+                    result["removed"].append(name)
+                    pfr_changed = pfr_changed or not fantasy_pros
+                continue
+            digest = file_hash(str(path))
+            if not force and hashes.get(name) == digest and not (fantasy_pros and pfr_changed):
+                result["skipped"].append(name)
+                continue
+            loader.load_file(table, spec, season_type, path, digest)
+            result["loaded"].append(name)
+            pfr_changed = pfr_changed or not fantasy_pros
+
+        conn.execute("ANALYZE")
+        return result
+    finally:
+        conn.close()
+
+
+def query(conn: sqlite3.Connection, sql: str, params: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+    """Run SQL and return rows as dicts"""
+    cursor = conn.execute(sql, params)
+    names = [description[0] for description in cursor.description]
+    return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+
+def main():
+    """Refresh the database, then run --sql (default: top 10 Y/Tgt with 80+ targets across all years)"""
+    parser = argparse.ArgumentParser(description="Load every CSV into SQLite and run ad-hoc SQL")
+    parser.add_argument("--sql", default=EXAMPLE_QUERY, help="query to run after the refresh")
+    parser.add_argument("--force", action="store_true", help="reload every file")
+    args = parser.parse_args()
+
+    print("SQLite Stats Database")
+    print("=" * 50)
+
+    start = time.perf_counter()
+    result = build_database(force=args.force)
+    elapsed = time.perf_counter() - start
+    print(f"  ✅ Loaded {len(result['loaded'])}, unchanged {len(result['skipped'])}, "
+          f"removed {len(result['removed'])} files in {elapsed:.2f}s")
+    print(f"  📄 {DB_FILE.relative_to(PROJECT_ROOT)}")
+
+    conn = connect()
+    try:
+        start = time.perf_counter()
+        rows = query(conn, args.sql)
+        elapsed = (time.perf_counter() - start) * 1000
+    finally:
+        conn.close()
+
+    print(f"\n  {len(rows)} rows in {elapsed:.2f} ms")
+    for row in rows:
+        print("    " + "  ".join(f"{value}" for value in row.values()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Team-Context Metrics
+Groups the PFR receiving and rushing files by (Team, year, season type) to derive each
+player's share of team volume, turns the FantasyPros charting fields into rates, and writes
+both as precomputed column sidecars aligned with the source rows
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+from ingest_data import (
+    DATA_DIR,
+    PFR_DATA_FILES,
+    FANTASY_PROS_DATA_FILES,
+    PROJECT_ROOT,
+    normalize_pfr_file,
+    normalize_fantasy_pros_file,
+)
+
+TEAM_METRICS_DIR = DATA_DIR / "team_metrics"
+
+COMBINED_TEAM_PATTERN = re.compile(r"^\dTM$")
+
+# Output column -> source column summed per team, as a percentage of the team total
+SHARE_COLUMNS = {
+    "receiving": {"TgtShare": "Tgt", "RecShare": "Rec", "RecYdsShare": "Yds", "RecTDShare": "TD"},
+    "rushing": {"CarryShare": "Att", "RushYdsShare": "Yds", "RushTDShare": "TD"},
+}
+
+# FantasyPros charting fields as rates: output -> (numerator, denominator, scale)
+FANTASY_PROS_RATES = {
+    "aDOT": ("AIR", "TGT", 1),
+    "YAC/R": ("YAC", "REC", 1),
+    "Catchable%": ("CATCHABLE", "TGT", 100),
+    "Drop%": ("DROP", "CATCHABLE", 100),
+    "RZTgt%": ("RZ TGT", "TGT", 100),
+}
+
+
+def _ratio(scale: float, digits: int = 1):
+    def ratio(numerator: Optional[float], denominator: Optional[float]) -> Optional[float]:
+        if numerator is None or not denominator:
+            return None
+        return round(numerator / denominator * scale, digits)
+    return ratio
+
+
+def group_keys(teams: List[Optional[str]]) -> List[Optional[str]]:
+    """Team of each row for grouping; combined 2TM/3TM lines are left out (their splits count instead)"""
+    return [None if not team or COMBINED_TEAM_PATTERN.match(team) else team for team in teams]
+
+
+def team_totals(keys: List[Optional[str]], values: List[Optional[float]]) -> Dict[str, float]:
+    """Sum of a column per team in one pass"""
+    totals: Dict[str, float] = {}
+    for key, value in zip(keys, values):
+        if key is not None and value is not None:
+            totals[key] = totals.get(key, 0) + value
+    return totals
+
+
+def share_columns(payload: Dict[str, Any]) -> Tuple[Dict[str, List[Optional[float]]], Dict[str, Dict[str, float]]]:
+    """
+    Percent-of-team columns for a PFR receiving or rushing payload, aligned with its rows
+    Returns (columns, team totals); 2TM/3TM rows get None
+    """
+    data = payload["data"]
+    keys = group_keys(data["Team"])
+    percent = _ratio(100)
+    columns: Dict[str, List[Optional[float]]] = {}
+    totals: Dict[str, Dict[str, float]] = {}
+
+    for output, source in SHARE_COLUMNS[payload["statType"]].items():
+        if source not in data:
+            continue
+        sums = team_totals(keys, data[source])
+        totals[source] = sums
+        denominators = [sums.get(key) if key is not None else None for key in keys]
+        columns[output] = list(map(percent, data[source], denominators))
+
+    return columns, totals
+
+
+def rate_columns(payload: Dict[str, Any]) -> Dict[str, List[Optional[float]]]:
+    """FantasyPros charting rates for whichever inputs a file carries, aligned with its rows"""
+    data = payload["data"]
+    columns = {}
+    for output, (numerator, denominator, scale) in FANTASY_PROS_RATES.items():
+        if numerator in data and denominator in data:
+            columns[output] = list(map(_ratio(scale), data[numerator], data[denominator]))
+    return columns
+
+
+def sidecar_name(file_name: str) -> str:
+    return os.path.splitext(file_name)[0] + ".json"
+
+
+def _write(path: Path, sidecar: Dict[str, Any]):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(sidecar, f, separators=(",", ":"), ensure_ascii=False)
+
+
+def build_all(data_dir: Path = DATA_DIR, output_dir: Path = TEAM_METRICS_DIR) -> List[Dict[str, Any]]:
+    """Write a metrics sidecar for every receiving, rushing and FantasyPros dataset plus an index"""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    index = []
+
+    jobs = [(spec, normalize_pfr_file) for spec in PFR_DATA_FILES if spec["statType"] in SHARE_COLUMNS]
+    jobs += [(spec, normalize_fantasy_pros_file) for spec in FANTASY_PROS_DATA_FILES]
+
+    for spec, normalize in jobs:
+        payload = normalize(spec, data_dir)
+        if payload is None:
+            print(f"  ⚠️  Missing {spec['fileName']}")
+            continue
+
+        sidecar = {"source": spec["fileName"], "year": spec["year"], "rowCount": payload["rowCount"]}
+        if "statType" in spec:
+            columns, totals = share_columns(payload)
+            sidecar.update({"statType": spec["statType"], "seasonType": spec["seasonType"],
+                            "columns": columns, "teams": totals})
+        else:
+            sidecar.update({"position": spec["position"], "kind": spec["kind"], "columns": rate_columns(payload)})
+
+        path = output_dir / sidecar_name(spec["fileName"])
+        _write(path, sidecar)
+        print(f"  ✅ {path.name}: {', '.join(sidecar['columns']) or 'no inputs'}")
+        index.append({"source": spec["fileName"], "file": path.name, "columns": list(sidecar["columns"])})
+
+    with open(output_dir / "index.json", "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2)
+
+    return index
+
+
+def main():
+    """Build team-context metric sidecars for every dataset in public/data"""
+    print("Team-Context Metrics")
+    print("=" * 50)
+
+    index = build_all()
+
+    print(f"\nWrote {len(index)} sidecars to {TEAM_METRICS_DIR.relative_to(PROJECT_ROOT)}/")
+
+
+if __name__ == "__main__":
+    main()
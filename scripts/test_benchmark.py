@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Test suite for the pipeline benchmark harness
+Validates result records and baseline regression checks
+"""
+
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark import BENCHMARKS, compare, run_benchmarks
+
+def test_result_records():
+    """Test each result reports time, throughput and peak memory"""
+    print("Testing benchmark result records...")
+
+    report = run_benchmarks(["csv_parse_all", "scoring_all_profiles"], repeat=1)
+
+    for name, result in report["results"].items():
+        for field in ["rows", "seconds", "mean_seconds", "rows_per_sec", "peak_kb"]:
+            assert field in result, f"{name} missing {field}"
+        assert result["rows"] > 0, f"{name} processed no rows"
+        assert result["seconds"] > 0, f"{name} reported no time"
+
+    print("✅ Benchmark result records correct!")
+    return True
+
+def test_scaled_case_rows():
+    """Test the 10x scale-up really parses ten copies of the receiving file"""
+    print("Testing synthetic scale-up...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _, rows_x10 = BENCHMARKS["receiving_2024_x10"](Path(tmp))
+    assert rows_x10 == 6210, f"Expected 6210 rows (10 x 621), got {rows_x10}"
+
+    print("✅ Synthetic scale-up correct!")
+    return True
+
+def test_regression_threshold():
+    """Test slowdowns past the threshold are flagged and others pass"""
+    print("Testing regression detection...")
+
+    baseline = {"results": {"a": {"seconds": 1.0}, "b": {"seconds": 1.0}}}
+    current = {"results": {"a": {"seconds": 1.1}, "b": {"seconds": 1.5}, "new": {"seconds": 9.0}}}
+
+    regressions = compare(current, baseline, threshold=0.2)
+    assert [r["name"] for r in regressions] == ["b"], f"Unexpected regressions {regressions}"
+    assert regressions[0]["ratio"] == 1.5, "Regression ratio mismatch"
+
+    print("✅ Regression detection correct!")
+    return True
+
+def run_all_tests():
+    """Run all tests and report results"""
+    print("\n" + "="*60)
+    print("🏈 BENCHMARK HARNESS TEST SUITE 🏈")
+    print("="*60 + "\n")
+
+    tests = [
+        ("Result Records", test_result_records),
+        ("Synthetic Scale-Up", test_scaled_case_rows),
+        ("Regression Threshold", test_regression_threshold)
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL TESTS PASSED! 🎉")
+    else:
+        print("⚠️  Some tests failed. Please review the errors above.")
+    print("="*60 + "\n")
+
+    return failed == 0
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
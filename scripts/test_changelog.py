@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Test suite for the data changelog
+Validates row-level diffs, patch replay and patch recording across refreshes
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import json
+import shutil
+import tempfile
+from pathlib import Path
+from changelog import apply_patch, diff_snapshots, keyed_rows, load_snapshot, record_changes
+from ingest_data import DATA_DIR
+
+def test_diff_and_apply():
+    """Test added, removed, changed, dropped fields and reorders replay exactly"""
+    print("Testing diff and replay...")
+
+    old = {"rows": {
+        "a": {"Player": "A", "Yds": 100, "TD": 1},
+        "b": {"Player": "B", "Yds": 50, "TD": 0},
+        "c": {"Player": "C", "Yds": 20, "TD": 0},
+    }}
+    new = {"rows": {
+        "c": {"Player": "C", "Yds": 90},
+        "a": {"Player": "A", "Yds": 100, "TD": 1},
+        "d": {"Player": "D", "Yds": 5, "TD": 0},
+    }}
+    tables = diff_snapshots(old, new)
+    delta = tables["rows"]
+
+    assert delta["added"] == {"d": new["rows"]["d"]}, f"Unexpected added {delta.get('added')}"
+    assert delta["removed"] == ["b"], f"Unexpected removed {delta.get('removed')}"
+    assert delta["changed"] == {"c": {"Yds": [20, 90], "TD": [0]}}, f"Unexpected changed {delta.get('changed')}"
+    assert delta["order"] == ["c", "a", "d"], f"Reorder not recorded: {delta.get('order')}"
+
+    replayed = apply_patch(old, {"tables": tables})
+    assert replayed == new and list(replayed["rows"]) == list(new["rows"]), f"Replay mismatch {replayed}"
+    assert diff_snapshots(new, new) == {}, "Identical snapshots should not differ"
+
+    print("✅ Diff and replay correct!")
+    return True
+
+def test_record_csv_refresh():
+    """Test a baseline run writes no patch and a one-cell edit yields a one-row patch"""
+    print("Testing CSV refresh patches...")
+
+    workdir = Path(tempfile.mkdtemp())
+    try:
+        name = "pff-nfl-regular-receiving-2024.csv"
+        path = workdir / name
+        shutil.copy(DATA_DIR / name, path)
+        changelog_dir = workdir / "changelog"
+
+        assert record_changes(path, changelog_dir) is None, "First run only stores the baseline"
+        assert record_changes(path, changelog_dir) is None, "Unchanged file writes no patch"
+        before = load_snapshot(path)
+
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text.replace(",1708,", ",1710,", 1))
+
+        entry = record_changes(path, changelog_dir)
+        assert entry is not None, "Edited file should produce a patch"
+        assert (entry["added"], entry["removed"], entry["changed"]) == (0, 0, 1), f"Unexpected summary {entry}"
+
+        with open(changelog_dir / entry["file"], "r", encoding="utf-8") as f:
+            patch = json.load(f)
+        assert patch["tables"]["rows"]["changed"] == {"ChasJa00:CIN": {"Yds": [1708, 1710]}}, \
+            f"Unexpected patch {patch['tables']}"
+        assert apply_patch(before, patch) == load_snapshot(path), "Patch should rebuild the new snapshot"
+        assert os.path.getsize(changelog_dir / entry["file"]) < 500, "One-cell patch should stay tiny"
+
+        with open(changelog_dir / "index.json", "r", encoding="utf-8") as f:
+            index = json.load(f)
+        assert index[name]["patches"][0]["to"] == index[name]["hash"], "Index should chain to the latest hash"
+    finally:
+        shutil.rmtree(workdir)
+
+    print("✅ CSV refresh patches correct!")
+    return True
+
+def test_fantasy_pros_rows_keyed_by_code():
+    """Test FantasyPros rows key by their resolved PFR code, so a renamed player diffs as a change"""
+    print("Testing FantasyPros row keys...")
+
+    workdir = Path(tempfile.mkdtemp())
+    try:
+        name = "FantasyPros_Fantasy_Football_WR_2024_Totals.csv"
+        path = workdir / name
+        shutil.copy(DATA_DIR / name, path)
+        changelog_dir = workdir / "changelog"
+
+        before = load_snapshot(path)
+        assert before["rows"]["ChasJa00"]["Player"] == "Ja'Marr Chase", "Resolved rows should key by PFR code"
+        fallback = keyed_rows([{"Player": "Ja'Marr Chase"}, {"Player": "Nobody Known"}], ["ChasJa00", None])
+        assert list(fallback) == ["ChasJa00", "Nobody Known"], f"Unresolved rows should fall back to the name: {list(fallback)}"
+
+        assert record_changes(path, changelog_dir) is None, "First run only stores the baseline"
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text.replace("Ja'Marr Chase (CIN)", "Ja'Marr Chase Jr. (CIN)", 1))
+
+        entry = record_changes(path, changelog_dir)
+        assert (entry["added"], entry["removed"], entry["changed"]) == (0, 0, 1), f"Rename should be one change: {entry}"
+        with open(changelog_dir / entry["file"], "r", encoding="utf-8") as f:
+            patch = json.load(f)
+        assert patch["tables"]["rows"]["changed"] == {"ChasJa00": {"Player": ["Ja'Marr Chase", "Ja'Marr Chase Jr."]}}, \
+            f"Unexpected patch {patch['tables']}"
+    finally:
+        shutil.rmtree(workdir)
+
+    print("✅ FantasyPros row keys correct!")
+    return True
+
+def test_scraped_json_tables():
+    """Test the scraped JSON diffs per dataset with the timestamp under meta"""
+    print("Testing scraped JSON snapshot...")
+
+    snapshot = load_snapshot(DATA_DIR / "fantasy_pros_data.json")
+    assert {"wr_2024", "rb_2024", "meta"} <= set(snapshot), f"Unexpected tables {list(snapshot)}"
+    assert snapshot["wr_2024"]["ChasJa00"]["Player"] == "Ja'Marr Chase", "Scraped rows key by resolved PFR code"
+
+    refreshed = json.loads(json.dumps(snapshot))
+    refreshed["meta"]["meta"]["timestamp"] = "2025-09-01T00:00:00"
+    refreshed["wr_2024"]["ChasJa00"]["TD"] = 12
+    tables = diff_snapshots(snapshot, refreshed)
+    assert set(tables) == {"meta", "wr_2024"}, f"Only two tables changed, got {list(tables)}"
+    assert tables["wr_2024"]["changed"]["ChasJa00"] == {"TD": [11, 12]}, f"Unexpected delta {tables['wr_2024']}"
+
+    print("✅ Scraped JSON snapshot correct!")
+    return True
+
+def run_all_tests():
+    """Run all tests and report results"""
+    print("\n" + "="*60)
+    print("🏈 DATA CHANGELOG TEST SUITE 🏈")
+    print("="*60 + "\n")
+
+    tests = [
+        ("Diff and Replay", test_diff_and_apply),
+        ("CSV Refresh", test_record_csv_refresh),
+        ("FantasyPros Keys", test_fantasy_pros_rows_keyed_by_code),
+        ("Scraped JSON", test_scraped_json_tables)
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL TESTS PASSED! 🎉")
+    else:
+        print("⚠️  Some tests failed. Please review the errors above.")
+    print("="*60 + "\n")
+
+    return failed == 0
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Test suite for the binary columnar export
+Validates round-trips, narrowed integer columns, zero-copy views and store exports
+"""
+
+import sys
+import os
+import tempfile
+from array import array
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from columnar import ColumnarFile, NULL_CODE, export_table, write_columnar
+from player_store import load_store
+
+def test_round_trip():
+    """Test numeric and string columns read back exactly"""
+    print("Testing columnar round-trip...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "sample.ffcol"
+        write_columnar(path, 3,
+                       {"Yds": array("d", [1708.0, float("nan"), 12.0]),
+                        "Y/R": array("d", [13.4, 9.5, float("nan")])},
+                       {"Team": ["CIN", None, "CIN"]},
+                       {"table": "sample"})
+
+        with ColumnarFile(path) as columnar:
+            assert columnar.row_count == 3, f"Expected 3 rows, got {columnar.row_count}"
+            assert columnar.metadata == {"table": "sample"}, "Metadata not preserved"
+            assert columnar.values("Yds") == [1708, None, 12], f"Unexpected Yds {columnar.values('Yds')}"
+            assert columnar.values("Y/R") == [13.4, 9.5, None], f"Unexpected Y/R {columnar.values('Y/R')}"
+            assert columnar.strings("Team") == ["CIN", None, "CIN"], "String column mismatch"
+            assert columnar.dictionary() == ["CIN"], "Dictionary should deduplicate strings"
+
+            codes = columnar.column("Team")
+            assert codes[1] == NULL_CODE, "Missing string should use the null code"
+            codes.release()
+
+    print("✅ Columnar round-trip correct!")
+    return True
+
+def test_integer_narrowing():
+    """Test whole-number columns shrink to i16/i32 and floats stay f64"""
+    print("Testing integer narrowing...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "narrow.ffcol"
+        write_columnar(path, 2,
+                       {"G": array("d", [17.0, 3.0]),
+                        "Big": array("d", [100000.0, float("nan")]),
+                        "Pct": array("d", [0.5, 1.0])},
+                       {})
+
+        with ColumnarFile(path) as columnar:
+            assert columnar.column_type("G") == "i16", f"G stored as {columnar.column_type('G')}"
+            assert columnar.column_type("Big") == "i32", f"Big stored as {columnar.column_type('Big')}"
+            assert columnar.column_type("Pct") == "f64", f"Pct stored as {columnar.column_type('Pct')}"
+            assert columnar.values("Big") == [100000, None], "i32 null sentinel not decoded"
+
+    print("✅ Integer narrowing correct!")
+    return True
+
+def test_zero_copy_views():
+    """Test columns are memoryviews over the mapped file rather than copies"""
+    print("Testing zero-copy column views...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "view.ffcol"
+        write_columnar(path, 4, {"x": array("d", [0.5, 1.5, 2.5, 3.5])}, {})
+
+        with ColumnarFile(path) as columnar:
+            view = columnar.column("x")
+            assert isinstance(view, memoryview), f"Expected memoryview, got {type(view)}"
+            assert view.readonly, "Mapped column should be read-only"
+            assert sum(view[1:3]) == 4.0, "Slicing the view gave wrong values"
+            view.release()
+
+    print("✅ Zero-copy column views correct!")
+    return True
+
+def test_store_export():
+    """Test a player-store table exports and reads back by row"""
+    print("Testing player-store export...")
+
+    store = load_store()
+    receiving = store.tables["receiving"]
+    chase = store.player_id("ChasJa00")
+    row = receiving.row_index(chase, 2024)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = export_table(store, receiving, Path(tmp))
+        with ColumnarFile(path) as columnar:
+            assert columnar.row_count == len(receiving), "Row count mismatch"
+            assert columnar.values("Yds")[row] == 1708, f"Expected 1708 Yds, got {columnar.values('Yds')[row]}"
+            assert columnar.strings("player_code")[row] == "ChasJa00", "Player code mismatch"
+            assert columnar.strings("team")[row] == "CIN", "Team mismatch"
+
+    print("✅ Player-store export correct!")
+    return True
+
+def test_rejects_other_files():
+    """Test files without the columnar magic are refused"""
+    print("Testing bad file rejection...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "not.ffcol"
+        path.write_bytes(b"Player,Team\nJa'Marr Chase,CIN\n")
+        try:
+            ColumnarFile(path)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Expected ValueError for a non-columnar file")
+
+    print("✅ Bad file rejection correct!")
+    return True
+
+def run_all_tests():
+    """Run all tests and report results"""
+    print("\n" + "="*60)
+    print("🏈 COLUMNAR EXPORT TEST SUITE 🏈")
+    print("="*60 + "\n")
+
+    tests = [
+        ("Round Trip", test_round_trip),
+        ("Integer Narrowing", test_integer_narrowing),
+        ("Zero-Copy Views", test_zero_copy_views),
+        ("Store Export", test_store_export),
+        ("Bad File Rejection", test_rejects_other_files)
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL TESTS PASSED! 🎉")
+    else:
+        print("⚠️  Some tests failed. Please review the errors above.")
+    print("="*60 + "\n")
+
+    return failed == 0
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
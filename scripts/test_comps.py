@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Test suite for player comparables
+Validates standardization, vectorized distances against naive pairwise math, and batch queries
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import math
+import statistics
+from comps import CompsIndex, build_indexes, feature_names, season_profiles
+from player_store import load_store
+
+_STORE = None
+_INDEXES = None
+
+def _indexes():
+    global _STORE, _INDEXES
+    if _INDEXES is None:
+        _STORE = load_store()
+        _INDEXES = build_indexes(_STORE)
+    return _STORE, _INDEXES
+
+def test_profiles():
+    """Test profiles use per-game volume and every column is standardized"""
+    print("Testing standardized profiles...")
+
+    store, indexes = _indexes()
+    player = store.player_id("NacuPu00")
+    profile = dict(season_profiles(store, "WR"))[(player, 2023)]
+    features = feature_names("WR")
+    line = store.lookup(player, 2023)["receiving"]
+    assert profile[features.index("receiving.Tgt")] == line["Tgt"] / line["G"], "Targets should be per game"
+    assert profile[features.index("receiving.Y/Tgt")] == line["Y/Tgt"], "Rates should be taken as is"
+
+    index = indexes["WR"]
+    for name, column in zip(index.features, index.columns):
+        assert abs(statistics.fmean(column)) < 1e-9, f"{name} should have mean 0"
+        assert abs(statistics.pstdev(column) - 1) < 1e-9, f"{name} should have sd 1"
+
+    row = index.row(player, 2023)
+    raw = dict(zip(features, profile))
+    rebuilt = index.standardize(raw)
+    assert all(abs(a - b) < 1e-12 for a, b in zip(rebuilt, index.vector(row))), "standardize() should match the row"
+
+    assert len(indexes["QB"].features) == 1 + 7 + 5, "QBs should be profiled on passing and rushing"
+
+    print("✅ Standardized profiles correct!")
+    return True
+
+def test_distances():
+    """Test vectorized distances and top-k match naive pairwise recomputation"""
+    print("Testing vectorized distances...")
+
+    store, indexes = _indexes()
+    index = indexes["RB"]
+    for row in (0, len(index) // 2, len(index) - 1):
+        query = index.vector(row)
+        distances = index.distances(query)
+        for other in range(0, len(index), 7):
+            naive = sum((a - b) ** 2 for a, b in zip(query, index.vector(other)))
+            assert abs(distances[other] - naive) < 1e-9, f"Distance mismatch {row}->{other}"
+
+        player = index.keys[row][0]
+        expected = sorted((math.sqrt(sum((a - b) ** 2 for a, b in zip(query, index.vector(other)))), other)
+                          for other in range(len(index)) if index.keys[other][0] != player)[:5]
+        nearest = index.nearest(query, 5, exclude_player=player)
+        assert [round(d, 9) for _, d in nearest] == [round(d, 9) for d, _ in expected], "Top-k mismatch"
+
+    print("✅ Vectorized distances correct!")
+    return True
+
+def test_comps():
+    """Test single and batch comps skip the player's own seasons and agree"""
+    print("Testing comps queries...")
+
+    store, indexes = _indexes()
+    index = indexes["WR"]
+    player = store.player_id("NacuPu00")
+    comps = index.comps(player, 2023, k=5)
+    assert len(comps) == 5, f"Expected 5 comps, got {len(comps)}"
+    assert all(index.keys[row][0] != player for row, _ in comps), "A player's own seasons should not be comps"
+    assert [d for _, d in comps] == sorted(d for _, d in comps), "Comps should be closest first"
+
+    rows = [i for i, (_, year) in enumerate(index.keys) if year == 2024]
+    batch = index.batch_comps(rows, k=3)
+    assert set(batch) == set(rows), "Batch should answer every requested season"
+    for row in rows[:20]:
+        assert batch[row] == index.comps(*index.keys[row], k=3), f"Batch and single comps differ for row {row}"
+
+    assert index.comps(player, 1999) == [], "Unknown seasons should have no comps"
+    empty = CompsIndex("WR", [], feature_names("WR"), [0.0] * 7, [1.0] * 7, [])
+    assert len(empty) == 0 and empty.batch_comps() == {}, "An empty group should answer nothing"
+
+    print("✅ Comps queries correct!")
+    return True
+
+def run_all_tests():
+    """Run all tests and report results"""
+    print("\n" + "="*60)
+    print("🏈 COMPS TEST SUITE 🏈")
+    print("="*60 + "\n")
+
+    tests = [
+        ("Profiles", test_profiles),
+        ("Distances", test_distances),
+        ("Comps", test_comps)
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL TESTS PASSED! 🎉")
+    else:
+        print("⚠️  Some tests failed. Please review the errors above.")
+    print("="*60 + "\n")
+
+    return failed == 0
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Test suite for the draft board
+Validates replacement levels, incremental pick/undo updates and the FantasyPros/PFR pool
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import time
+from draft_board import DraftBoard, fantasy_pros_pool
+from player_store import load_store
+from scoring import SCORING_PROFILES, score_seasons
+
+STORE = load_store()
+POOL = fantasy_pros_pool(STORE)
+
+def _pool():
+    """Two teams, RB points 100..60 and WR points 95..55 in steps of 10"""
+    rbs = [{"name": f"RB {i}", "team": "AAA", "position": "RB", "points": 100.0 - 10 * i} for i in range(5)]
+    wrs = [{"name": f"WR {i}", "team": "BBB", "position": "WR", "points": 95.0 - 10 * i} for i in range(5)]
+    return rbs + wrs
+
+def test_replacement_levels():
+    """Test starter demand, FLEX allocation and VORP"""
+    print("Testing replacement levels...")
+
+    board = DraftBoard(_pool(), teams=2, slots={"RB": 1, "WR": 1, "FLEX": 1})
+
+    # 2 RB + 2 WR starters, then FLEX goes to RB 2 (80) over WR 2 (75), then WR 2 (75) over RB 3 (70)
+    assert board.demand == {"RB": 3, "WR": 3}, f"Unexpected demand {board.demand}"
+    assert board.replacement == {"RB": 70.0, "WR": 65.0}, f"Unexpected replacement {board.replacement}"
+    assert board.vorp(0) == 30.0, f"RB 0 VORP should be 30, got {board.vorp(0)}"
+
+    best = board.best_available(3)
+    assert [p["name"] for p in best] == ["RB 0", "WR 0", "RB 1"], f"Unexpected order {best}"
+    assert best[1]["vorp"] == 30.0, f"WR 0 VORP should be 30, got {best[1]['vorp']}"
+
+    print("✅ Replacement levels correct!")
+    return True
+
+def test_incremental_picks():
+    """Test picks follow snake order, bench picks keep demand and undo restores state"""
+    print("Testing incremental picks...")
+
+    board = DraftBoard(_pool(), teams=2, slots={"RB": 1, "WR": 1, "FLEX": 0})
+    start = {"demand": dict(board.demand), "replacement": dict(board.replacement)}
+
+    assert board.draft(0)["owner"] == 0, "Pick 1 belongs to team 1"
+    assert board.draft(1)["owner"] == 1, "Pick 2 belongs to team 2"
+    assert board.on_the_clock() == 1, "Snake order gives team 2 back-to-back picks"
+    assert board.demand["RB"] == 0, f"Both RB slots are filled, demand {board.demand}"
+    assert board.replacement["RB"] == 80.0, f"Replacement should be the best RB left, got {board.replacement}"
+
+    bench = board.draft(2)
+    assert bench["slot"] is None, "Third RB on a roster is a bench pick"
+    assert board.demand["RB"] == 0, "Bench picks must not lower demand"
+
+    try:
+        board.draft(2)
+        raise AssertionError("Drafting a taken player should fail")
+    except ValueError:
+        pass
+
+    for _ in range(3):
+        board.undo()
+    assert board.demand == start["demand"], f"Undo should restore demand, got {board.demand}"
+    assert board.replacement == start["replacement"], f"Undo should restore replacement, got {board.replacement}"
+    assert board.undo() is None, "Nothing left to undo"
+    assert len(board.best_available(20)) == 10, "Every player is back on the board"
+
+    print("✅ Incremental picks correct!")
+    return True
+
+def test_fantasy_pros_pool():
+    """Test the 2024 pool values players by their scored PFR season and covers every slot"""
+    print("Testing FantasyPros pool...")
+
+    players = {p["name"]: p for p in POOL}
+    chase = players["Ja'Marr Chase"]
+    assert {p["position"] for p in POOL} == {"RB", "WR", "QB", "TE"}, "QB and TE slots need PFR players"
+    # Ja'Marr Chase 2024 half-PPR from test_scoring
+    assert chase["points"] == 339.5, f"Chase points {chase['points']}"
+
+    scored = score_seasons(STORE, {"half_ppr": SCORING_PROFILES["half_ppr"]})
+    for name, position in (("Lamar Jackson", "QB"), ("Brock Bowers", "TE")):
+        player = players[name]
+        row = scored.row_index(STORE.player_names.index(name), 2024)
+        assert player["position"] == position, f"{name} should be a {position}"
+        assert player["points"] == round(scored.points["half_ppr"][row], 2), f"{name} should be scored from PFR"
+
+    board = DraftBoard(POOL)
+    assert board.demand["QB"] == 12 and board.demand["TE"] == 12, f"Every QB and TE slot should be fillable: {board.demand}"
+    assert board.find("jamarr chase"), "Normalized name lookup should find Ja'Marr Chase"
+    assert board.recommend()["name"] == "Ja'Marr Chase", f"Top pick should be Chase, got {board.recommend()}"
+
+    print("✅ FantasyPros pool correct!")
+    return True
+
+def test_pick_speed():
+    """Test a full draft stays well under a millisecond per pick"""
+    print("Testing pick update speed...")
+
+    board = DraftBoard(POOL)
+    start = time.perf_counter()
+    picks = 0
+    while True:
+        best = board.recommend()
+        if best is None:
+            break
+        board.draft(board.find(best["name"])[0])
+        picks += 1
+    per_pick = (time.perf_counter() - start) / picks * 1000
+
+    assert picks == len(POOL), f"Every player should be drafted, got {picks}"
+    assert per_pick < 1.0, f"Pick update took {per_pick:.3f} ms"
+
+    print(f"✅ {picks} picks at {per_pick:.3f} ms each!")
+    return True
+
+def run_all_tests():
+    """Run all tests and report results"""
+    print("\n" + "="*60)
+    print("🏈 DRAFT BOARD TEST SUITE 🏈")
+    print("="*60 + "\n")
+
+    tests = [
+        ("Replacement Levels", test_replacement_levels),
+        ("Incremental Picks", test_incremental_picks),
+        ("FantasyPros Pool", test_fantasy_pros_pool),
+        ("Pick Speed", test_pick_speed)
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL TESTS PASSED! 🎉")
+    else:
+        print("⚠️  Some tests failed. Please review the errors above.")
+    print("="*60 + "\n")
+
+    return failed == 0
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
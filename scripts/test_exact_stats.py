@@ -9,6 +9,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from scrape_fantasy_pros import get_sample_wr_data_2024, get_sample_rb_data_2024
+from validate_data import SAMPLE_SCHEMAS, validate_rows
 
 # SOURCE OF TRUTH - 2024 NFL Season Final Statistics
 # These are the exact, verified statistics from the actual 2024 season
@@ -68,9 +69,11 @@ def test_exact_wr_stats():
     wr_data = get_sample_wr_data_2024()
     errors = []
     
+    players = {p["Player"]: p for p in wr_data}
+
     for player_name, expected_stats in WR_STATS_2024.items():
         # Find player in data
-        player_data = next((p for p in wr_data if player_name in p["Player"]), None)
+        player_data = players.get(player_name)
         
         if not player_data:
             errors.append(f"Player {player_name} not found in data")
@@ -102,9 +105,11 @@ def test_exact_rb_stats():
     rb_data = get_sample_rb_data_2024()
     errors = []
     
+    players = {p["Player"]: p for p in rb_data}
+
     for player_name, expected_stats in RB_STATS_2024.items():
         # Find player in data
-        player_data = next((p for p in rb_data if player_name in p["Player"]), None)
+        player_data = players.get(player_name)
         
         if not player_data:
             errors.append(f"Player {player_name} not found in data")
@@ -168,23 +173,10 @@ def test_no_null_values():
     """Ensure no null or missing values in critical fields"""
     print("\nChecking for null/missing values...")
     
-    wr_data = get_sample_wr_data_2024()
-    rb_data = get_sample_rb_data_2024()
-    
-    critical_wr_fields = ["Rank", "Player", "Team", "G", "REC", "TGT", "YDS", "TD", "FPTS"]
-    critical_rb_fields = ["Rank", "Player", "Team", "G", "RUSH", "RUSH_YDS", "RUSH_TD", "FPTS"]
-    
-    errors = []
-    
-    for player in wr_data:
-        for field in critical_wr_fields:
-            if field not in player or player[field] is None or player[field] == "":
-                errors.append(f"WR {player.get('Player', 'Unknown')}: missing/null {field}")
-    
-    for player in rb_data:
-        for field in critical_rb_fields:
-            if field not in player or player[field] is None or player[field] == "":
-                errors.append(f"RB {player.get('Player', 'Unknown')}: missing/null {field}")
+    violations = validate_rows(get_sample_wr_data_2024(), SAMPLE_SCHEMAS["WR"], "WR sample")
+    violations += validate_rows(get_sample_rb_data_2024(), SAMPLE_SCHEMAS["RB"], "RB sample")
+    errors = [f"{v['source']} {v['player'] or 'Unknown'}: {v['message']}" for v in violations
+              if v["rule"] == "required"]
     
     if errors:
         print("❌ Null Value Check FAILED:")
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Test suite for the concurrent data fetcher
+Runs every fetch against a local fixture server over public/data
+"""
+
+import sys
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ingest_data import DATA_DIR
+from fetcher import Fetcher, FixtureServer, HostRateLimiter, build_jobs, retry_after_seconds, summarize
+
+def test_fetch_all_from_fixture():
+    """Test every dataset downloads intact from the fixture server"""
+    print("Testing concurrent fetch...")
+
+    with tempfile.TemporaryDirectory() as tmp, FixtureServer(DATA_DIR) as server:
+        jobs = build_jobs({"fantasypros": server.base_url, "pfr": server.base_url})
+        fetcher = Fetcher(Path(tmp), requests_per_second=0)
+        opened = fetcher._connections
+        results = fetcher.fetch_all(jobs)
+
+        counts = summarize(results)
+        assert counts["fetched"] == 30, f"Expected 30 fetched, got {counts}"
+        assert opened and all(connection.sock is None for connection in opened), \
+            "Worker connections should be closed once the pool finishes"
+
+        for job in jobs:
+            fetched = (Path(tmp) / job["fileName"]).read_bytes()
+            original = (DATA_DIR / job["fileName"]).read_bytes()
+            assert fetched == original, f"{job['fileName']} content mismatch"
+
+    try:
+        build_jobs({"fantasypros": server.base_url, "pfr": None})
+        assert False, "A missing base URL should be rejected"
+    except ValueError as e:
+        assert "PFR_BASE_URL" in str(e), f"Error should name the setting to configure: {e}"
+
+    print("✅ Concurrent fetch correct!")
+    return True
+
+def test_conditional_requests():
+    """Test a second run gets 304s via ETag and rewrites nothing"""
+    print("Testing conditional requests...")
+
+    with tempfile.TemporaryDirectory() as tmp, FixtureServer(DATA_DIR) as server:
+        jobs = build_jobs({"fantasypros": server.base_url, "pfr": server.base_url})
+        Fetcher(Path(tmp), requests_per_second=0).fetch_all(jobs)
+
+        mtimes = {job["fileName"]: os.path.getmtime(Path(tmp) / job["fileName"]) for job in jobs}
+        results = Fetcher(Path(tmp), requests_per_second=0).fetch_all(jobs)
+
+        counts = summarize(results)
+        assert counts["not_modified"] == 30, f"Expected 30 not modified, got {counts}"
+        for name, mtime in mtimes.items():
+            assert os.path.getmtime(Path(tmp) / name) == mtime, f"{name} was rewritten"
+
+    print("✅ Conditional requests correct!")
+    return True
+
+def test_retry_with_backoff():
+    """Test transient 503s are retried, 429s honor Retry-After and permanent 404s are not retried"""
+    print("Testing retries...")
+
+    calls = {"flaky": 0, "missing": 0, "limited": 0}
+
+    class FlakyHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            key = next(name for name in ("flaky", "limited", "missing") if name in self.path)
+            calls[key] += 1
+            if key == "missing":
+                status = 404
+            else:
+                status = 200 if calls[key] > (2 if key == "flaky" else 1) else 503 if key == "flaky" else 429
+            body = b"ok" if status == 200 else b""
+            self.send_response(status)
+            if status == 429:
+                self.send_header("Retry-After", "0.3")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            fetcher = Fetcher(Path(tmp), requests_per_second=0, backoff=0.01)
+            flaky = fetcher.fetch({"fileName": "flaky.csv", "url": base + "flaky.csv"})
+            missing = fetcher.fetch({"fileName": "missing.csv", "url": base + "missing.csv"})
+            limited = fetcher.fetch({"fileName": "limited.csv", "url": base + "limited.csv"})
+            fetcher.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert flaky["status"] == "fetched" and flaky["attempts"] == 3, f"Unexpected flaky result {flaky}"
+    assert missing["status"] == "failed" and calls["missing"] == 1, f"404 should not be retried: {missing}"
+    assert limited["status"] == "fetched" and limited["seconds"] >= 0.3, \
+        f"A 429 should wait out Retry-After rather than the short backoff: {limited}"
+
+    assert retry_after_seconds("2") == 2.0 and retry_after_seconds("9999") == 60.0, "Delta-seconds should be capped"
+    assert retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0, "A past date should not wait"
+    assert retry_after_seconds(None) is None and retry_after_seconds("soon") is None, "Bad headers are ignored"
+
+    print("✅ Retries correct!")
+    return True
+
+def test_rate_limiter_spacing():
+    """Test requests to one host are spaced by the configured rate"""
+    print("Testing rate limiter...")
+
+    limiter = HostRateLimiter(requests_per_second=50)
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.wait("example.com")
+    elapsed = time.monotonic() - start
+    assert elapsed >= 0.09, f"Expected >= 0.1s for 6 requests at 50/s, took {elapsed:.3f}s"
+
+    print("✅ Rate limiter correct!")
+    return True
+
+def run_all_tests():
+    """Run all tests and report results"""
+    print("\n" + "="*60)
+    print("🏈 DATA FETCHER TEST SUITE 🏈")
+    print("="*60 + "\n")
+
+    tests = [
+        ("Concurrent Fetch", test_fetch_all_from_fixture),
+        ("Conditional Requests", test_conditional_requests),
+        ("Retries", test_retry_with_backoff),
+        ("Rate Limiter", test_rate_limiter_spacing)
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL TESTS PASSED! 🎉")
+    else:
+        print("⚠️  Some tests failed. Please review the errors above.")
+    print("="*60 + "\n")
+
+    return failed == 0
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
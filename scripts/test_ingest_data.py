@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Test suite for the build-time data ingest
+Validates CSV cleanup, typing and columnar output
+"""
+
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ingest_data import (
+    PFR_DATA_FILES,
+    FANTASY_PROS_DATA_FILES,
+    normalize_pfr_file,
+    normalize_fantasy_pros_file,
+    split_player_team,
+    ingest_all,
+)
+
+def _spec(file_name, specs):
+    return next(spec for spec in specs if spec["fileName"] == file_name)
+
+def test_pfr_receiving_cleanup():
+    """Test super-header, junk columns and League Average rows are stripped"""
+    print("Testing PFR receiving cleanup...")
+
+    payload = normalize_pfr_file(_spec("pff-nfl-regular-receiving-2024.csv", PFR_DATA_FILES))
+    data = payload["data"]
+
+    assert payload["rowCount"] == len(data["Player"]), "Row count mismatch"
+    assert "League Average" not in data["Player"], "League Average row not removed"
+    assert "-9999" not in data, "Junk -9999 column not removed"
+    assert data["PlayerID"][0] == "ChasJa00", f"Expected ChasJa00, got {data['PlayerID'][0]}"
+
+    chase = data["Player"].index("Ja'Marr Chase")
+    assert data["Yds"][chase] == 1708, f"Expected 1708 Yds, got {data['Yds'][chase]}"
+    assert data["Y/R"][chase] == 13.4, f"Expected 13.4 Y/R, got {data['Y/R'][chase]}"
+
+    print("✅ PFR receiving cleanup correct!")
+    return True
+
+def test_pfr_passing_duplicate_headers():
+    """Test the duplicate sack-yards column is renamed like PapaParse does"""
+    print("Testing PFR passing duplicate headers...")
+
+    payload = normalize_pfr_file(_spec("pff-nfl-regular-passing-2024.csv", PFR_DATA_FILES))
+    keys = [column["key"] for column in payload["columns"]]
+
+    assert "Yds" in keys and "Yds_1" in keys, f"Expected Yds and Yds_1 in {keys}"
+    assert "PlayerID" in keys, "Player-additional column not renamed to PlayerID"
+
+    burrow = payload["data"]["Player"].index("Joe Burrow")
+    assert payload["data"]["Yds"][burrow] == 4918, "Passing yards mismatch"
+    assert payload["data"]["QBrec"][burrow] == "9-8-0", "QBrec should stay a string"
+
+    print("✅ PFR passing headers correct!")
+    return True
+
+def test_fantasy_pros_numbers_and_teams():
+    """Test "2,005" is de-commaed and "Name (TEAM)" is split"""
+    print("Testing FantasyPros normalization...")
+
+    spec = _spec("FantasyPros_Fantasy_Football_RB_2024_Totals.csv", FANTASY_PROS_DATA_FILES)
+    payload = normalize_fantasy_pros_file(spec)
+    data = payload["data"]
+
+    assert data["Player"][0] == "Saquon Barkley", f"Expected Saquon Barkley, got {data['Player'][0]}"
+    assert data["Team"][0] == "PHI", f"Expected PHI, got {data['Team'][0]}"
+    assert data["YDS"][0] == 2005, f"Expected 2005, got {data['YDS'][0]}"
+    assert "YACON_1" in data, "Duplicate YACON column not renamed"
+
+    types = {column["key"]: column["type"] for column in payload["columns"]}
+    assert types["YDS"] == "number", "YDS should be numeric"
+    assert types["Player"] == "string", "Player should be a string"
+
+    print("✅ FantasyPros normalization correct!")
+    return True
+
+def test_split_player_team():
+    """Test player/team splitting edge cases"""
+    print("Testing player/team splitting...")
+
+    assert split_player_team("Brian Thomas Jr. (JAC)") == ("Brian Thomas Jr.", "JAC")
+    assert split_player_team("A.J. Brown (PHI)") == ("A.J. Brown", "PHI")
+    assert split_player_team("No Team") == ("No Team", "")
+
+    print("✅ Player/team splitting correct!")
+    return True
+
+def test_ingest_all_output():
+    """Test every dataset is written along with an index"""
+    print("Testing full ingest output...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output_dir = Path(tmp)
+        index = ingest_all(output_dir=output_dir)
+
+        expected = len(PFR_DATA_FILES) + len(FANTASY_PROS_DATA_FILES)
+        assert len(index) == expected, f"Expected {expected} datasets, got {len(index)}"
+
+        with open(output_dir / "index.json") as f:
+            assert len(json.load(f)) == expected, "Index does not list every dataset"
+
+        with open(output_dir / "pff-nfl-playoff-rushing-2022.json") as f:
+            payload = json.load(f)
+        assert payload["data"]["Player"][0] == "Christian McCaffrey", "Playoff rushing data mismatch"
+
+    print("✅ Full ingest output correct!")
+    return True
+
+def run_all_tests():
+    """Run all tests and report results"""
+    print("\n" + "="*60)
+    print("🏈 DATA INGEST TEST SUITE 🏈")
+    print("="*60 + "\n")
+
+    tests = [
+        ("PFR Receiving Cleanup", test_pfr_receiving_cleanup),
+        ("PFR Passing Headers", test_pfr_passing_duplicate_headers),
+        ("FantasyPros Normalization", test_fantasy_pros_numbers_and_teams),
+        ("Player/Team Split", test_split_player_team),
+        ("Full Ingest", test_ingest_all_output)
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL TESTS PASSED! 🎉")
+    else:
+        print("⚠️  Some tests failed. Please review the errors above.")
+    print("="*60 + "\n")
+
+    return failed == 0
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Test suite for pipeline instrumentation
+Validates span recording, the Chrome trace export, the disabled fast path and profiling
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import io
+import json
+import pstats
+import tempfile
+import threading
+from contextlib import redirect_stdout
+from pathlib import Path
+from instrument import NULL_SPAN, TRACER, Tracer, profiled, traced
+from ingest_data import PFR_DATA_FILES, normalize_pfr_file
+
+def test_span_recording():
+    """Test spans record duration, counters and nesting"""
+    print("Testing span recording...")
+
+    tracer = Tracer(enabled=True)
+    with tracer.span("fetch", file="a.csv") as outer:
+        outer.add(bytes_read=100)
+        with tracer.span("parse") as inner:
+            inner.add(rows=5)
+            inner.add(rows=2, bytes_read=50)
+    outer_span, inner_span = sorted(tracer.spans, key=lambda span: span.start)
+
+    assert outer_span.name == "fetch" and outer_span.args == {"file": "a.csv"}, "Outer span should keep its args"
+    assert inner_span.rows == 7 and inner_span.bytes_read == 50, f"Counters should accumulate: {inner_span.rows}"
+    assert outer_span.start <= inner_span.start, "Inner span should start inside the outer one"
+    assert inner_span.start + inner_span.duration <= outer_span.start + outer_span.duration + 1e-6, \
+        "Inner span should end inside the outer one"
+
+    try:
+        with tracer.span("write"):
+            raise ValueError("boom")
+    except ValueError:
+        pass
+    assert tracer.spans[-1].name == "write", "A span should be recorded even when its block raises"
+
+    print("✅ Span recording correct!")
+    return True
+
+def test_chrome_trace():
+    """Test the trace is valid Trace Event Format with one small tid per thread"""
+    print("Testing Chrome trace export...")
+
+    tracer = Tracer(enabled=True)
+    with tracer.span("score") as stage:
+        stage.add(rows=3, bytes_written=10)
+
+    def traced_worker():
+        with tracer.span("compress"):
+            pass
+    worker = threading.Thread(target=traced_worker)
+    worker.start()
+    worker.join()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "nested" / "trace.json"
+        tracer.write_chrome_trace(path)
+        with open(path) as f:
+            document = json.load(f)
+
+    events = document["traceEvents"]
+    assert [event["name"] for event in events] == ["score", "compress"], f"Unexpected events: {events}"
+    for event in events:
+        assert event["ph"] == "X" and event["dur"] >= 0 and event["ts"] >= 0, f"Bad complete event: {event}"
+    assert events[0]["args"]["rows"] == 3 and events[0]["args"]["bytesWritten"] == 10, "Counters should be in args"
+    assert [event["tid"] for event in events] == [0, 1], "Each thread should get its own small tid"
+
+    summary = {entry["name"]: entry for entry in tracer.summary()}
+    assert summary["score"]["count"] == 1 and summary["score"]["rows"] == 3, f"Bad summary: {summary}"
+
+    print("✅ Chrome trace export correct!")
+    return True
+
+def test_disabled_and_decorator():
+    """Test a disabled tracer records nothing and traced() wraps functions transparently"""
+    print("Testing disabled tracer and decorator...")
+
+    tracer = Tracer(enabled=False)
+    with tracer.span("parse") as stage:
+        stage.add(rows=10)
+    assert stage is NULL_SPAN and not tracer.spans, "Disabled tracer should hand out the null span"
+
+    @traced("normalize")
+    def double(value):
+        """Double a value"""
+        return value * 2
+
+    assert double.__doc__ == "Double a value", "Decorator should keep the docstring"
+    enabled = TRACER.enabled
+    try:
+        TRACER.enabled = False
+        TRACER.reset()
+        assert double(2) == 4 and not TRACER.spans, "Disabled decorator should only call through"
+        TRACER.enabled = True
+        assert double(3) == 6, "Decorated function should return its value"
+        assert [span.name for span in TRACER.spans] == ["normalize"], "Enabled decorator should record a span"
+    finally:
+        TRACER.enabled = enabled
+        TRACER.reset()
+
+    print("✅ Disabled tracer and decorator correct!")
+    return True
+
+def test_pipeline_spans():
+    """Test the ingest stages report rows and bytes through the process tracer"""
+    print("Testing pipeline stage spans...")
+
+    enabled = TRACER.enabled
+    try:
+        TRACER.enabled = True
+        TRACER.reset()
+        payload = normalize_pfr_file(PFR_DATA_FILES[0])
+        stages = {span.name: span for span in TRACER.spans}
+    finally:
+        TRACER.enabled = enabled
+        TRACER.reset()
+
+    assert set(stages) == {"parse", "normalize"}, f"Unexpected stages: {list(stages)}"
+    assert stages["parse"].rows == payload["rowCount"], "Parse span should count the rows read"
+    assert stages["parse"].bytes_read > 0, "Parse span should record the file size"
+    assert stages["normalize"].rows == payload["rowCount"], "Normalize span should count the rows typed"
+
+    print("✅ Pipeline stage spans correct!")
+    return True
+
+def test_profiled():
+    """Test the cProfile capture writes loadable stats"""
+    print("Testing cProfile capture...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "run.prof"
+        output = io.StringIO()
+        with redirect_stdout(output):
+            with profiled(path, top=5):
+                sorted(range(10000), key=lambda value: -value)
+        stats = pstats.Stats(str(path))
+
+    assert stats.total_calls > 0, "Profile should record calls"
+    assert "cumulative" in output.getvalue(), "Top entries should be printed"
+
+    print("✅ cProfile capture correct!")
+    return True
+
+def run_all_tests():
+    """Run all tests and report results"""
+    print("\n" + "="*60)
+    print("🏈 INSTRUMENTATION TEST SUITE 🏈")
+    print("="*60 + "\n")
+
+    tests = [
+        ("Span Recording", test_span_recording),
+        ("Chrome Trace", test_chrome_trace),
+        ("Disabled And Decorator", test_disabled_and_decorator),
+        ("Pipeline Spans", test_pipeline_spans),
+        ("Profiled", test_profiled)
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL TESTS PASSED! 🎉")
+    else:
+        print("⚠️  Some tests failed. Please review the errors above.")
+    print("="*60 + "\n")
+
+    return failed == 0
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
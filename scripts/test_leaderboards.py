@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Test suite for the precomputed leaderboard sidecars
+Validates sorted permutations, top-N slices and the written index
+"""
+
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ingest_data import PFR_DATA_FILES, normalize_pfr_file
+from leaderboards import STAT_COLUMNS, argsort_asc, argsort_desc, build_all, build_leaderboard
+
+RECEIVING_2024 = next(spec for spec in PFR_DATA_FILES if spec["fileName"] == "pff-nfl-regular-receiving-2024.csv")
+
+def test_argsort_order():
+    """Test descending and ascending order, stable ties and missing values last"""
+    print("Testing argsort order...")
+
+    order = argsort_desc([3, None, 7, 3, 1])
+    assert order == [2, 0, 3, 4, 1], f"Unexpected order {order}"
+    order = argsort_asc([3, None, 7, 3, 1])
+    assert order == [4, 0, 3, 2, 1], f"Ascending ties should keep file order too: {order}"
+
+    print("✅ Argsort order correct!")
+    return True
+
+def test_permutation_matches_sort():
+    """Test every column's permutation agrees with a full sort of the rows"""
+    print("Testing sorted permutations...")
+
+    payload = normalize_pfr_file(RECEIVING_2024)
+    leaderboard = build_leaderboard(payload)
+
+    for key, column in leaderboard["columns"].items():
+        values = payload["data"][key]
+        assert sorted(column["order"]) == list(range(payload["rowCount"])), f"{key} order is not a permutation"
+        ordered = [values[row] for row in column["order"][:column["count"]]]
+        assert ordered == sorted(ordered, reverse=True), f"{key} order is not descending"
+        assert all(values[row] is None for row in column["order"][column["count"]:]), f"{key} missing values not last"
+        expected = sorted(range(payload["rowCount"]), key=lambda row: (values[row] is None, values[row] or 0))
+        assert column["ascending"] == expected, f"{key} ascending order is not a stable sort"
+
+    # Traded players repeat Rk: the combined 3TM line stays ahead of its team splits
+    rk = leaderboard["columns"]["Rk"]["ascending"]
+    teams = [payload["data"]["Team"][row] for row in rk if payload["data"]["Player"][row] == "Diontae Johnson"]
+    assert teams[0] == "3TM", f"Ascending Rk should keep file order for ties: {teams}"
+
+    print("✅ Sorted permutations correct!")
+    return True
+
+def test_top_leaders():
+    """Test top-N slices hold the real leaders, one line per player"""
+    print("Testing top-N leaders...")
+
+    leaderboard = build_leaderboard(normalize_pfr_file(RECEIVING_2024))
+    top = leaderboard["columns"]["Yds"]["top"]
+
+    assert len(top) == 25, f"Expected 25 leaders, got {len(top)}"
+    assert top[0]["Player"] == "Ja'Marr Chase", f"Expected Ja'Marr Chase, got {top[0]['Player']}"
+    assert top[0]["value"] == 1708, f"Expected 1708 Yds, got {top[0]['value']}"
+
+    ids = [leader["PlayerID"] for leader in top]
+    assert len(ids) == len(set(ids)), "Multi-team players listed more than once"
+
+    print("✅ Top-N leaders correct!")
+    return True
+
+def test_build_all_writes_sidecars():
+    """Test one sidecar per dataset with only the table's numeric columns"""
+    print("Testing sidecar files...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = build_all(output_dir=Path(tmp))
+        assert len(index) == len(PFR_DATA_FILES), f"Expected {len(PFR_DATA_FILES)} sidecars, got {len(index)}"
+
+        with open(Path(tmp) / "pff-nfl-regular-passing-2024.json") as f:
+            passing = json.load(f)
+        assert set(passing["columns"]) <= set(STAT_COLUMNS["passing"]), "Unexpected columns indexed"
+        assert "Rate" in passing["columns"], "Passer rating not indexed"
+        assert (Path(tmp) / "index.json").exists(), "index.json not written"
+
+    print("✅ Sidecar files correct!")
+    return True
+
+def run_all_tests():
+    """Run all tests and report results"""
+    print("\n" + "="*60)
+    print("🏈 LEADERBOARD INDEX TEST SUITE 🏈")
+    print("="*60 + "\n")
+
+    tests = [
+        ("Argsort Order", test_argsort_order),
+        ("Sorted Permutations", test_permutation_matches_sort),
+        ("Top-N Leaders", test_top_leaders),
+        ("Sidecar Files", test_build_all_writes_sidecars)
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL TESTS PASSED! 🎉")
+    else:
+        print("⚠️  Some tests failed. Please review the errors above.")
+    print("="*60 + "\n")
+
+    return failed == 0
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Test suite for the weekly lineup optimizer
+Validates the slot DP against brute force, roster resolution and pooled batch solving
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import random
+from lineup import SLOT_POSITIONS, optimize_lineup, optimize_rosters, roster_players, weekly_points
+from player_store import load_store
+
+STORE = load_store()
+POINTS = weekly_points(STORE)
+POSITIONS = ["QB", "RB", "WR", "TE"]
+
+def _brute_force(players, slots):
+    """Best total by trying every player in every open slot or on the bench"""
+    names = list(slots)
+
+    def search(i, open_slots):
+        if i == len(players):
+            return 0.0
+        best = search(i + 1, open_slots)
+        for s, slot in enumerate(names):
+            if open_slots[s] and players[i]["position"] in SLOT_POSITIONS[slot]:
+                remaining = open_slots[:s] + (open_slots[s] - 1,) + open_slots[s + 1:]
+                best = max(best, players[i]["points"] + search(i + 1, remaining))
+        return best
+
+    return search(0, tuple(slots[slot] for slot in names))
+
+def _random_roster(rng, size):
+    return [{"name": f"P{i}", "position": rng.choice(POSITIONS), "points": round(rng.uniform(0, 30), 1)}
+            for i in range(size)]
+
+def test_matches_brute_force():
+    """Test the DP finds the optimum under FLEX and SUPERFLEX rules"""
+    print("Testing DP against brute force...")
+
+    rng = random.Random(7)
+    slots = {"QB": 1, "RB": 1, "WR": 2, "TE": 1, "FLEX": 1, "SUPERFLEX": 1}
+    for trial in range(40):
+        players = _random_roster(rng, 9)
+        result = optimize_lineup(players, slots)
+        expected = round(_brute_force(players, slots), 2)
+        assert result["points"] == expected, f"Trial {trial}: DP {result['points']} != brute force {expected}"
+        assert len(result["starters"]) + len(result["bench"]) == len(players), "Every player is placed once"
+        for starter in result["starters"]:
+            assert starter["position"] in SLOT_POSITIONS[starter["slot"]], f"Ineligible starter {starter}"
+
+    print("✅ DP matches brute force!")
+    return True
+
+def test_flex_choice():
+    """Test FLEX takes the best leftover RB/WR/TE and never a QB"""
+    print("Testing FLEX choice...")
+
+    players = [
+        {"name": "QB1", "position": "QB", "points": 20.0},
+        {"name": "QB2", "position": "QB", "points": 18.0},
+        {"name": "RB1", "position": "RB", "points": 15.0},
+        {"name": "RB2", "position": "RB", "points": 9.0},
+        {"name": "WR1", "position": "WR", "points": 14.0},
+        {"name": "WR2", "position": "WR", "points": 12.0},
+        {"name": "TE1", "position": "TE", "points": 8.0},
+    ]
+    result = optimize_lineup(players, {"QB": 1, "RB": 1, "WR": 1, "TE": 1, "FLEX": 1})
+    slots = {starter["slot"]: starter["name"] for starter in result["starters"]}
+
+    assert slots == {"QB": "QB1", "RB": "RB1", "WR": "WR1", "TE": "TE1", "FLEX": "WR2"}, f"Unexpected lineup {slots}"
+    assert result["points"] == 69.0, f"Expected 69.0, got {result['points']}"
+    assert [p["name"] for p in result["bench"]] == ["QB2", "RB2"], f"Unexpected bench {result['bench']}"
+
+    print("✅ FLEX choice correct!")
+    return True
+
+def test_roster_resolution():
+    """Test rosters accept PFR codes and names, and unknown players sit"""
+    print("Testing roster resolution...")
+
+    players = roster_players(STORE, ["ChasJa00", "Saquon Barkley", "Not A Player"], POINTS)
+    assert players[0]["name"] == "Ja'Marr Chase", f"Code lookup failed: {players[0]}"
+    assert players[1]["code"] == "BarkSa00", f"Name lookup failed: {players[1]}"
+    assert players[2]["points"] is None, "Unknown players have no projection"
+
+    result = optimize_lineup(players)
+    assert {s["name"] for s in result["starters"]} == {"Ja'Marr Chase", "Saquon Barkley"}, "Known players start"
+    assert result["bench"][0]["name"] == "Not A Player", "Unknown players sit"
+
+    print("✅ Roster resolution correct!")
+    return True
+
+def test_pooled_batch():
+    """Test pooled solving matches one-by-one solving in roster order"""
+    print("Testing pooled batch solve...")
+
+    rng = random.Random(11)
+    pool = list(POINTS.values())
+    rosters = [rng.sample(pool, 16) for _ in range(60)]
+
+    pooled = optimize_rosters(rosters, max_workers=2)
+    single = [optimize_lineup(roster) for roster in rosters]
+    assert [r["points"] for r in pooled] == [r["points"] for r in single], "Pooled results differ"
+
+    print("✅ Pooled batch solve correct!")
+    return True
+
+def run_all_tests():
+    """Run all tests and report results"""
+    print("\n" + "="*60)
+    print("🏈 LINEUP OPTIMIZER TEST SUITE 🏈")
+    print("="*60 + "\n")
+
+    tests = [
+        ("Brute Force", test_matches_brute_force),
+        ("FLEX Choice", test_flex_choice),
+        ("Roster Resolution", test_roster_resolution),
+        ("Pooled Batch", test_pooled_batch)
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL TESTS PASSED! 🎉")
+    else:
+        print("⚠️  Some tests failed. Please review the errors above.")
+    print("="*60 + "\n")
+
+    return failed == 0
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
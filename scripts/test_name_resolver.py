@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Test suite for the FantasyPros to PFR name resolver
+Validates normalization, team aliases, fuzzy matching and persisted overrides
+"""
+
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from name_resolver import NameResolver, build_resolver, fantasy_pros_records, normalize_name, normalize_team
+
+RESOLVER = build_resolver(overrides_path=None)
+
+def test_normalization():
+    """Test suffixes, punctuation and team aliases normalize away"""
+    print("Testing name and team normalization...")
+
+    assert normalize_name("Brian Thomas Jr.") == normalize_name("Brian Thomas"), "Suffix not stripped"
+    assert normalize_name("D.J. Moore") == normalize_name("DJ Moore"), "Initials not collapsed"
+    assert normalize_name("Ray-Ray McCloud III") == "ray ray mccloud", f"Got {normalize_name('Ray-Ray McCloud III')}"
+    assert normalize_team("JAC") == "JAX", "JAC should alias to JAX"
+    assert normalize_team("KC") == "KAN", "KC should alias to KAN"
+    assert normalize_team("GB") == "GNB", "GB should alias to GNB"
+    assert normalize_team("FA") is None, "Free agents carry no team"
+
+    print("✅ Normalization correct!")
+    return True
+
+def test_exact_and_fuzzy_matches():
+    """Test suffix variants resolve exactly and nicknames resolve fuzzily"""
+    print("Testing matches...")
+
+    thomas = RESOLVER.resolve("Brian Thomas Jr.", "JAC", 2024, "WR")
+    assert thomas and thomas["code"] == "ThomBr06", f"Unexpected match {thomas}"
+    assert thomas["method"] == "exact", "Suffix variant should be an exact match"
+
+    cases = {
+        ("Gabe Davis", "FA"): "DaviGa01",
+        ("Dee Eskridge", "MIA"): "EskrDW00",
+        ("Nyheim Miller-Hines", "LAC"): "HineNy00",
+    }
+    for (name, team), code in cases.items():
+        match = RESOLVER.resolve(name, team, 2023)
+        assert match and match["code"] == code, f"{name} resolved to {match}"
+        assert match["method"] == "fuzzy", f"{name} should be a fuzzy match"
+
+    assert RESOLVER.resolve("Zzyzx Qwerty", "NYJ", 2024) is None, "Unknown names should not match"
+
+    print("✅ Matches correct!")
+    return True
+
+def test_bulk_resolution():
+    """Test every FantasyPros row resolves to a PFR ID"""
+    print("Testing bulk resolution...")
+
+    records = fantasy_pros_records()
+    matches = RESOLVER.resolve_many(records)
+    unresolved = sorted({record[0] for record, match in zip(records, matches) if match is None})
+
+    assert len(records) > 1500, f"Expected 1500+ FantasyPros rows, got {len(records)}"
+    assert not unresolved, f"Unresolved names: {unresolved}"
+
+    print(f"✅ All {len(records)} rows resolved!")
+    return True
+
+def test_overrides_persist():
+    """Test overrides take precedence and survive a reload"""
+    print("Testing override table...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "name_overrides.json"
+        resolver = NameResolver(path)
+        resolver.add_player("ChasJa00", "Ja'Marr Chase", 2024, "CIN", "WR")
+        resolver.add_player("HiggTe00", "Tee Higgins", 2024, "CIN", "WR")
+
+        resolver.add_override("Chase", "ChasJa00", "CIN")
+        resolver.add_override("Tee Higgins", None)
+        resolver.save_overrides()
+
+        reloaded = NameResolver(path)
+        reloaded.add_player("ChasJa00", "Ja'Marr Chase", 2024, "CIN", "WR")
+        reloaded.add_player("HiggTe00", "Tee Higgins", 2024, "CIN", "WR")
+
+        match = reloaded.resolve("Chase", "CIN", 2024)
+        assert match and match["method"] == "override", f"Override not applied: {match}"
+        assert reloaded.resolve("Tee Higgins", "CIN", 2024) is None, "A null override should block the match"
+
+    print("✅ Override table correct!")
+    return True
+
+def run_all_tests():
+    """Run all tests and report results"""
+    print("\n" + "="*60)
+    print("🏈 NAME RESOLVER TEST SUITE 🏈")
+    print("="*60 + "\n")
+
+    tests = [
+        ("Normalization", test_normalization),
+        ("Exact And Fuzzy Matches", test_exact_and_fuzzy_matches),
+        ("Bulk Resolution", test_bulk_resolution),
+        ("Override Table", test_overrides_persist)
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL TESTS PASSED! 🎉")
+    else:
+        print("⚠️  Some tests failed. Please review the errors above.")
+    print("="*60 + "\n")
+
+    return failed == 0
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
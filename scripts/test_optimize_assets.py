@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Test suite for asset optimization
+Validates responsive WebP/AVIF generation, the variant manifest and the savings report
+"""
+
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import gzip
+
+from optimize_assets import Image, IMAGE_WIDTHS, analyze_assets, avif_supported, brotli, compress_assets, optimize_images, target_widths
+
+def _make_png(path: Path, width: int, height: int):
+    img = Image.new("RGBA", (width, height))
+    for x in range(0, width, 8):
+        for y in range(0, height, 8):
+            img.putpixel((x, y), (x % 256, y % 256, 128, 255))
+    img.save(path, "PNG")
+
+def test_target_widths():
+    """Test widths never upscale and always include the original width"""
+    print("Testing responsive widths...")
+
+    assert target_widths(1024) == [320, 640, 1024], f"Unexpected widths {target_widths(1024)}"
+    assert target_widths(200) == [200], f"Small images should keep their width, got {target_widths(200)}"
+    assert target_widths(2000) == IMAGE_WIDTHS + [2000], "Large images should get every width"
+
+    print("✅ Responsive widths correct!")
+    return True
+
+def test_optimize_and_skip():
+    """Test variants are generated, PNGs kept, and up-to-date outputs skipped"""
+    print("Testing image optimization...")
+
+    if Image is None:
+        print("⚠️  Pillow not installed, skipping")
+        return True
+
+    with tempfile.TemporaryDirectory() as tmp:
+        images_dir = Path(tmp) / "images"
+        images_dir.mkdir()
+        _make_png(images_dir / "logo.png", 700, 350)
+        report_path = Path(tmp) / "asset_report.json"
+        report_path.write_text(json.dumps({"total_size_kb": 1.0}))
+
+        manifest_path = Path(tmp) / "imageVariants.json"
+        summary = optimize_images(images_dir, report_path=report_path, max_workers=2, manifest_path=manifest_path)
+        formats = ["webp", "avif"] if avif_supported() else ["webp"]
+        expected = {f"logo-{w}.{fmt}" for w in (320, 640, 700) for fmt in formats}
+        produced = {p.name for p in (images_dir / "optimized").iterdir()}
+
+        assert produced == expected, f"Expected {expected}, got {produced}"
+        assert (images_dir / "logo.png").exists(), "PNG fallback was removed"
+
+        report = json.loads(report_path.read_text())
+        assert report["total_size_kb"] == 1.0, "Existing report fields were lost"
+        assert report["image_optimization"]["saved_kb"] == summary["saved_kb"], "Savings not recorded"
+
+        manifest = json.loads(manifest_path.read_text())
+        assert manifest == {"logo.png": {"widths": [320, 640, 700], "formats": sorted(formats)}}, \
+            f"Manifest should list every generated variant, AVIF first: {manifest}"
+
+        again = optimize_images(images_dir, report_path=report_path, max_workers=2, manifest_path=manifest_path)
+        variants = again["files"][0]["variants"]
+        assert all(v["skipped"] for v in variants), "Up-to-date outputs were re-encoded"
+
+    print("✅ Image optimization correct!")
+    return True
+
+def test_compress_sidecars():
+    """Test .gz/.br sidecars round-trip and raw vs compressed sizes are reported"""
+    print("Testing precompressed sidecars...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp) / "data"
+        (data_dir / "normalized").mkdir(parents=True)
+        csv_text = "Rk,Player,Yds\n" + "".join(f"{i},Player {i},{i * 10}\n" for i in range(500))
+        (data_dir / "stats.csv").write_text(csv_text)
+        (data_dir / "normalized" / "stats.json").write_text('{"rows": []}')
+        (data_dir / "logo.png").write_bytes(b"not text")
+        report_path = Path(tmp) / "asset_report.json"
+
+        summary = compress_assets([data_dir], report_path=report_path, max_workers=2)
+
+        assert summary["file_count"] == 2, f"Expected 2 text files, got {summary['file_count']}"
+        assert not (data_dir / "logo.png.gz").exists(), "Binary assets should not be compressed"
+        assert gzip.decompress((data_dir / "stats.csv.gz").read_bytes()).decode() == csv_text, "gzip round-trip failed"
+        if brotli is not None:
+            assert brotli.decompress((data_dir / "stats.csv.br").read_bytes()).decode() == csv_text, "brotli round-trip failed"
+
+        entry = next(f for f in summary["files"] if f["name"] == "data/stats.csv")
+        assert entry["gzip_kb"] < entry["raw_kb"], "Compressed size should be smaller"
+        report = json.loads(report_path.read_text())
+        assert report["compression"]["raw_kb"] == summary["raw_kb"], "Sizes not recorded in report"
+
+        analysis = analyze_assets(report_path)
+        report = json.loads(report_path.read_text())
+        assert report["compression"]["raw_kb"] == summary["raw_kb"], "Analysis should keep the compression section"
+        assert report["total_size_kb"] == analysis["total_size_kb"], "Analysis keys not written"
+
+    print("✅ Precompressed sidecars correct!")
+    return True
+
+def run_all_tests():
+    """Run all tests and report results"""
+    print("\n" + "="*60)
+    print("🏈 ASSET OPTIMIZATION TEST SUITE 🏈")
+    print("="*60 + "\n")
+
+    tests = [
+        ("Responsive Widths", test_target_widths),
+        ("Optimize and Skip", test_optimize_and_skip),
+        ("Compressed Sidecars", test_compress_sidecars)
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL TESTS PASSED! 🎉")
+    else:
+        print("⚠️  Some tests failed. Please review the errors above.")
+    print("="*60 + "\n")
+
+    return failed == 0
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Test suite for the unified player-season store
+Validates integer IDs, array columns and cross-file lookups
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from player_store import load_store
+
+STORE = load_store()
+
+def test_player_ids_from_pfr_codes():
+    """Test PFR codes map to one stable integer ID across files"""
+    print("Testing player ID mapping...")
+
+    chase = STORE.player_id("ChasJa00")
+    assert chase is not None, "ChasJa00 not found"
+    assert STORE.player_names[chase] == "Ja'Marr Chase", f"Unexpected name {STORE.player_names[chase]}"
+
+    receiving = STORE.tables["receiving"]
+    rushing = STORE.tables["rushing"]
+    assert receiving.row_index(chase, 2024) is not None, "Missing 2024 receiving line"
+    assert rushing.row_index(chase, 2024) is not None, "Missing 2024 rushing line"
+
+    print("✅ Player ID mapping correct!")
+    return True
+
+def test_season_lookup_values():
+    """Test O(1) lookups return the right stat line"""
+    print("Testing player-season lookups...")
+
+    chase = STORE.player_id("ChasJa00")
+    lines = STORE.lookup(chase, 2024, "regular")
+
+    assert lines["receiving"]["Yds"] == 1708, f"Expected 1708 Yds, got {lines['receiving']['Yds']}"
+    assert lines["receiving"]["Team"] == "CIN", "Team code mismatch"
+    assert "fantasypros_totals_wr" in lines, "FantasyPros totals not joined to PFR ID"
+
+    barkley = STORE.lookup(STORE.player_id("BarkSa00"), 2024)
+    assert "fantasypros_totals_rb" in barkley and "fantasypros_totals_wr" not in barkley, \
+        "RB and WR FantasyPros files should load into separate tables"
+    assert barkley["fantasypros_totals_rb"]["YDS"] == barkley["rushing"]["Yds"], "RB file YDS should be rushing yards"
+    assert len(STORE.fantasy_pros_tables("Totals")) == 2, "Expected one totals table per position"
+
+    playoff = STORE.lookup(STORE.player_id("WortXa00"), 2024, "playoff")
+    assert playoff["receiving"]["Yds"] == 287, f"Expected 287 playoff Yds, got {playoff['receiving']['Yds']}"
+
+    print("✅ Player-season lookups correct!")
+    return True
+
+def test_multi_team_rows():
+    """Test the combined 2TM line is the default and team splits stay reachable"""
+    print("Testing multi-team rows...")
+
+    adams = STORE.player_id("AdamDa01")
+    receiving = STORE.tables["receiving"]
+
+    row = receiving.row_index(adams, 2024)
+    assert STORE.teams[receiving.team[row]] == "2TM", "Combined line should be the default"
+
+    nyj = receiving.row_index(adams, 2024, team=STORE.teams.codes["NYJ"])
+    assert receiving.value("Yds", nyj) == 854, f"Expected 854 NYJ Yds, got {receiving.value('Yds', nyj)}"
+
+    print("✅ Multi-team rows correct!")
+    return True
+
+def test_missing_columns_padded():
+    """Test columns absent from some files are padded with missing values"""
+    print("Testing column padding...")
+
+    passing = STORE.tables["passing"]
+    for key, column in passing.numeric.items():
+        assert len(column) == len(passing), f"Column {key} has {len(column)} rows, expected {len(passing)}"
+
+    mahomes = STORE.player_id("MahoPa00")
+    row = passing.row_index(mahomes, 2023, "playoff")
+    assert passing.value("QBR", row) is None, "Playoff passing has no QBR column"
+
+    print("✅ Column padding correct!")
+    return True
+
+def test_memory_footprint():
+    """Test the full 2022-2024 history stays within a few MB"""
+    print("Testing memory footprint...")
+
+    size_mb = STORE.nbytes() / (1024 * 1024)
+    assert size_mb < 5, f"Store uses {size_mb:.1f} MB"
+
+    print(f"✅ Store uses {size_mb:.2f} MB!")
+    return True
+
+def run_all_tests():
+    """Run all tests and report results"""
+    print("\n" + "="*60)
+    print("🏈 PLAYER STORE TEST SUITE 🏈")
+    print("="*60 + "\n")
+
+    tests = [
+        ("Player IDs", test_player_ids_from_pfr_codes),
+        ("Season Lookups", test_season_lookup_values),
+        ("Multi-Team Rows", test_multi_team_rows),
+        ("Column Padding", test_missing_columns_padded),
+        ("Memory Footprint", test_memory_footprint)
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL TESTS PASSED! 🎉")
+    else:
+        print("⚠️  Some tests failed. Please review the errors above.")
+    print("="*60 + "\n")
+
+    return failed == 0
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Test suite for the Monte Carlo projection engine
+Validates model fitting, games-played draws, percentile ordering and seeded reproducibility
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import statistics
+from player_store import load_store
+from projections import fit_players, games_cdf, games_played, player_draws, run_projections, simulate_player
+
+MODELS = fit_players(load_store())
+BY_CODE = {model["code"]: model for model in MODELS}
+SIMS = 4000
+
+def test_fit_players():
+    """Test models carry blended per-game rates, availability and talent spread"""
+    print("Testing model fitting...")
+
+    assert len(MODELS) > 400, f"Expected a full draft pool, got {len(MODELS)} players"
+
+    chase = BY_CODE["ChasJa00"]
+    assert chase["position"] == "WR", f"Unexpected position {chase['position']}"
+    assert 70 < chase["per_game"]["rec_yds"] < 110, f"Unexpected rec_yds/game {chase['per_game']['rec_yds']}"
+    assert 0.55 <= chase["availability"] <= 0.95, f"Availability {chase['availability']} out of range"
+    assert chase["talent_sd"] > 0, "Talent spread should be positive"
+
+    positions = {model["position"] for model in MODELS}
+    assert positions == {"QB", "RB", "WR", "TE"}, f"Unexpected positions {positions}"
+
+    print("✅ Model fitting correct!")
+    return True
+
+def test_games_played_draws():
+    """Test inverse-transform games played follow the binomial mean"""
+    print("Testing games-played draws...")
+
+    cdf = games_cdf(0.8)
+    assert abs(cdf[-1] - 1.0) < 1e-12, "CDF should end at 1"
+
+    uniform = sorted((i + 0.5) / 10000 for i in range(10000))
+    games = games_played(cdf, uniform)
+    mean = sum(games) / len(games)
+    assert len(games) == 10000, f"Expected 10000 draws, got {len(games)}"
+    assert abs(mean - 17 * 0.8) < 0.05, f"Expected mean 13.6 games, got {mean:.2f}"
+
+    print("✅ Games-played draws correct!")
+    return True
+
+def test_percentiles_ordered():
+    """Test floor <= median <= ceiling and PPR lifts a receiver over standard"""
+    print("Testing percentile output...")
+
+    result = simulate_player(BY_CODE["ChasJa00"], {"standard": {"rec_yds": 0.1, "rec_td": 6.0},
+                                                   "ppr": {"rec_yds": 0.1, "rec_td": 6.0, "rec": 1.0}}, SIMS)
+    for horizon in ("season", "weekly"):
+        for profile, summary in result[horizon].items():
+            assert summary["floor"] <= summary["median"] <= summary["ceiling"], \
+                f"{horizon} {profile} percentiles out of order: {summary}"
+    assert result["season"]["ppr"]["median"] > result["season"]["standard"]["median"], "PPR should add points"
+    assert 150 < result["season"]["ppr"]["median"] < 400, f"Implausible median {result['season']['ppr']['median']}"
+
+    print("✅ Percentile output correct!")
+    return True
+
+def test_seeded_reproducibility():
+    """Test results depend on the seed but not on the worker count, and players draw independently"""
+    print("Testing seeded reproducibility...")
+
+    models = MODELS[:12]
+    serial = run_projections(models, sims=SIMS, seed=7, max_workers=1)
+    pooled = run_projections(models, sims=SIMS, seed=7, max_workers=2)
+    other = run_projections(models, sims=SIMS, seed=8, max_workers=1)
+
+    assert serial == pooled, "Pool results differ from a serial run with the same seed"
+    assert serial != other, "A different seed should change the draws"
+
+    chase, jefferson = player_draws("ChasJa00", SIMS, 7), player_draws("JeffJu00", SIMS, 7)
+    assert chase == player_draws("ChasJa00", SIMS, 7), "A player's draws should be reproducible"
+    for name in ("talent", "season", "week"):
+        correlation = statistics.correlation(chase[name], jefferson[name])
+        assert abs(correlation) < 0.1, f"Players should draw independently, {name} correlation {correlation:.2f}"
+
+    print("✅ Seeded reproducibility correct!")
+    return True
+
+def run_all_tests():
+    """Run all tests and report results"""
+    print("\n" + "="*60)
+    print("🏈 PROJECTION ENGINE TEST SUITE 🏈")
+    print("="*60 + "\n")
+
+    tests = [
+        ("Model Fitting", test_fit_players),
+        ("Games Played", test_games_played_draws),
+        ("Percentiles", test_percentiles_ordered),
+        ("Reproducibility", test_seeded_reproducibility)
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL TESTS PASSED! 🎉")
+    else:
+        print("⚠️  Some tests failed. Please review the errors above.")
+    print("="*60 + "\n")
+
+    return failed == 0
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
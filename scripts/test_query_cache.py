@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Test suite for the query cache
+Validates LRU eviction, the disk tier, source-change invalidation and cached views
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import shutil
+import tempfile
+from pathlib import Path
+from ingest_data import DATA_DIR, normalize_pfr_file
+from query_cache import QueryCache, cached_view, dataset_spec, derived_view
+from team_metrics import share_columns
+
+DATASET = "pff-nfl-regular-receiving-2024.csv"
+
+def _counter():
+    calls = []
+    def compute(value):
+        calls.append(value)
+        return {"value": value, "padding": "x" * 80}
+    return calls, compute
+
+def test_memory_lru():
+    """Test hits, the byte cap and least-recently-used eviction"""
+    print("Testing memory LRU...")
+
+    source = DATA_DIR / DATASET
+    cache = QueryCache(max_bytes=300)
+    calls, compute = _counter()
+
+    cache.get_or_compute("q", [source], {"n": 1}, lambda: compute(1))
+    cache.get_or_compute("q", [source], {"n": 2}, lambda: compute(2))
+    cache.get_or_compute("q", [source], {"n": 1}, lambda: compute(1))
+    assert calls == [1, 2], f"Repeat query should hit, computed {calls}"
+
+    # Third entry overflows 300 bytes; n=2 is least recently used
+    cache.get_or_compute("q", [source], {"n": 3}, lambda: compute(3))
+    assert cache.counts["evicted"] == 1, f"Expected one eviction, got {cache.stats()}"
+    assert cache.bytes <= 300, f"Cache over its cap: {cache.bytes}"
+    cache.get_or_compute("q", [source], {"n": 1}, lambda: compute(1))
+    cache.get_or_compute("q", [source], {"n": 2}, lambda: compute(2))
+    assert calls == [1, 2, 3, 2], f"Only the evicted entry should recompute, computed {calls}"
+
+    print("✅ Memory LRU correct!")
+    return True
+
+def test_disk_tier_and_invalidation():
+    """Test a fresh cache hits disk, and editing the source CSV invalidates both tiers"""
+    print("Testing disk tier and invalidation...")
+
+    workdir = Path(tempfile.mkdtemp())
+    try:
+        shutil.copy(DATA_DIR / DATASET, workdir / DATASET)
+        params = {"position": "WR", "min_targets": 80, "advanced": True, "sort": "estimatedYprr", "limit": 5}
+
+        first = QueryCache(disk_dir=workdir / "cache")
+        rows = cached_view(first, DATASET, data_dir=workdir, **params)
+        assert first.counts["miss"] == 1, f"First query should miss: {first.stats()}"
+
+        second = QueryCache(disk_dir=workdir / "cache")
+        again = cached_view(second, DATASET, data_dir=workdir, **params)
+        assert second.counts["disk"] == 1, f"New process should hit disk: {second.stats()}"
+        assert again == rows, "Disk entry should round-trip the rows"
+
+        with open(workdir / DATASET, "r", encoding="utf-8") as f:
+            text = f.read()
+        with open(workdir / DATASET, "w", encoding="utf-8") as f:
+            f.write(text.replace("Ja'Marr Chase", "Ja'Marr Chase Jr", 1))
+        os.utime(workdir / DATASET, ns=(0, 0))
+
+        changed = cached_view(second, DATASET, data_dir=workdir, **params)
+        assert second.counts["miss"] == 1, f"Edited source should miss: {second.stats()}"
+        assert changed[0]["Player"] == "Ja'Marr Chase Jr", f"Stale rows served: {changed[0]['Player']}"
+    finally:
+        shutil.rmtree(workdir)
+
+    print("✅ Disk tier and invalidation correct!")
+    return True
+
+def test_derived_view():
+    """Test filters, advanced metrics and sorting"""
+    print("Testing derived view...")
+
+    rows = derived_view(DATASET, position="WR", min_targets=80, advanced=True, sort="Yds")
+    assert all("WR" in row["Pos"] and row["Tgt"] >= 80 for row in rows), "Filters not applied"
+    assert rows[0]["Player"] == "Ja'Marr Chase", f"Expected Chase first by yards, got {rows[0]['Player']}"
+    # Scored by scoring.py from the receiving line: 1708 yds, 17 TD, 127 rec half-PPR
+    assert rows[0]["fantasyPoints"] == 336.3, f"Unexpected fantasy points {rows[0]['fantasyPoints']}"
+    ppr = derived_view(DATASET, position="WR", min_targets=80, advanced=True, sort="Yds", profile="ppr")
+    assert ppr[0]["fantasyPoints"] == 399.8, f"The selected profile should score receptions: {ppr[0]['fantasyPoints']}"
+    tight_ends = derived_view(DATASET, position="TE", advanced=True, profile="te_premium")
+    assert all(row["Pos"] == "TE" for row in tight_ends), "Position should match exactly"
+    line = tight_ends[0]
+    expected = line["Yds"] * 0.1 + line["TD"] * 6 + line["Rec"] * 1.5
+    assert abs(line["fantasyPoints"] - round(expected, 2)) < 1e-9, "TE premium should apply to tight ends"
+    assert [row["Yds"] for row in rows] == sorted((row["Yds"] for row in rows), reverse=True), "Not sorted"
+
+    # Target share is the team_metrics share of team targets, not a per-game placeholder
+    payload = normalize_pfr_file(dataset_spec(DATASET))
+    data = payload["data"]
+    shares = dict(zip(zip(data["Player"], data["Team"]), share_columns(payload)[0]["TgtShare"]))
+    assert all(row["targetShare"] == shares[row["Player"], row["Team"]] for row in rows), \
+        "Target share should match team_metrics"
+    assert "adot" not in rows[0] and "estimatedAdot" in rows[0], "Approximate metrics should be named as estimates"
+
+    print("✅ Derived view correct!")
+    return True
+
+def run_all_tests():
+    """Run all tests and report results"""
+    print("\n" + "="*60)
+    print("🏈 QUERY CACHE TEST SUITE 🏈")
+    print("="*60 + "\n")
+
+    tests = [
+        ("Memory LRU", test_memory_lru),
+        ("Disk Tier", test_disk_tier_and_invalidation),
+        ("Derived View", test_derived_view)
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL TESTS PASSED! 🎉")
+    else:
+        print("⚠️  Some tests failed. Please review the errors above.")
+    print("="*60 + "\n")
+
+    return failed == 0
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Test suite for the multi-season player rollups
+Validates summed stats, recomputed rates and incremental season caching
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ingest_data import DATA_DIR, PFR_DATA_FILES
+from rollups import build_rollups, merge_sums, passer_rating
+
+def test_single_season_matches_source():
+    """Test a one-season rollup reproduces the PFR line, rates included"""
+    print("Testing single-season rollup...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        history, _ = build_rollups(cache_dir=Path(tmp))
+
+    receiving = history["ChasJa00"]["seasons"]["2024"]["regular"]["receiving"]
+    expected = {"Tgt": 175, "Rec": 127, "Yds": 1708, "Ctch%": 72.6, "Y/Tgt": 9.8, "Y/G": 100.5, "Succ%": 62.3}
+    for key, value in expected.items():
+        assert receiving[key] == value, f"{key}: expected {value}, got {receiving[key]}"
+
+    adams = history["AdamDa01"]["seasons"]["2024"]["regular"]
+    assert adams["teams"] == ["LVR", "NYJ"], f"Unexpected teams {adams['teams']}"
+    assert adams["receiving"]["Yds"] == 1063, "Multi-team splits should not be double counted"
+
+    print("✅ Single-season rollup correct!")
+    return True
+
+def test_combined_and_career():
+    """Test regular+playoff and career totals add up with weighted rates"""
+    print("Testing combined and career rollups...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        history, _ = build_rollups(cache_dir=Path(tmp))
+
+    chase = history["ChasJa00"]
+    regular = [chase["seasons"][year]["regular"]["receiving"] for year in ("2022", "2023", "2024")]
+    career = chase["career"]["regular"]["receiving"]
+
+    assert career["Yds"] == sum(season["Yds"] for season in regular), "Career yards do not sum"
+    expected = round(career["Rec"] / career["Tgt"] * 100, 1)
+    assert career["Ctch%"] == expected, f"Career Ctch% should be target-weighted, got {career['Ctch%']}"
+
+    combined = chase["seasons"]["2022"]["combined"]["receiving"]
+    playoff = chase["seasons"]["2022"]["playoff"]["receiving"]
+    assert combined["Yds"] == regular[0]["Yds"] + playoff["Yds"], "Regular+playoff yards do not sum"
+    assert combined["Lng"] == max(regular[0]["Lng"], playoff["Lng"]), "Lng should take the max"
+
+    print("✅ Combined and career rollups correct!")
+    return True
+
+def test_helpers():
+    """Test partial merging and the passer rating formula"""
+    print("Testing rollup helpers...")
+
+    merged = merge_sums([{"receiving": {"Yds": 10, "Lng": 8}}, {"receiving": {"Yds": 5, "Lng": 12}}])
+    assert merged == {"receiving": {"Yds": 15, "Lng": 12}}, f"Unexpected merge {merged}"
+
+    rating = passer_rating(460, 652, 4918, 43, 9)
+    assert rating == 108.5, f"Expected Burrow's 108.5 rating, got {rating}"
+
+    print("✅ Rollup helpers correct!")
+    return True
+
+def test_incremental_rebuild():
+    """Test only seasons whose source files changed are rebuilt"""
+    print("Testing incremental rebuilds...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp) / "data"
+        cache_dir = Path(tmp) / "rollups"
+        data_dir.mkdir()
+        for spec in PFR_DATA_FILES:
+            shutil.copy(DATA_DIR / spec["fileName"], data_dir / spec["fileName"])
+
+        _, rebuilt = build_rollups(data_dir, cache_dir)
+        assert len(rebuilt) == 6, f"First run should build every season, got {rebuilt}"
+
+        _, rebuilt = build_rollups(data_dir, cache_dir)
+        assert rebuilt == [], f"Unchanged sources should not rebuild, got {rebuilt}"
+
+        with open(data_dir / "pff-nfl-playoff-rushing-2023.csv", "a") as f:
+            f.write("\n")
+        history, rebuilt = build_rollups(data_dir, cache_dir)
+        assert rebuilt == ["2023-playoff"], f"Expected only 2023-playoff, got {rebuilt}"
+        assert history["ChasJa00"]["seasons"]["2024"]["regular"]["receiving"]["Yds"] == 1708, \
+            "Cached seasons lost data"
+
+    print("✅ Incremental rebuilds correct!")
+    return True
+
+def run_all_tests():
+    """Run all tests and report results"""
+    print("\n" + "="*60)
+    print("🏈 PLAYER ROLLUPS TEST SUITE 🏈")
+    print("="*60 + "\n")
+
+    tests = [
+        ("Single Season", test_single_season_matches_source),
+        ("Combined And Career", test_combined_and_career),
+        ("Helpers", test_helpers),
+        ("Incremental Rebuild", test_incremental_rebuild)
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL TESTS PASSED! 🎉")
+    else:
+        print("⚠️  Some tests failed. Please review the errors above.")
+    print("="*60 + "\n")
+
+    return failed == 0
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Test suite for the fantasy scoring engine
+Validates points computed from raw PFR stat columns under each profile
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from array import array
+from player_store import load_store
+from scoring import SCORING_PROFILES, score_matrix, score_seasons
+
+STORE = load_store()
+SCORED = score_seasons(STORE)
+
+def _points(code, profile, year=2024, season_type="regular"):
+    row = SCORED.row_index(STORE.player_id(code), year, season_type)
+    return round(SCORED.points[profile][row], 2)
+
+def test_receiver_profiles():
+    """Test Ja'Marr Chase 2024: 127 rec, 1708 + 32 yds, 17 TD, 0 fumbles"""
+    print("Testing receiver scoring...")
+
+    assert _points("ChasJa00", "standard") == 276.0, f"Standard mismatch: {_points('ChasJa00', 'standard')}"
+    assert _points("ChasJa00", "half_ppr") == 339.5, f"Half-PPR mismatch: {_points('ChasJa00', 'half_ppr')}"
+    assert _points("ChasJa00", "ppr") == 403.0, f"PPR mismatch: {_points('ChasJa00', 'ppr')}"
+
+    print("✅ Receiver scoring correct!")
+    return True
+
+def test_passing_td_profile():
+    """Test 6-pt passing TDs add 2 points per passing TD"""
+    print("Testing 6-pt passing TD profile...")
+
+    # Joe Burrow threw 43 TD in 2024
+    diff = round(_points("BurrJo01", "six_pt_pass_td") - _points("BurrJo01", "ppr"), 2)
+    assert diff == 86.0, f"Expected +86.0 for 43 passing TD, got {diff}"
+
+    print("✅ 6-pt passing TD profile correct!")
+    return True
+
+def test_te_premium():
+    """Test TE premium only boosts tight ends"""
+    print("Testing TE premium profile...")
+
+    # Zach Ertz (TE) vs Ja'Marr Chase (WR)
+    ertz_diff = round(_points("ErtzZa00", "te_premium") - _points("ErtzZa00", "ppr"), 2)
+    chase_diff = round(_points("ChasJa00", "te_premium") - _points("ChasJa00", "ppr"), 2)
+
+    ertz = STORE.lookup(STORE.player_id("ErtzZa00"), 2024)
+    assert ertz_diff == ertz["receiving"]["Rec"] * 0.5, f"TE bonus mismatch: {ertz_diff}"
+    assert chase_diff == 0, f"WR should get no TE bonus, got {chase_diff}"
+
+    print("✅ TE premium profile correct!")
+    return True
+
+def test_batched_matrix():
+    """Test batch scoring matches a row-by-row dot product"""
+    print("Testing batched scoring...")
+
+    stats = {"a": array("d", [1.0, 2.0, 3.0]), "b": array("d", [10.0, 0.0, -5.0])}
+    profiles = {"x": {"a": 1.0, "b": 0.5}, "y": {"b": 2.0}}
+    points = score_matrix(stats, profiles)
+
+    assert list(points["x"]) == [6.0, 2.0, 0.5], f"Unexpected x points {list(points['x'])}"
+    assert list(points["y"]) == [20.0, 0.0, -10.0], f"Unexpected y points {list(points['y'])}"
+
+    try:
+        score_matrix(stats, {"bad": {"missing": 1.0}})
+        raise AssertionError("Unknown stats should be rejected")
+    except ValueError:
+        pass
+
+    print("✅ Batched scoring correct!")
+    return True
+
+def test_leaderboard_sorted():
+    """Test leaderboards are sorted and cover every profile"""
+    print("Testing leaderboards...")
+
+    for profile in SCORING_PROFILES:
+        leaders = SCORED.leaderboard(profile, 2024, position="WR", limit=10)
+        assert len(leaders) == 10, f"Expected 10 leaders for {profile}"
+        values = [points for _, points in leaders]
+        assert values == sorted(values, reverse=True), f"{profile} leaderboard not sorted"
+
+    print("✅ Leaderboards correct!")
+    return True
+
+def run_all_tests():
+    """Run all tests and report results"""
+    print("\n" + "="*60)
+    print("🏈 FANTASY SCORING TEST SUITE 🏈")
+    print("="*60 + "\n")
+
+    tests = [
+        ("Receiver Profiles", test_receiver_profiles),
+        ("6-pt Passing TD", test_passing_td_profile),
+        ("TE Premium", test_te_premium),
+        ("Batched Matrix", test_batched_matrix),
+        ("Leaderboards", test_leaderboard_sorted)
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL TESTS PASSED! 🎉")
+    else:
+        print("⚠️  Some tests failed. Please review the errors above.")
+    print("="*60 + "\n")
+
+    return failed == 0
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -8,13 +8,15 @@ import sys
 import os
 import json
 import csv
+import tempfile
 from typing import Dict, List, Any
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Import the scraper functions
-from scrape_fantasy_pros import get_sample_wr_data_2024, get_sample_rb_data_2024, save_to_csv
+from scrape_fantasy_pros import get_sample_wr_data_2024, get_sample_rb_data_2024, save_to_csv, stream_to_csv, run_pipeline, MANIFEST_FILE
+from validate_data import SAMPLE_SCHEMAS, validate_rows
 
 def test_jamarr_chase_stats():
     """Test Ja'Marr Chase's exact statistics"""
@@ -80,23 +82,9 @@ def test_data_ranges():
     """Test that data values are within reasonable ranges"""
     print("Testing data value ranges...")
     
-    wr_data = get_sample_wr_data_2024()
-    
-    for player in wr_data:
-        # Games should be between 1 and 17
-        assert 1 <= player["G"] <= 17, f"Invalid games count {player['G']} for {player['Player']}"
-        
-        # Receptions should be less than or equal to targets
-        assert player["REC"] <= player["TGT"], f"REC > TGT for {player['Player']}"
-        
-        # Yards per reception should be reasonable (0-30)
-        assert 0 <= player["Y/R"] <= 30, f"Invalid Y/R {player['Y/R']} for {player['Player']}"
-        
-        # TDs should be reasonable (0-20)
-        assert 0 <= player["TD"] <= 20, f"Invalid TD count {player['TD']} for {player['Player']}"
-        
-        # Fantasy points per game should be positive
-        assert player["FPTS/G"] > 0, f"Invalid FPTS/G {player['FPTS/G']} for {player['Player']}"
+    # G in 1-17, REC <= TGT, Y/R in 0-30, TD in 0-20, FPTS/G positive, Y/R and FPTS/G consistent
+    violations = validate_rows(get_sample_wr_data_2024(), SAMPLE_SCHEMAS["WR"], "WR sample")
+    assert not violations, "; ".join(f"{v['player']}: {v['message']}" for v in violations)
     
     print("✅ All data values within reasonable ranges!")
     return True
@@ -200,6 +188,73 @@ def test_fantasy_points_calculation():
     print("✅ Fantasy points calculations reasonable!")
     return True
 
+def test_streaming_csv():
+    """Test generator rows are written in chunks, optionally atomically"""
+    print("Testing streaming CSV writer...")
+    
+    with tempfile.TemporaryDirectory() as output_dir:
+        rows = ((i, f"Player {i}", i * 10) for i in range(25000))
+        count = stream_to_csv(rows, "stream.csv", output_dir, fieldnames=["Rank", "Player", "YDS"],
+                              chunk_size=1000, atomic=True)
+        assert count == 25000, f"Expected 25000 rows written, got {count}"
+        assert os.listdir(output_dir) == ["stream.csv"], f"Temp files left behind: {os.listdir(output_dir)}"
+        
+        with open(os.path.join(output_dir, "stream.csv")) as f:
+            read_back = list(csv.DictReader(f))
+        assert len(read_back) == 25000, f"Expected 25000 rows read, got {len(read_back)}"
+        assert read_back[-1]["YDS"] == "249990", "Streamed data mismatch"
+        
+        dict_rows = ({"Rank": i, "Player": f"P{i}"} for i in range(3))
+        assert stream_to_csv(dict_rows, "dicts.csv", output_dir) == 3, "Dict generator not written"
+        
+        try:
+            stream_to_csv(iter([(1, 2)]), "bad.csv", output_dir)
+            raise AssertionError("Tuple rows without fieldnames should be rejected")
+        except ValueError:
+            pass
+    
+    print("✅ Streaming CSV writer works correctly!")
+    return True
+
+def test_incremental_pipeline():
+    """Test unchanged datasets are skipped and never rewritten"""
+    print("Testing incremental pipeline...")
+    
+    with tempfile.TemporaryDirectory() as output_dir:
+        rebuilt = run_pipeline(output_dir=output_dir)
+        assert rebuilt == ["wr_2024", "rb_2024", "json"], f"First run should build everything, got {rebuilt}"
+        
+        json_path = os.path.join(output_dir, "fantasy_pros_data.json")
+        mtime = os.path.getmtime(json_path)
+        with open(json_path) as f:
+            timestamp = json.load(f)["timestamp"]
+        
+        rebuilt = run_pipeline(output_dir=output_dir)
+        assert rebuilt == [], f"Second run should rebuild nothing, got {rebuilt}"
+        assert os.path.getmtime(json_path) == mtime, "Unchanged JSON was rewritten"
+        
+        # Tampering with an output forces just that dataset to rebuild
+        with open(os.path.join(output_dir, "FantasyPros_RB_2024_Totals_Corrected.csv"), "a") as f:
+            f.write("extra\n")
+        rebuilt = run_pipeline(output_dir=output_dir)
+        assert rebuilt == ["rb_2024"], f"Expected only rb_2024 rebuilt, got {rebuilt}"
+        
+        with open(json_path) as f:
+            assert json.load(f)["timestamp"] == timestamp, "Timestamp changed without data changes"
+        
+        # A lost manifest re-checks every output but reports nothing rebuilt when the bytes match
+        os.remove(os.path.join(output_dir, MANIFEST_FILE))
+        rebuilt = run_pipeline(output_dir=output_dir)
+        assert rebuilt == [], f"Byte-identical outputs should not count as rebuilt, got {rebuilt}"
+        assert os.path.getmtime(json_path) == mtime, "Unchanged JSON was rewritten after a manifest reset"
+        
+        with open(os.path.join(output_dir, MANIFEST_FILE)) as f:
+            manifest = json.load(f)
+        assert manifest["wr_2024"]["row_count"] == 10, "Manifest row count mismatch"
+    
+    print("✅ Incremental pipeline skips unchanged datasets!")
+    return True
+
 def run_all_tests():
     """Run all tests and report results"""
     print("\n" + "="*60)
@@ -214,7 +269,9 @@ def run_all_tests():
         ("CSV Output", test_csv_output),
         ("Top Performers", test_top_performers),
         ("RB Leaders", test_rb_leaders),
-        ("Fantasy Points", test_fantasy_points_calculation)
+        ("Fantasy Points", test_fantasy_points_calculation),
+        ("Incremental Pipeline", test_incremental_pipeline),
+        ("Streaming CSV", test_streaming_csv)
     ]
     
     passed = 0
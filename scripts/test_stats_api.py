@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Test suite for the local stats API
+Validates query filtering against the raw rows, response caching, and the HTTP layer
+(gzip, ETag/304, row ranges and errors) over a live socket
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import gzip
+import http.client
+import json
+import shutil
+import tempfile
+from pathlib import Path
+from ingest_data import DATA_DIR
+import stats_api
+from query_cache import dataset_rows, dataset_spec
+from stats_api import ApiError, ApiServer, StatsAPI
+
+RECEIVING = "pff-nfl-regular-receiving-2024"
+
+_API = None
+
+def _api():
+    global _API
+    if _API is None:
+        _API = StatsAPI()
+        _API.load(precompute=False)
+    return _API
+
+def _json(response):
+    return json.loads(response.body)
+
+def test_query_parameters():
+    """Test filters, sort, pagination and projection match the raw rows"""
+    print("Testing query parameters...")
+
+    api = _api()
+    body = _json(api.respond(f"/datasets/{RECEIVING}?position=wr&team=min&min_targets=20"
+                             "&sort=Yds&fields=Player,Yds,Tgt"))
+    raw = [row for row in dataset_rows(dataset_spec(RECEIVING + ".csv"))
+           if row["Pos"] == "WR" and row["Team"] == "MIN" and (row["Tgt"] or 0) >= 20]
+    expected = [{"Player": row["Player"], "Yds": row["Yds"], "Tgt": row["Tgt"]}
+                for row in sorted(raw, key=lambda row: -row["Yds"])]
+    assert body["rows"] == expected, f"Filtered rows mismatch: {body['rows']}"
+    assert body["rows"][0]["Player"] == "Justin Jefferson", "Jefferson should lead Vikings WRs in yards"
+
+    everything = _json(api.respond(f"/datasets/{RECEIVING}?sort=Y/Tgt&order=asc&limit=1000&fields=Y/Tgt"))
+    values = [row["Y/Tgt"] for row in everything["rows"]]
+    present = [value for value in values if value is not None]
+    assert present == sorted(present) and values[:len(present)] == present, "Ascending sort should put gaps last"
+
+    # Traded players repeat Rk; both directions keep the combined line ahead of its team splits
+    for order in ("asc", "desc"):
+        ranked = _json(api.respond(f"/datasets/{RECEIVING}?sort=Rk&order={order}&limit=1000&fields=Player,Team"))
+        teams = [row["Team"] for row in ranked["rows"] if row["Player"] == "Diontae Johnson"]
+        assert teams == ["3TM", "CAR", "BAL", "HOU"], f"order={order} should keep file order for ties: {teams}"
+
+    tackles = _json(api.respond(f"/datasets/{RECEIVING}?position=T&limit=1000&fields=Pos"))
+    assert all(row["Pos"] == "T" for row in tackles["rows"]), "Position should match exactly, not by substring"
+
+    page = _json(api.respond(f"/datasets/{RECEIVING}?sort=Tgt&offset=10&limit=5&fields=Player"))
+    full = _json(api.respond(f"/datasets/{RECEIVING}?sort=Tgt&limit=15&fields=Player"))
+    assert page["rows"] == full["rows"][10:15], "offset/limit should slice the sorted rows"
+    assert page["total"] == full["total"] == len(dataset_rows(dataset_spec(RECEIVING + ".csv"))), "Total mismatch"
+
+    fantasy_pros = _json(api.respond("/datasets/FantasyPros_Fantasy_Football_RB_2024_Totals?position=WR"))
+    assert fantasy_pros["total"] == 0, "An RB-only file should have no WR rows"
+
+    for target in (f"/datasets/{RECEIVING}?sort=Nope", f"/datasets/{RECEIVING}?limit=0",
+                   f"/datasets/{RECEIVING}?fields=Player,Nope", f"/datasets/{RECEIVING}?colour=red"):
+        try:
+            api.respond(target)
+            assert False, f"{target} should be rejected"
+        except ApiError as e:
+            assert e.status == 400, f"{target} should be a 400, got {e.status}"
+
+    print("✅ Query parameters correct!")
+    return True
+
+def test_response_cache():
+    """Test equivalent queries share one rendered response and refreshed data changes the ETag"""
+    print("Testing response cache...")
+
+    api = _api()
+    first = api.respond(f"/datasets/{RECEIVING}?sort=Yds&limit=5")
+    again = api.respond(f"/datasets/{RECEIVING}?limit=5&sort=Yds")
+    assert first is again, "Parameter order should not change the cache key"
+    assert gzip.decompress(first.gzipped) == first.body, "gzip variant should decode to the body"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = DATA_DIR / (RECEIVING + ".csv")
+        copy = Path(tmp) / source.name
+        shutil.copy(source, copy)
+        local = StatsAPI(data_dir=Path(tmp))
+        assert local.load() == 1, "Only the copied dataset should load"
+        before = local.respond(f"/datasets/{RECEIVING}?fields=Player,Yds&limit=1&sort=Yds")
+
+        text = copy.read_text(encoding="utf-8")
+        copy.write_text(text.replace(",1533,", ",9999,", 1), encoding="utf-8")
+        local.datasets[RECEIVING].checked = float("-inf")
+        after = local.respond(f"/datasets/{RECEIVING}?fields=Player,Yds&limit=1&sort=Yds")
+
+        # A reload that finds nothing to load is a 404, and the stale dataset is dropped
+        copy.write_text(text, encoding="utf-8")
+        local.datasets[RECEIVING].checked = float("-inf")
+        load_dataset = stats_api.load_dataset
+        stats_api.load_dataset = lambda *args: None
+        try:
+            local.respond(f"/datasets/{RECEIVING}")
+            assert False, "A failed reload should be rejected"
+        except ApiError as e:
+            assert e.status == 404, f"A failed reload should be a 404, got {e.status}"
+        finally:
+            stats_api.load_dataset = load_dataset
+        assert RECEIVING not in local.datasets, "A failed reload should not leave a dataset behind"
+
+    assert after.etag != before.etag, "A changed source should produce a new ETag"
+    assert _json(after)["rows"][0]["Yds"] == 9999, f"Reloaded data not served: {_json(after)['rows']}"
+
+    print("✅ Response cache correct!")
+    return True
+
+def test_http():
+    """Test gzip, conditional requests, row ranges and errors over HTTP"""
+    print("Testing HTTP layer...")
+
+    with ApiServer(_api()) as server:
+        host, port = server.server.sockets[0].getsockname()[:2]
+        connection = http.client.HTTPConnection(host, port, timeout=10)
+
+        def get(target, headers=None, method="GET"):
+            connection.request(method, target, headers=headers or {})
+            response = connection.getresponse()
+            return response, response.read()
+
+        response, body = get(f"/datasets/{RECEIVING}?limit=50", {"Accept-Encoding": "gzip"})
+        assert response.status == 200 and response.getheader("Content-Encoding") == "gzip", "Should be gzipped"
+        rows = json.loads(gzip.decompress(body))["rows"]
+        assert len(rows) == 50, f"Expected 50 rows, got {len(rows)}"
+        assert 'rel="next"' in response.getheader("Link", ""), "A partial page should link to the next one"
+        etag = response.getheader("ETag")
+
+        response, body = get(f"/datasets/{RECEIVING}?limit=50", {"If-None-Match": etag})
+        assert response.status == 304 and body == b"", "A matching ETag should get an empty 304"
+
+        response, body = get(f"/datasets/{RECEIVING}?limit=50")
+        assert response.getheader("Content-Encoding") is None, "Clients without gzip get identity bodies"
+        assert json.loads(body)["rows"] == rows, "Both encodings should carry the same rows"
+
+        response, _ = get(f"/datasets/{RECEIVING}?limit=5&sort=Y/Tgt&fields=Player,Y/Tgt")
+        link = response.getheader("Link")
+        assert "fields=Player%2CY%2FTgt" in link and "sort=Y%2FTgt" in link, f"Link query should be encoded: {link}"
+        response, body = get(link[1:link.index(">")])
+        assert response.status == 200 and len(json.loads(body)["rows"]) == 5, "The next link should be followable"
+
+        response, body = get(f"/datasets/{RECEIVING}?fields=Player&sort=Tgt", {"Range": "rows=0-2"})
+        assert response.status == 206, f"Row range should be partial content, got {response.status}"
+        assert response.getheader("Content-Range").startswith("rows 0-2/"), response.getheader("Content-Range")
+        assert len(json.loads(body)["rows"]) == 3, "Range should return three rows"
+
+        response, body = get("/datasets", method="HEAD")
+        assert response.status == 200 and body == b"", "HEAD should send headers only"
+
+        for target, status in (("/datasets/nope", 404), (f"/datasets/{RECEIVING}?limit=x", 400)):
+            response, body = get(target)
+            assert response.status == status and "error" in json.loads(body), f"{target} should be a {status}"
+
+        response, body = get("/datasets", method="POST")
+        assert response.status == 405, "Only reads are allowed"
+        connection.close()
+
+    print("✅ HTTP layer correct!")
+    return True
+
+def run_all_tests():
+    """Run all tests and report results"""
+    print("\n" + "="*60)
+    print("🏈 STATS API TEST SUITE 🏈")
+    print("="*60 + "\n")
+
+    tests = [
+        ("Query Parameters", test_query_parameters),
+        ("Response Cache", test_response_cache),
+        ("HTTP", test_http)
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL TESTS PASSED! 🎉")
+    else:
+        print("⚠️  Some tests failed. Please review the errors above.")
+    print("="*60 + "\n")
+
+    return failed == 0
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Test suite for the SQLite stats database
+Validates the normalized load, multi-team splits, index use and incremental rebuilds
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import atexit
+import shutil
+import tempfile
+from pathlib import Path
+from ingest_data import DATA_DIR, FANTASY_PROS_DATA_FILES, find_data_file, read_pfr_csv
+from stats_db import EXAMPLE_QUERY, build_database, connect, query
+
+WORKDIR = Path(tempfile.mkdtemp())
+atexit.register(shutil.rmtree, WORKDIR, True)
+DB_PATH = WORKDIR / "stats.db"
+for csv_path in DATA_DIR.glob("*.csv"):
+    shutil.copy(csv_path, WORKDIR / csv_path.name)
+FIRST_BUILD = build_database(DB_PATH, WORKDIR)
+
+def test_full_load():
+    """Test every file loads with its rows and FantasyPros names join onto PFR players"""
+    print("Testing full load...")
+
+    assert len(FIRST_BUILD["loaded"]) == 30, f"Expected 18 PFR + 12 FantasyPros files, got {len(FIRST_BUILD['loaded'])}"
+    _, rows = read_pfr_csv(find_data_file("pff-nfl-regular-receiving-2024.csv", WORKDIR))
+
+    conn = connect(DB_PATH)
+    try:
+        count = conn.execute("SELECT count(*) FROM receiving WHERE year = 2024 AND season_type = 'regular'").fetchone()[0]
+        assert count == len(rows), f"Expected {len(rows)} receiving rows, got {count}"
+
+        chase = query(conn, """
+            SELECT f."REC", r."Rec" FROM fantasypros_totals f
+            JOIN receiving r ON r.player_id = f.player_id AND r.year = f.year AND r.season_type = f.season_type
+            JOIN players p ON p.player_id = f.player_id
+            WHERE p.code = 'ChasJa00' AND f.year = 2023 AND r.split = 0""")
+        assert chase, "FantasyPros rows should join onto the PFR player"
+
+        top = query(conn, EXAMPLE_QUERY)
+        assert len(top) == 10 and all(row["Tgt"] >= 80 for row in top), f"Unexpected example result {top}"
+        assert [row["Y/Tgt"] for row in top] == sorted((row["Y/Tgt"] for row in top), reverse=True), "Not sorted"
+    finally:
+        conn.close()
+
+    print("✅ Full load correct!")
+    return True
+
+def test_multi_team_splits():
+    """Test each player-season has one split = 0 line (the 2TM total for traded players)"""
+    print("Testing multi-team splits...")
+
+    conn = connect(DB_PATH)
+    try:
+        duplicates = conn.execute("""
+            SELECT count(*) FROM (SELECT player_id, year, season_type FROM receiving WHERE split = 0
+                                  GROUP BY player_id, year, season_type HAVING count(*) > 1)""").fetchone()[0]
+        assert duplicates == 0, f"{duplicates} player-seasons have more than one total line"
+
+        traded = query(conn, """
+            SELECT t.code AS team, r.split FROM receiving r JOIN teams t USING (team_id)
+            WHERE r.player_id IN (SELECT r2.player_id FROM receiving r2 JOIN teams t2 USING (team_id)
+                                  WHERE t2.code = '2TM' AND r2.year = 2024 AND r2.season_type = 'regular' LIMIT 1)
+              AND r.year = 2024 AND r.season_type = 'regular'""")
+        assert len(traded) == 3, f"Expected a 2TM line and two team splits, got {traded}"
+        assert {row["team"] for row in traded if row["split"] == 0} == {"2TM"}, f"2TM should be the total: {traded}"
+    finally:
+        conn.close()
+
+    print("✅ Multi-team splits correct!")
+    return True
+
+def test_index_plans():
+    """Test player-season and team-season lookups use their indexes"""
+    print("Testing index plans...")
+
+    conn = connect(DB_PATH)
+    try:
+        plan = " ".join(row[-1] for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM passing WHERE player_id = 1 AND year = 2024 AND season_type = 'regular'"))
+        assert "idx_passing_player" in plan, f"Player lookup not indexed: {plan}"
+        plan = " ".join(row[-1] for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM rushing WHERE team_id = 3 AND year = 2023"))
+        assert "idx_rushing_team" in plan, f"Team lookup not indexed: {plan}"
+    finally:
+        conn.close()
+
+    print("✅ Index plans correct!")
+    return True
+
+def test_incremental_rebuild():
+    """
+    Test unchanged files are skipped, edited files replace their rows and deleted files drop them
+    A PFR change also re-resolves every FantasyPros file, since their names join onto PFR players
+    """
+    print("Testing incremental rebuild...")
+
+    again = build_database(DB_PATH, WORKDIR)
+    assert not again["loaded"] and len(again["skipped"]) == 30, f"Nothing should reload: {again['loaded']}"
+
+    name = "pff-nfl-playoff-rushing-2022.csv"
+    with open(WORKDIR / name, "a", encoding="utf-8") as f:
+        f.write("\n")
+    fantasy_pros = [spec["fileName"] for spec in FANTASY_PROS_DATA_FILES]
+    edited = build_database(DB_PATH, WORKDIR)
+    assert edited["loaded"] == [name] + fantasy_pros, \
+        f"Only the edited file and the FantasyPros files should reload: {edited['loaded']}"
+
+    fantasy_pros_name = "FantasyPros_Fantasy_Football_WR_2024_Totals.csv"
+    with open(WORKDIR / fantasy_pros_name, "a", encoding="utf-8") as f:
+        f.write("\n")
+    edited = build_database(DB_PATH, WORKDIR)
+    assert edited["loaded"] == [fantasy_pros_name], f"A FantasyPros edit should only reload itself: {edited['loaded']}"
+
+    _, rows = read_pfr_csv(WORKDIR / name)
+    conn = connect(DB_PATH)
+    try:
+        count = conn.execute("SELECT count(*) FROM rushing WHERE year = 2022 AND season_type = 'playoff'").fetchone()[0]
+        assert count == len(rows), f"Reload should replace rows, found {count} for {len(rows)}"
+    finally:
+        conn.close()
+
+    os.remove(WORKDIR / name)
+    removed = build_database(DB_PATH, WORKDIR)
+    assert removed["removed"] == [name], f"Deleted file should be removed: {removed}"
+    assert removed["loaded"] == fantasy_pros, f"Removing a PFR file should re-resolve FantasyPros names: {removed}"
+    conn = connect(DB_PATH)
+    try:
+        count = conn.execute("SELECT count(*) FROM rushing WHERE year = 2022 AND season_type = 'playoff'").fetchone()[0]
+        assert count == 0, f"Rows of a deleted file remain: {count}"
+    finally:
+        conn.close()
+
+    print("✅ Incremental rebuild correct!")
+    return True
+
+def run_all_tests():
+    """Run all tests and report results"""
+    print("\n" + "="*60)
+    print("🏈 STATS DATABASE TEST SUITE 🏈")
+    print("="*60 + "\n")
+
+    tests = [
+        ("Full Load", test_full_load),
+        ("Multi-Team Splits", test_multi_team_splits),
+        ("Index Plans", test_index_plans),
+        ("Incremental Rebuild", test_incremental_rebuild)
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL TESTS PASSED! 🎉")
+    else:
+        print("⚠️  Some tests failed. Please review the errors above.")
+    print("="*60 + "\n")
+
+    return failed == 0
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Test suite for team-context metrics
+Validates team shares against FantasyPros % TM, traded-player handling and charting rates
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ingest_data import FANTASY_PROS_DATA_FILES, PFR_DATA_FILES, normalize_fantasy_pros_file, normalize_pfr_file
+from team_metrics import rate_columns, share_columns
+
+def _pfr(file_name):
+    return normalize_pfr_file(next(spec for spec in PFR_DATA_FILES if spec["fileName"] == file_name))
+
+def _fantasy_pros(position, year, kind="Totals"):
+    return normalize_fantasy_pros_file(next(
+        spec for spec in FANTASY_PROS_DATA_FILES
+        if spec["position"] == position and spec["year"] == year and spec["kind"] == kind))
+
+RECEIVING_2023 = _pfr("pff-nfl-regular-receiving-2023.csv")
+RECEIVING_SHARES, RECEIVING_TOTALS = share_columns(RECEIVING_2023)
+
+def test_target_share_matches_fantasy_pros():
+    """Test PFR target share equals FantasyPros % TM for single-team receivers"""
+    print("Testing target share...")
+
+    fp = _fantasy_pros("WR", "2023")
+    fp_share = dict(zip(fp["data"]["Player"], fp["data"]["% TM"]))
+    data = RECEIVING_2023["data"]
+
+    for name in ("A.J. Brown", "CeeDee Lamb", "Tyreek Hill"):
+        row = data["Player"].index(name)
+        expected = float(str(fp_share[name]).rstrip("%"))
+        assert RECEIVING_SHARES["TgtShare"][row] == expected, \
+            f"{name}: {RECEIVING_SHARES['TgtShare'][row]} vs FantasyPros {expected}"
+
+    print("✅ Target share matches FantasyPros!")
+    return True
+
+def test_team_groups():
+    """Test shares sum to 100 per team and combined 2TM/3TM rows are left out"""
+    print("Testing team grouping...")
+
+    data = RECEIVING_2023["data"]
+    by_team = {}
+    for team, share in zip(data["Team"], RECEIVING_SHARES["TgtShare"]):
+        if share is not None:
+            by_team[team] = by_team.get(team, 0) + share
+
+    assert len(by_team) == 32, f"Expected 32 teams, got {sorted(by_team)}"
+    assert all(abs(total - 100) < 1.5 for total in by_team.values()), f"Shares should sum to ~100: {by_team}"
+    combined = [row for row, team in enumerate(data["Team"]) if team in ("2TM", "3TM")]
+    assert combined, "2023 receiving should include traded players"
+    assert all(RECEIVING_SHARES["TgtShare"][row] is None for row in combined), "nTM rows should have no share"
+    assert "2TM" not in RECEIVING_TOTALS["Tgt"], "nTM rows must not form a team"
+
+    rushing = _pfr("pff-nfl-regular-rushing-2024.csv")
+    shares, totals = share_columns(rushing)
+    row = rushing["data"]["Player"].index("Saquon Barkley")
+    expected = round(rushing["data"]["Att"][row] / totals["Att"]["PHI"] * 100, 1)
+    assert shares["CarryShare"][row] == expected, f"Barkley carry share {shares['CarryShare'][row]} vs {expected}"
+
+    print("✅ Team grouping correct!")
+    return True
+
+def test_fantasy_pros_rates():
+    """Test charting fields become rates from their own columns"""
+    print("Testing FantasyPros rates...")
+
+    fp = _fantasy_pros("WR", "2023")
+    rates = rate_columns(fp)
+    data = fp["data"]
+    row = data["Player"].index("CeeDee Lamb")
+
+    assert rates["aDOT"][row] == round(data["AIR"][row] / data["TGT"][row], 1), f"aDOT {rates['aDOT'][row]}"
+    assert rates["Drop%"][row] == round(data["DROP"][row] / data["CATCHABLE"][row] * 100, 1), f"Drop% {rates['Drop%'][row]}"
+    assert set(rate_columns(_fantasy_pros("RB", "2023"))) == {"RZTgt%"}, "RB files only carry RZ TGT and TGT"
+
+    print("✅ FantasyPros rates correct!")
+    return True
+
+def run_all_tests():
+    """Run all tests and report results"""
+    print("\n" + "="*60)
+    print("🏈 TEAM METRICS TEST SUITE 🏈")
+    print("="*60 + "\n")
+
+    tests = [
+        ("Target Share", test_target_share_matches_fantasy_pros),
+        ("Team Groups", test_team_groups),
+        ("FantasyPros Rates", test_fantasy_pros_rates)
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL TESTS PASSED! 🎉")
+    else:
+        print("⚠️  Some tests failed. Please review the errors above.")
+    print("="*60 + "\n")
+
+    return failed == 0
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Test suite for the per-game time series
+Validates sliding-window statistics against naive recomputation and the per-game loader
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import math
+import random
+import statistics
+from player_store import load_store
+from scoring import SCORING_PROFILES, score_seasons
+from timeseries import TimeSeriesStore, per_game_records
+
+def _random_store():
+    rng = random.Random(3)
+    records = []
+    for player in ("a", "b", "c"):
+        for week in rng.sample(range(1, 18), rng.randint(1, 12)):
+            records.append((player, week, {"points": round(rng.uniform(0, 30), 1)}))
+    rng.shuffle(records)
+    return TimeSeriesStore.from_records(records)
+
+def _close(a, b):
+    return (math.isnan(a) and math.isnan(b)) or abs(a - b) < 1e-9
+
+def test_layout():
+    """Test players own contiguous, period-ordered segments"""
+    print("Testing contiguous layout...")
+
+    store = _random_store()
+    assert store.offsets[0] == 0 and store.offsets[-1] == len(store), "Offsets should span every row"
+    for player in store.players:
+        start, end = store.segment(player)
+        weeks = list(store.periods[start:end])
+        assert weeks == sorted(weeks), f"{player} lines out of order: {weeks}"
+
+    print("✅ Contiguous layout correct!")
+    return True
+
+def test_sliding_windows():
+    """Test rolling mean/std, EWMA and boom rates match naive recomputation"""
+    print("Testing sliding-window statistics...")
+
+    store = _random_store()
+    means = store.rolling_mean("points", 3)
+    spreads = store.rolling_std("points", 5)
+    trend = store.ewma("points", 0.4)
+    booms = store.rolling_rate("points", 5, 20.0)
+
+    for player in store.players:
+        start, _ = store.segment(player)
+        values = store.series(player, "points")
+        level = None
+        for i, value in enumerate(values):
+            row = start + i
+            assert _close(means[row], statistics.fmean(values[max(0, i - 2):i + 1])), f"Mean mismatch at {player} {i}"
+            window = values[max(0, i - 4):i + 1]
+            expected = statistics.pstdev(window) if len(window) >= 2 else float("nan")
+            assert _close(round(spreads[row], 9), round(expected, 9)), f"Std mismatch at {player} {i}"
+            level = value if level is None else 0.4 * value + 0.6 * level
+            assert _close(trend[row], level), f"EWMA mismatch at {player} {i}"
+            assert _close(booms[row], sum(v >= 20.0 for v in window) / len(window)), f"Boom mismatch at {player} {i}"
+
+    print("✅ Sliding-window statistics correct!")
+    return True
+
+def test_missing_lines():
+    """Test a missing line in the middle of a series only drops out of its own windows"""
+    print("Testing missing lines...")
+
+    nan = float("nan")
+    values = [1.0, nan, 3.0, 5.0, 7.0, 9.0]
+    store = TimeSeriesStore.from_records([("a", week, {"points": value}) for week, value in enumerate(values, 1)])
+    means = list(store.rolling_mean("points", 3))
+    assert _close(means[1], 1.0) and _close(means[2], 2.0) and _close(means[3], 4.0), f"Means broken by NaN: {means}"
+    assert _close(means[5], 7.0), f"Later windows should recover: {means}"
+
+    spreads = list(store.rolling_std("points", 3))
+    assert math.isnan(spreads[1]) and _close(spreads[2], 1.0), f"Std should count valid lines only: {spreads}"
+    assert _close(spreads[5], statistics.pstdev([5.0, 7.0, 9.0])), f"Later std should recover: {spreads}"
+
+    trend = list(store.ewma("points", 0.5))
+    assert _close(trend[1], 1.0) and _close(trend[2], 2.0), f"EWMA should carry the level over a gap: {trend}"
+
+    booms = list(store.rolling_rate("points", 3, 3.0))
+    assert _close(booms[1], 0.0) and _close(booms[2], 0.5) and _close(booms[3], 1.0), f"Rates miscounted: {booms}"
+
+    print("✅ Missing lines correct!")
+    return True
+
+def test_per_game_form():
+    """Test the FantasyPros per-game loader and form summary"""
+    print("Testing per-game form...")
+
+    store = load_store()
+    series = TimeSeriesStore.from_records(per_game_records(store))
+    seasons = list(series.periods[slice(*series.segment("JeffJu00"))])
+    assert seasons == [2022, 2023, 2024], f"Justin Jefferson should have three seasons, got {seasons}"
+
+    points = series.series("JeffJu00", "points")
+    form = series.form("points")["JeffJu00"]
+    assert form["seasons"] == 3, f"Unexpected seasons {form['seasons']}"
+    assert "avg5" not in form, "A 5-window over three seasons would only repeat avg3"
+    assert form["avg3"] == round(statistics.fmean(points), 2), f"avg3 {form['avg3']} vs {points}"
+    assert form["std"] == round(statistics.pstdev(points), 2), f"std {form['std']} vs {points}"
+
+    scored = score_seasons(store, {"half_ppr": SCORING_PROFILES["half_ppr"]})
+    row = scored.row_index(store.player_id("JeffJu00"), 2024)
+    assert abs(points[-1] - scored.per_game("half_ppr")[row]) < 1e-9, "Points should come from the scored PFR season"
+    assert form["boomRate"] > 0, f"Jefferson's seasons should register as booms: {form}"
+
+    print("✅ Per-game form correct!")
+    return True
+
+def run_all_tests():
+    """Run all tests and report results"""
+    print("\n" + "="*60)
+    print("🏈 TIME SERIES TEST SUITE 🏈")
+    print("="*60 + "\n")
+
+    tests = [
+        ("Layout", test_layout),
+        ("Sliding Windows", test_sliding_windows),
+        ("Missing Lines", test_missing_lines),
+        ("Per-Game Form", test_per_game_form)
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL TESTS PASSED! 🎉")
+    else:
+        print("⚠️  Some tests failed. Please review the errors above.")
+    print("="*60 + "\n")
+
+    return failed == 0
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
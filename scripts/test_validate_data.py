@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Test suite for the dataset schema validator
+Validates each rule type, multi-team ID handling and whole-directory speed
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from validate_data import PFR_SCHEMAS, check_unique, validate_all, validate_columns
+
+def receiving_columns(**overrides):
+    """Two clean receiving rows, optionally with columns replaced"""
+    data = {
+        "Player": ["Ja'Marr Chase", "Justin Jefferson"],
+        "Team": ["CIN", "MIN"],
+        "G": [17, 17],
+        "GS": [16, 17],
+        "Tgt": [175, 154],
+        "Rec": [127, 103],
+        "Yds": [1708, 1533],
+        "Y/R": [13.4, 14.9],
+        "PlayerID": ["ChasJa00", "JeffJu00"],
+    }
+    data.update(overrides)
+    return data
+
+def test_clean_data_passes():
+    """Test valid rows produce no violations"""
+    print("Testing clean rows...")
+
+    violations = validate_columns(receiving_columns(), PFR_SCHEMAS["receiving"], "sample")
+    assert violations == [], f"Unexpected violations {violations}"
+
+    print("✅ Clean rows pass!")
+    return True
+
+def test_every_violation_reported():
+    """Test each rule type fires and all violations are collected, not just the first"""
+    print("Testing violation reporting...")
+
+    data = receiving_columns(G=[0, 18], GS=[0, 17], Rec=[180, 103], Yds=[1708, "lots"], PlayerID=["ChasJa00", None])
+    violations = validate_columns(data, PFR_SCHEMAS["receiving"], "sample")
+    rules = sorted((v["rule"], v["row"]) for v in violations)
+
+    expected = [("le", 0), ("range", 0), ("range", 1), ("ratio", 0), ("required", 1), ("type", 1)]
+    assert rules == expected, f"Expected {expected}, got {rules}"
+    ratio = next(v for v in violations if v["rule"] == "ratio")
+    assert ratio["severity"] == "warning", "Ratio mismatches should be warnings"
+    assert ratio["player"] == "Ja'Marr Chase", "Violation should name the player"
+
+    print("✅ Violation reporting correct!")
+    return True
+
+def test_multi_team_ids():
+    """Test 2TM lines with team splits pass while true duplicates fail"""
+    print("Testing player ID uniqueness...")
+
+    ids = ["AdamDa01", "AdamDa01", "AdamDa01", "ChasJa00"]
+    assert check_unique(ids, ["2TM", "LVR", "NYJ", "CIN"]) == [], "Combined line plus splits should pass"
+    assert check_unique(ids, ["LVR", "LVR", "NYJ", "CIN"]) == [1, 2], "Repeats without a 2TM line should fail"
+    assert check_unique(ids, ["2TM", "NYJ", "NYJ", "CIN"]) == [1, 2], "Repeated split team should fail"
+
+    traded = receiving_columns(Team=["2TM", "MIN"], G=[18, 17])
+    violations = validate_columns(traded, PFR_SCHEMAS["receiving"], "sample")
+    assert not [v for v in violations if v["rule"] == "range"], "Traded players may log 18 games"
+
+    print("✅ Player ID uniqueness correct!")
+    return True
+
+def test_all_files_fast_and_clean():
+    """Test every data file validates without errors in well under a second"""
+    print("Testing full data directory...")
+
+    report = validate_all()
+    assert len(report["files"]) >= 30, f"Expected 30+ files, got {len(report['files'])}"
+    assert report["errors"] == 0, f"Found errors: {[v for v in report['violations'] if v['severity'] == 'error']}"
+    assert report["seconds"] < 1.0, f"Validation took {report['seconds']:.2f}s"
+
+    print(f"✅ {len(report['files'])} files validated in {report['seconds'] * 1000:.0f} ms!")
+    return True
+
+def run_all_tests():
+    """Run all tests and report results"""
+    print("\n" + "="*60)
+    print("🏈 DATA VALIDATION TEST SUITE 🏈")
+    print("="*60 + "\n")
+
+    tests = [
+        ("Clean Rows", test_clean_data_passes),
+        ("Violation Reporting", test_every_violation_reported),
+        ("Player ID Uniqueness", test_multi_team_ids),
+        ("Full Directory", test_all_files_fast_and_clean)
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL TESTS PASSED! 🎉")
+    else:
+        print("⚠️  Some tests failed. Please review the errors above.")
+    print("="*60 + "\n")
+
+    return failed == 0
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Per-Game Time Series
+Stores every player's game lines contiguously (per-player offsets into shared arrays) and
+computes rolling averages, exponentially weighted trends and consistency metrics in one
+sliding pass per player
+"""
+
+import argparse
+import json
+import math
+from array import array
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+from ingest_data import DATA_DIR, PROJECT_ROOT
+from player_store import PlayerStore, load_store
+from scoring import FANTASY_PROS_STATS, SCORING_PROFILES, score_seasons
+
+TIMESERIES_DIR = DATA_DIR / "timeseries"
+# The per-game exports give each player at most three seasons, so a longer window would
+# always equal the 3-season one
+WINDOWS = (3,)
+EWMA_ALPHA = 0.5
+
+# Points-per-game thresholds for a boom or a bust line; the per-game exports hold season
+# averages rather than single games, so these sit at roughly top-12 and replacement level
+BOOM_POINTS = 15.0
+BUST_POINTS = 7.0
+
+MISSING = float("nan")
+
+
+class TimeSeriesStore:
+    """
+    Game lines for many players in shared array columns
+    Player i owns rows offsets[i]:offsets[i + 1], ordered by period, so every statistic is one
+    forward pass over each segment
+    """
+
+    def __init__(self, players: List[Any], offsets: array, periods: array, columns: Dict[str, array]):
+        self.players = players
+        self.offsets = offsets
+        self.periods = periods
+        self.columns = columns
+        self._index = {player: i for i, player in enumerate(players)}
+
+    def __len__(self) -> int:
+        return len(self.periods)
+
+    @classmethod
+    def from_records(cls, records: List[Tuple[Any, int, Dict[str, float]]]) -> "TimeSeriesStore":
+        """Build from (player, period, values) records in any order"""
+        records = sorted(records, key=lambda record: (str(record[0]), record[1]))
+        names = sorted({key for _, _, values in records for key in values})
+        players: List[Any] = []
+        offsets = array("l", [0])
+        periods = array("l")
+        columns = {name: array("d") for name in names}
+
+        for player, period, values in records:
+            if not players or players[-1] != player:
+                if players:
+                    offsets.append(len(periods))
+                players.append(player)
+            periods.append(period)
+            for name in names:
+                value = values.get(name)
+                columns[name].append(MISSING if value is None else value)
+        if players:
+            offsets.append(len(periods))
+        return cls(players, offsets, periods, columns)
+
+    def segment(self, player: Any) -> Tuple[int, int]:
+        """Row range of one player's lines"""
+        i = self._index[player]
+        return self.offsets[i], self.offsets[i + 1]
+
+    def series(self, player: Any, column: str) -> List[float]:
+        start, end = self.segment(player)
+        return list(self.columns[column][start:end])
+
+    def _segments(self):
+        return zip(self.offsets, self.offsets[1:])
+
+    def rolling_mean(self, column: str, window: int, min_periods: int = 1) -> array:
+        """Mean of each row and up to window - 1 earlier rows of the same player (running sum; NaNs skipped)"""
+        values = self.columns[column]
+        result = array("d", [MISSING]) * len(values)
+        for start, end in self._segments():
+            total = 0.0
+            count = 0
+            for row in range(start, end):
+                value = values[row]
+                if value == value:
+                    total += value
+                    count += 1
+                if row - window >= start:
+                    dropped = values[row - window]
+                    if dropped == dropped:
+                        total -= dropped
+                        count -= 1
+                if count >= min_periods:
+                    result[row] = total / count
+        return result
+
+    def rolling_std(self, column: str, window: int, min_periods: int = 2) -> array:
+        """Population std dev over the same windows, from running sums of values and squares"""
+        values = self.columns[column]
+        result = array("d", [MISSING]) * len(values)
+        for start, end in self._segments():
+            total = squares = 0.0
+            count = 0
+            for row in range(start, end):
+                value = values[row]
+                if value == value:
+                    total += value
+                    squares += value * value
+                    count += 1
+                if row - window >= start:
+                    dropped = values[row - window]
+                    if dropped == dropped:
+                        total -= dropped
+                        squares -= dropped * dropped
+                        count -= 1
+                if count >= min_periods:
+                    mean = total / count
+                    result[row] = math.sqrt(max(squares / count - mean * mean, 0.0))
+        return result
+
+    def ewma(self, column: str, alpha: float = EWMA_ALPHA) -> array:
+        """Exponentially weighted mean, restarting at each player's first line; a missing line carries the level"""
+        values = self.columns[column]
+        result = array("d", [MISSING]) * len(values)
+        for start, end in self._segments():
+            level = MISSING
+            for row in range(start, end):
+                value = values[row]
+                if value == value:
+                    level = value if level != level else alpha * value + (1 - alpha) * level
+                result[row] = level
+        return result
+
+    def rolling_rate(self, column: str, window: int, threshold: float, above: bool = True) -> array:
+        """Share of the window's recorded lines at or above (boom) / at or below (bust) a threshold"""
+        values = self.columns[column]
+        # 1 hit, 0 miss, -1 missing line
+        hits = array("b", (-1 if value != value else 1 if (value >= threshold if above else value <= threshold) else 0
+                           for value in values))
+        result = array("d", [MISSING]) * len(values)
+        for start, end in self._segments():
+            count = valid = 0
+            for row in range(start, end):
+                if hits[row] >= 0:
+                    count += hits[row]
+                    valid += 1
+                if row - window >= start and hits[row - window] >= 0:
+                    count -= hits[row - window]
+                    valid -= 1
+                if valid:
+                    result[row] = count / valid
+        return result
+
+    def form(self, column: str, windows: Tuple[int, ...] = WINDOWS, alpha: float = EWMA_ALPHA,
+             boom: float = BOOM_POINTS, bust: float = BUST_POINTS) -> Dict[Any, Dict[str, float]]:
+        """
+        Latest rolling averages, trend and full-history consistency per player
+        `seasons` counts the player's lines; every line here is one season's per-game average
+        """
+        rolling = {f"avg{window}": self.rolling_mean(column, window) for window in windows}
+        trend = self.ewma(column, alpha)
+        spread = self.rolling_std(column, len(self), min_periods=1)
+        booms = self.rolling_rate(column, len(self), boom, above=True)
+        busts = self.rolling_rate(column, len(self), bust, above=False)
+
+        result = {}
+        for player, (start, end) in zip(self.players, self._segments()):
+            last = end - 1
+            line = {key: round(values[last], 2) for key, values in rolling.items()}
+            line.update({
+                "seasons": end - start,
+                "ewma": round(trend[last], 2),
+                "std": round(spread[last], 2),
+                "boomRate": round(booms[last], 3),
+                "bustRate": round(busts[last], 3),
+            })
+            result[player] = line
+        return result
+
+
+def per_game_records(store: PlayerStore, profile: str = "half_ppr") -> List[Tuple[str, int, Dict[str, float]]]:
+    """
+    (player, season, values) from the FantasyPros per-game files, with fantasy points per game
+    These exports hold one per-game line per season, so each season is one point in the series
+    Points come from the player's scored PFR season (TDs included); FantasyPros-only players
+    fall back to the yards and receptions their line carries
+    """
+    tables = store.fantasy_pros_tables("Per_Game")
+    if not tables:
+        return []
+    weights = SCORING_PROFILES[profile]
+    per_game = score_seasons(store, {profile: weights})
+    points = per_game.per_game(profile)
+    records = []
+    seen = set()
+    for table in tables:
+        for (player, year, _), row in table.season_rows():
+            # A player listed at two positions keeps one line per season (the first table's)
+            if (player, year) in seen:
+                continue
+            seen.add((player, year))
+            position = store.positions[table.position[row]]
+            # Columns a position's export lacks (ATT in WR files) read as missing
+            values = {key: table.value(key, row) if key in table.numeric else None
+                      for key in ("G", "TGT", "REC", "YDS", "ATT")}
+            scored_row = per_game.row_index(player, year)
+            if scored_row is not None:
+                values["points"] = points[scored_row]
+            else:
+                values["points"] = sum(weights.get(stat, 0.0) * (table.value(column, row) or 0.0)
+                                       for stat, column in FANTASY_PROS_STATS.get(position, {}).items())
+            key = store.player_codes[player] or store.player_names[player]
+            records.append((key, year, values))
+    return records
+
+
+def main():
+    """Build the per-game series and write each player's current form"""
+    parser = argparse.ArgumentParser(description="Per-game time series and rolling form")
+    parser.add_argument("--profile", default="half_ppr", choices=list(SCORING_PROFILES))
+    parser.add_argument("--alpha", type=float, default=EWMA_ALPHA, help="EWMA weight on the newest line")
+    args = parser.parse_args()
+
+    print("Per-Game Time Series")
+    print("=" * 50)
+
+    store = load_store()
+    series = TimeSeriesStore.from_records(per_game_records(store, args.profile))
+    form = series.form("points", alpha=args.alpha)
+
+    TIMESERIES_DIR.mkdir(parents=True, exist_ok=True)
+    path = TIMESERIES_DIR / "form.json"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"profile": args.profile, "players": form}, f, separators=(",", ":"), ensure_ascii=False)
+
+    print(f"  ✅ {len(series.players)} players, {len(series)} lines")
+    print(f"  📄 {path.relative_to(PROJECT_ROOT)}")
+
+    names = {code: store.player_names[i] for i, code in enumerate(store.player_codes) if code}
+    print("\nBest current trend (EWMA points per game):")
+    for rank, (player, line) in enumerate(sorted(form.items(), key=lambda item: -item[1]["ewma"])[:10], 1):
+        print(f"  {rank:2d}. {names.get(player, player):<25} ewma {line['ewma']:5.1f}  "
+              f"avg3 {line['avg3']:5.1f}  std {line['std']:4.1f}")
+
+
+if __name__ == "__main__":
+    main()
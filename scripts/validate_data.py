@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Dataset Schema Validation
+Checks every data file against a declarative schema (column types, ranges,
+cross-column invariants and player-ID uniqueness) and reports every violation
+"""
+
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+from ingest_data import (
+    DATA_DIR,
+    PFR_DATA_FILES,
+    FANTASY_PROS_DATA_FILES,
+    find_data_file,
+    read_pfr_csv,
+    read_fantasy_pros_csv,
+    to_columns,
+)
+
+COMBINED_TEAM_PATTERN = re.compile(r"^\dTM$")
+
+# Derived stats are published to one decimal place
+ROUNDING_TOLERANCE = 0.051
+
+# Approximate checks flag upstream inconsistencies but do not fail the gate unless --strict
+WARNING_RULES = {"ratio"}
+
+# Schema keys:
+#   types     column -> "number" | "string" (absent columns are only an error if required)
+#   required  columns that must exist and have no missing cells
+#   ranges    column -> (min, max), inclusive
+#   traded    ranges that replace `ranges` on combined nTM lines (a traded player can log 18 games)
+#   le        (a, b) pairs where a <= b must hold
+#   ratios    (numerator, denominator, column, scale): numerator / denominator * scale ~= column
+#   unique    player ID column; repeats are only allowed as nTM combined line + team splits
+PFR_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "receiving": {
+        "types": {"Rk": "number", "Player": "string", "Age": "number", "Team": "string", "Pos": "string",
+                  "G": "number", "GS": "number", "Tgt": "number", "Rec": "number", "Yds": "number",
+                  "Y/R": "number", "TD": "number", "1D": "number", "Succ%": "number", "Lng": "number",
+                  "R/G": "number", "Y/G": "number", "Ctch%": "number", "Y/Tgt": "number", "Fmb": "number",
+                  "PlayerID": "string"},
+        "required": ["Player", "Team", "G", "Tgt", "Rec", "Yds", "PlayerID"],
+        "ranges": {"G": (1, 17), "Age": (20, 45), "Ctch%": (0, 100), "Succ%": (0, 100)},
+        "traded": {"G": (1, 18)},
+        "le": [("Rec", "Tgt"), ("GS", "G")],
+        "ratios": [("Yds", "Rec", "Y/R", 1), ("Rec", "Tgt", "Ctch%", 100), ("Yds", "Tgt", "Y/Tgt", 1),
+                   ("Yds", "G", "Y/G", 1)],
+        "unique": "PlayerID",
+    },
+    "rushing": {
+        "types": {"Rk": "number", "Player": "string", "Age": "number", "Team": "string", "Pos": "string",
+                  "G": "number", "GS": "number", "Att": "number", "Yds": "number", "TD": "number",
+                  "1D": "number", "Succ%": "number", "Lng": "number", "Y/A": "number", "Y/G": "number",
+                  "A/G": "number", "Fmb": "number", "PlayerID": "string"},
+        "required": ["Player", "Team", "G", "Att", "Yds", "PlayerID"],
+        "ranges": {"G": (1, 17), "Age": (20, 45), "Succ%": (0, 100)},
+        "traded": {"G": (1, 18)},
+        "le": [("GS", "G"), ("TD", "Att"), ("1D", "Att")],
+        "ratios": [("Yds", "Att", "Y/A", 1), ("Yds", "G", "Y/G", 1), ("Att", "G", "A/G", 1)],
+        "unique": "PlayerID",
+    },
+    "passing": {
+        "types": {"Rk": "number", "Player": "string", "Age": "number", "Team": "string", "Pos": "string",
+                  "G": "number", "GS": "number", "QBrec": "string", "Cmp": "number", "Att": "number",
+                  "Cmp%": "number", "Yds": "number", "TD": "number", "Int": "number", "Rate": "number",
+                  "QBR": "number", "PlayerID": "string"},
+        "required": ["Player", "Team", "G", "Cmp", "Att", "Yds", "PlayerID"],
+        "ranges": {"G": (1, 17), "Age": (20, 45), "Cmp%": (0, 100), "Rate": (0, 158.3), "QBR": (0, 100)},
+        "traded": {"G": (1, 18)},
+        "le": [("Cmp", "Att"), ("GS", "G"), ("TD", "Cmp"), ("Int", "Att")],
+        "ratios": [("Cmp", "Att", "Cmp%", 100), ("Yds", "Att", "Y/A", 1), ("Yds", "G", "Y/G", 1)],
+        "unique": "PlayerID",
+    },
+}
+
+FANTASY_PROS_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "WR": {
+        "types": {"Rank": "number", "Player": "string", "Team": "string", "G": "number", "REC": "number",
+                  "YDS": "number", "Y/R": "number", "TGT": "number", "% TM": "number", "CATCHABLE": "number",
+                  "DROP": "number", "RZ TGT": "number"},
+        "required": ["Rank", "Player", "G", "REC", "YDS", "TGT"],
+        "ranges": {"G": (1, 17), "% TM": (0, 100)},
+        "le": [("REC", "TGT"), ("DROP", "CATCHABLE"), ("CATCHABLE", "TGT"), ("RZ TGT", "TGT")],
+        "ratios": [("YDS", "REC", "Y/R", 1)],
+        "unique": "Player",
+    },
+    "RB": {
+        "types": {"Rank": "number", "Player": "string", "Team": "string", "G": "number", "ATT": "number",
+                  "YDS": "number", "Y/ATT": "number", "REC": "number", "TGT": "number", "RZ TGT": "number"},
+        "required": ["Rank", "Player", "G", "ATT", "YDS"],
+        "ranges": {"G": (1, 17)},
+        "le": [("REC", "TGT"), ("RZ TGT", "TGT")],
+        "ratios": [("YDS", "ATT", "Y/ATT", 1)],
+        "unique": "Player",
+    },
+}
+
+# Hand-checked sample exports (scrape_fantasy_pros.py output and the *_Corrected.csv files)
+SAMPLE_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "WR": {
+        "types": {"Rank": "number", "Player": "string", "Team": "string", "G": "number", "REC": "number",
+                  "TGT": "number", "YDS": "number", "Y/R": "number", "TD": "number", "RZ_TGT": "number",
+                  "FPTS": "number", "FPTS/G": "number"},
+        "required": ["Rank", "Player", "Team", "G", "REC", "TGT", "YDS", "Y/R", "TD", "FPTS", "FPTS/G"],
+        "ranges": {"G": (1, 17), "Y/R": (0, 30), "TD": (0, 20), "FPTS/G": (0.1, 50)},
+        "le": [("REC", "TGT"), ("RZ_TGT", "TGT")],
+        "ratios": [("YDS", "REC", "Y/R", 1), ("FPTS", "G", "FPTS/G", 1)],
+        "unique": "Player",
+    },
+    "RB": {
+        "types": {"Rank": "number", "Player": "string", "Team": "string", "G": "number", "RUSH": "number",
+                  "RUSH_YDS": "number", "RUSH_TD": "number", "REC": "number", "REC_YDS": "number",
+                  "REC_TD": "number", "FPTS": "number", "FPTS/G": "number"},
+        "required": ["Rank", "Player", "Team", "G", "RUSH", "RUSH_YDS", "RUSH_TD", "FPTS", "FPTS/G"],
+        "ranges": {"G": (1, 17), "FPTS/G": (0.1, 50)},
+        "le": [("RUSH_TD", "RUSH"), ("REC_TD", "REC")],
+        "ratios": [("FPTS", "G", "FPTS/G", 1)],
+        "unique": "Player",
+    },
+}
+
+SAMPLE_FILES = {
+    "FantasyPros_WR_2024_Totals_Corrected.csv": "WR",
+    "FantasyPros_RB_2024_Totals_Corrected.csv": "RB",
+}
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _violation(source: str, row: Optional[int], players: List[Any], rule: str, message: str) -> Dict[str, Any]:
+    return {
+        "source": source,
+        "row": row,
+        "player": players[row] if row is not None and row < len(players) else None,
+        "rule": rule,
+        "severity": "warning" if rule in WARNING_RULES else "error",
+        "message": message,
+    }
+
+
+def check_unique(column: List[Any], teams: Optional[List[Any]]) -> List[int]:
+    """
+    Rows whose ID repeats illegally
+    A repeat is allowed only right after a combined nTM line, once per distinct team
+    """
+    bad = []
+    groups: Dict[Any, List[int]] = {}
+    for row, value in enumerate(column):
+        if value is not None:
+            groups.setdefault(value, []).append(row)
+
+    for rows in groups.values():
+        if len(rows) == 1:
+            continue
+        first = teams[rows[0]] if teams else None
+        combined = first is not None and COMBINED_TEAM_PATTERN.match(str(first))
+        split_teams = [teams[row] for row in rows[1:]] if teams else []
+        if (not combined or len(split_teams) > int(str(first)[0]) or len(set(split_teams)) != len(split_teams)
+                or any(COMBINED_TEAM_PATTERN.match(str(team)) for team in split_teams)
+                or rows[-1] - rows[0] != len(rows) - 1):
+            bad.extend(rows[1:])
+    return bad
+
+
+def validate_columns(data: Dict[str, List[Any]], schema: Dict[str, Any], source: str,
+                     row_count: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Run every schema check over whole columns; returns one record per violation"""
+    if row_count is None:
+        row_count = len(next(iter(data.values()))) if data else 0
+    players = data.get("Player", [None] * row_count)
+    violations = []
+
+    for key in schema.get("required", []):
+        if key not in data:
+            violations.append(_violation(source, None, players, "required", f"missing column {key}"))
+            continue
+        for row in [row for row, value in enumerate(data[key]) if value is None or value == ""]:
+            violations.append(_violation(source, row, players, "required", f"{key} is empty"))
+
+    for key, expected in schema.get("types", {}).items():
+        column = data.get(key)
+        if column is None:
+            continue
+        if expected == "number":
+            bad = [row for row, value in enumerate(column) if value is not None and not _is_number(value)]
+        else:
+            bad = [row for row, value in enumerate(column) if value is not None and not isinstance(value, str)]
+        for row in bad:
+            violations.append(_violation(source, row, players, "type",
+                                         f"{key}={column[row]!r} is not a {expected}"))
+
+    teams = data.get("Team", [None] * row_count)
+    traded = schema.get("traded", {})
+    for key, bounds in schema.get("ranges", {}).items():
+        column = data.get(key)
+        if column is None:
+            continue
+        combined_bounds = traded.get(key, bounds)
+        for row, value in enumerate(column):
+            if not _is_number(value):
+                continue
+            low, high = combined_bounds if teams[row] and COMBINED_TEAM_PATTERN.match(str(teams[row])) else bounds
+            if not low <= value <= high:
+                violations.append(_violation(source, row, players, "range",
+                                             f"{key}={value} outside [{low}, {high}]"))
+
+    for a, b in schema.get("le", []):
+        if a not in data or b not in data:
+            continue
+        left, right = data[a], data[b]
+        bad = [row for row, (x, y) in enumerate(zip(left, right)) if _is_number(x) and _is_number(y) and x > y]
+        for row in bad:
+            violations.append(_violation(source, row, players, "le",
+                                         f"{a}={left[row]} > {b}={right[row]}"))
+
+    for numerator, denominator, key, scale in schema.get("ratios", []):
+        if numerator not in data or denominator not in data or key not in data:
+            continue
+        top, bottom, reported = data[numerator], data[denominator], data[key]
+        bad = [
+            row for row, (x, y, z) in enumerate(zip(top, bottom, reported))
+            if _is_number(x) and _is_number(y) and _is_number(z) and y
+            and abs(x / y * scale - z) > ROUNDING_TOLERANCE
+        ]
+        for row in bad:
+            expected = top[row] / bottom[row] * scale
+            violations.append(_violation(source, row, players, "ratio",
+                                         f"{key}={reported[row]} but {numerator}/{denominator} gives {expected:.2f}"))
+
+    unique = schema.get("unique")
+    if unique and unique in data:
+        for row in check_unique(data[unique], data.get("Team")):
+            violations.append(_violation(source, row, players, "unique",
+                                         f"{unique}={data[unique][row]!r} repeats"))
+
+    return violations
+
+
+def validate_rows(rows: List[Dict[str, Any]], schema: Dict[str, Any], source: str) -> List[Dict[str, Any]]:
+    """Validate in-memory records (e.g. scraper output) by transposing them to columns"""
+    keys = list(dict.fromkeys(key for row in rows for key in row))
+    data = {key: [row.get(key) for row in rows] for key in keys}
+    return validate_columns(data, schema, source, len(rows))
+
+
+def validate_pfr_file(spec: Dict[str, str], path: Path) -> List[Dict[str, Any]]:
+    headers, rows = read_pfr_csv(path)
+    data = to_columns(headers, rows)["data"]
+    return validate_columns(data, PFR_SCHEMAS[spec["statType"]], path.name, len(rows))
+
+
+def validate_fantasy_pros_file(spec: Dict[str, str], path: Path) -> List[Dict[str, Any]]:
+    headers, rows = read_fantasy_pros_csv(path)
+    data = to_columns(headers, rows)["data"]
+    return validate_columns(data, FANTASY_PROS_SCHEMAS[spec["position"]], path.name, len(rows))
+
+
+def validate_sample_file(path: Path, position: str) -> List[Dict[str, Any]]:
+    headers, rows = read_fantasy_pros_csv(path)
+    data = to_columns(headers, rows)["data"]
+    return validate_columns(data, SAMPLE_SCHEMAS[position], path.name, len(rows))
+
+
+def validate_all(data_dir: Path = DATA_DIR) -> Dict[str, Any]:
+    """Validate every known data file; returns per-file counts and all violations"""
+    start = time.perf_counter()
+    files = {}
+    violations: List[Dict[str, Any]] = []
+
+    jobs = [(spec, validate_pfr_file) for spec in PFR_DATA_FILES]
+    jobs += [(spec, validate_fantasy_pros_file) for spec in FANTASY_PROS_DATA_FILES]
+    jobs += [({"fileName": name, "position": position},
+              lambda spec, path: validate_sample_file(path, spec["position"]))
+             for name, position in SAMPLE_FILES.items()]
+
+    for spec, validate in jobs:
+        path = find_data_file(spec["fileName"], data_dir)
+        if path is None:
+            files[spec["fileName"]] = None
+            violations.append(_violation(spec["fileName"], None, [], "required", "file is missing"))
+            continue
+        found = validate(spec, path)
+        files[path.name] = len(found)
+        violations.extend(found)
+
+    return {
+        "files": files,
+        "violations": violations,
+        "errors": sum(1 for violation in violations if violation["severity"] == "error"),
+        "seconds": round(time.perf_counter() - start, 4),
+    }
+
+
+def main():
+    """Validate public/data; exits non-zero on errors (or any violation with --strict) to gate a deploy"""
+    print("Data Validation")
+    print("=" * 50)
+
+    strict = "--strict" in sys.argv[1:]
+    report = validate_all()
+
+    for name, count in report["files"].items():
+        icon = "❌" if count is None else "⚠️ " if count else "✅"
+        detail = "missing" if count is None else f"{count} violation(s)"
+        print(f"  {icon} {name}: {detail}")
+
+    for violation in report["violations"]:
+        where = f"row {violation['row'] + 1}" if violation["row"] is not None else "file"
+        player = f" ({violation['player']})" if violation["player"] else ""
+        print(f"    - {violation['severity']}: {violation['source']} {where}{player}: "
+              f"[{violation['rule']}] {violation['message']}")
+
+    warnings = len(report["violations"]) - report["errors"]
+    print(f"\nValidated {len(report['files'])} files in {report['seconds'] * 1000:.0f} ms: "
+          f"{report['errors']} error(s), {warnings} warning(s)")
+    sys.exit(1 if report["errors"] or (strict and warnings) else 0)
+
+
+if __name__ == "__main__":
+    main()
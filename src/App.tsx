@@ -1,5 +1,6 @@
 import { useEffect } from 'react';
 import HeroWithOverlay from './components/HeroWithOverlay';
+import ResponsiveImage from './components/ResponsiveImage';
 import FantasyProsWidget from './components/FantasyProsWidget';
 import FantasyProsDataWidget from './components/FantasyProsDataWidget';
 
@@ -36,8 +37,9 @@ function App() {
         <div className="sticky top-0 z-20 bg-gradient-to-b from-black via-gray-900/95 to-transparent backdrop-blur-sm">
           <div className="py-4 px-6">
             <div className="max-w-6xl mx-auto flex items-center justify-center gap-4">
-              <img 
+              <ResponsiveImage 
                 src="/images/pblivin.png" 
+                sizes="4rem"
                 alt="PB Livin" 
                 className="w-12 h-12 md:w-16 md:h-16 object-contain animate-bounce-slow"
               />
@@ -4,7 +4,9 @@ import UniversalStatsTable from './UniversalStatsTable';
 import { 
   availableDataFiles, 
   loadCSVData, 
+  loadLeaderboardIndex,
   getColumnsByStatType,
+  LeaderboardIndex,
   StatType, 
   SeasonType, 
   Year 
@@ -15,6 +17,7 @@ export default function DataDashboard() {
   const [activeSeasonType, setActiveSeasonType] = useState<SeasonType>('regular');
   const [activeYear, setActiveYear] = useState<Year>('2024');
   const [data, setData] = useState<any[]>([]);
+  const [leaderboard, setLeaderboard] = useState<LeaderboardIndex | null>(null);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
   const [dataStatus, setDataStatus] = useState<Map<string, boolean>>(new Map());
@@ -60,6 +63,7 @@ export default function DataDashboard() {
     if (!file) {
       setError('No data file found for selected options');
       setData([]);
+      setLeaderboard(null);
       return;
     }
 
@@ -67,12 +71,17 @@ export default function DataDashboard() {
     setError(null);
 
     try {
-      const loadedData = await loadCSVData(file.fileName);
+      const [loadedData, loadedIndex] = await Promise.all([
+        loadCSVData(file.fileName),
+        loadLeaderboardIndex(file.fileName)
+      ]);
       setData(loadedData);
+      setLeaderboard(loadedIndex);
       console.log(`Loaded ${loadedData.length} records from ${file.fileName}`);
     } catch (err) {
       setError(`Failed to load ${file.displayName}`);
       setData([]);
+      setLeaderboard(null);
       console.error(err);
     } finally {
       setLoading(false);
@@ -206,6 +215,7 @@ export default function DataDashboard() {
       {!loading && !error && data.length > 0 && currentFile && (
         <UniversalStatsTable 
           data={data}
+          leaderboard={leaderboard}
           columns={getColumnsByStatType(activeStatType)}
           title={currentFile.displayName}
         />
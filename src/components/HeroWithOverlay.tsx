@@ -1,4 +1,5 @@
 import React, { useEffect, useState } from 'react';
+import ResponsiveImage from './ResponsiveImage';
 
 const HeroWithOverlay: React.FC = () => {
   const [isVisible, setIsVisible] = useState(false);
@@ -11,8 +12,9 @@ const HeroWithOverlay: React.FC = () => {
     <div className="relative h-screen w-full overflow-hidden flex items-center justify-center">
       {/* Hollywoo background with gradient overlay */}
       <div className="absolute inset-0">
-        <img 
+        <ResponsiveImage 
           src="/images/hollywoo.png" 
+          sizes="100vw"
           alt="Hollywoo Fantasy Football" 
           className="w-full h-full object-cover"
         />
@@ -26,8 +28,9 @@ const HeroWithOverlay: React.FC = () => {
       <div className={`absolute left-8 md:left-16 top-1/2 -translate-y-1/2 w-64 h-64 md:w-80 md:h-80 lg:w-96 lg:h-96 transition-all duration-1000 ${
         isVisible ? 'opacity-100 translate-x-0' : 'opacity-0 -translate-x-8'
       }`}>
-        <img 
+        <ResponsiveImage 
           src="/images/pblivin-transparent.png" 
+          sizes="(min-width: 1024px) 24rem, (min-width: 768px) 20rem, 16rem"
           alt="PB Livin Sonic" 
           className="w-full h-full object-contain filter drop-shadow-[0_20px_40px_rgba(0,0,0,0.5)]"
         />
@@ -0,0 +1,46 @@
+import React from 'react';
+
+interface ImageVariants {
+  widths: number[];
+  formats: string[];
+}
+
+// Written by `scripts/optimize_assets.py optimize` in CI; absent in dev, so images fall back to the originals
+const manifests = import.meta.glob<Record<string, ImageVariants>>('../generated/imageVariants.json', {
+  eager: true,
+  import: 'default'
+});
+const variants: Record<string, ImageVariants> = Object.values(manifests)[0] ?? {};
+
+interface ResponsiveImageProps extends React.ImgHTMLAttributes<HTMLImageElement> {
+  src: string;
+  sizes: string;
+}
+
+const ResponsiveImage: React.FC<ResponsiveImageProps> = ({ src, sizes, ...imgProps }) => {
+  const slash = src.lastIndexOf('/');
+  const dir = src.slice(0, slash);
+  const name = src.slice(slash + 1);
+  const entry = variants[name];
+
+  if (!entry) {
+    return <img src={src} {...imgProps} />;
+  }
+
+  const stem = name.replace(/\.[^.]+$/, '');
+  return (
+    <picture>
+      {entry.formats.map(format => (
+        <source
+          key={format}
+          type={`image/${format}`}
+          sizes={sizes}
+          srcSet={entry.widths.map(width => `${dir}/optimized/${stem}-${width}.${format} ${width}w`).join(', ')}
+        />
+      ))}
+      <img src={src} {...imgProps} />
+    </picture>
+  );
+};
+
+export default ResponsiveImage;
@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import { Trophy, Target, Zap, TrendingUp, Award, Flame } from 'lucide-react';
-import { loadCSVData } from '../utils/dataLoader';
+import { loadCSVData, loadLeaderboardIndex, findLeader } from '../utils/dataLoader';
 
 interface LeaderCard {
   category: string;
@@ -23,19 +23,20 @@ export default function StatLeaders() {
   const loadLeaders = async () => {
     try {
       // Load 2024 regular season data
-      const [receivingData, passingData, rushingData] = await Promise.all([
+      const [receivingData, passingData, rushingData, receivingIndex, passingIndex, rushingIndex] = await Promise.all([
         loadCSVData('pff-nfl-regular-receiving-2024.csv').catch(() => []),
         loadCSVData('pff-nfl-regular-passing-2024.csv').catch(() => []),
-        loadCSVData('pff-nfl-regular-rushing-2024.csv').catch(() => [])
+        loadCSVData('pff-nfl-regular-rushing-2024.csv').catch(() => []),
+        loadLeaderboardIndex('pff-nfl-regular-receiving-2024.csv'),
+        loadLeaderboardIndex('pff-nfl-regular-passing-2024.csv'),
+        loadLeaderboardIndex('pff-nfl-regular-rushing-2024.csv')
       ]);
 
       const leaderCards: LeaderCard[] = [];
 
       // Receiving Leader
       if (receivingData.length > 0) {
-        const receivingLeader = receivingData.reduce((prev, current) => 
-          (parseFloat(current.Yds) > parseFloat(prev.Yds)) ? current : prev
-        );
+        const receivingLeader = findLeader(receivingData, receivingIndex, 'Yds');
         leaderCards.push({
           category: 'Receiving Leader',
           player: receivingLeader.Player,
@@ -47,9 +48,7 @@ export default function StatLeaders() {
         });
 
         // Most TDs
-        const tdLeader = receivingData.reduce((prev, current) => 
-          (parseFloat(current.TD) > parseFloat(prev.TD)) ? current : prev
-        );
+        const tdLeader = findLeader(receivingData, receivingIndex, 'TD');
         if (tdLeader.Player !== receivingLeader.Player) {
           leaderCards.push({
             category: 'Touchdown Leader',
@@ -65,9 +64,7 @@ export default function StatLeaders() {
 
       // Passing Leader
       if (passingData.length > 0) {
-        const passingLeader = passingData.reduce((prev, current) => 
-          (parseFloat(current.Yds) > parseFloat(prev.Yds)) ? current : prev
-        );
+        const passingLeader = findLeader(passingData, passingIndex, 'Yds');
         leaderCards.push({
           category: 'Passing Leader',
           player: passingLeader.Player,
@@ -81,9 +78,7 @@ export default function StatLeaders() {
 
       // Rushing Leader
       if (rushingData.length > 0) {
-        const rushingLeader = rushingData.reduce((prev, current) => 
-          (parseFloat(current.Yds) > parseFloat(prev.Yds)) ? current : prev
-        );
+        const rushingLeader = findLeader(rushingData, rushingIndex, 'Yds');
         leaderCards.push({
           category: 'Rushing Leader',
           player: rushingLeader.Player,
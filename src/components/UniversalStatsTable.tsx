@@ -1,5 +1,6 @@
 import React, { useState, useMemo } from 'react';
 import { ChevronUp, ChevronDown } from 'lucide-react';
+import { LeaderboardIndex } from '../utils/dataLoader';
 
 interface Column {
   key: string;
@@ -11,9 +12,10 @@ interface Props {
   data: any[];
   columns: Column[];
   title: string;
+  leaderboard?: LeaderboardIndex | null;
 }
 
-export default function UniversalStatsTable({ data, columns, title }: Props) {
+export default function UniversalStatsTable({ data, columns, title, leaderboard }: Props) {
   const [sortKey, setSortKey] = useState<string>('Rk');
   const [sortDirection, setSortDirection] = useState<'asc' | 'desc'>('asc');
   const [searchTerm, setSearchTerm] = useState('');
@@ -28,8 +30,18 @@ export default function UniversalStatsTable({ data, columns, title }: Props) {
     return Array.from(posSet).sort();
   }, [data]);
 
+  // Rows in sort order straight from the precomputed leaderboard permutations (both stable, like
+  // the comparator below). Columns with gaps fall back to the comparator, which sorts gaps as 0
+  // where the index puts them last
+  const indexedOrder = useMemo(() => {
+    const column = leaderboard?.columns[sortKey];
+    if (!column || leaderboard!.rowCount !== data.length || column.count !== data.length) return null;
+    const order = sortDirection === 'desc' ? column.order : column.ascending;
+    return order ? order.map(row => data[row]) : null;
+  }, [data, leaderboard, sortKey, sortDirection]);
+
   const filteredAndSortedData = useMemo(() => {
-    let filtered = [...data];
+    let filtered = indexedOrder ?? data;
 
     // Filter by position if column exists
     if (positionFilter !== 'ALL' && columns.some(col => col.key === 'Pos')) {
@@ -46,8 +58,11 @@ export default function UniversalStatsTable({ data, columns, title }: Props) {
       );
     }
 
-    // Sort data
-    const sorted = filtered.sort((a, b) => {
+    // Already ordered by the leaderboard index; filtering keeps that order
+    if (indexedOrder) return filtered;
+
+    // Sort data (copy first: without filters `filtered` is still the data prop)
+    const sorted = [...filtered].sort((a, b) => {
       let aVal: any = a[sortKey];
       let bVal: any = b[sortKey];
       
@@ -73,7 +88,7 @@ export default function UniversalStatsTable({ data, columns, title }: Props) {
     });
 
     return sorted;
-  }, [data, columns, positionFilter, searchTerm, sortKey, sortDirection]);
+  }, [data, indexedOrder, columns, positionFilter, searchTerm, sortKey, sortDirection]);
 
   const handleSort = (key: string) => {
     if (sortKey === key) {
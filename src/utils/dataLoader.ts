@@ -38,7 +38,43 @@ export const availableDataFiles: DataFile[] = [
   { statType: 'rushing', seasonType: 'playoff', year: '2022', fileName: 'pff-nfl-playoff-rushing-2022.csv', displayName: '2022 Playoff Rushing' },
 ];
 
+interface NormalizedPayload {
+  rowCount: number;
+  columns: Array<{key: string, type: 'string' | 'number'}>;
+  data: Record<string, Array<string | number | null>>;
+}
+
+// Pre-cleaned columnar JSON produced by scripts/ingest_data.py at build time
+async function loadNormalizedData(fileName: string): Promise<any[] | null> {
+  try {
+    const response = await fetch(`/data/normalized/${fileName.replace(/\.csv$/i, '.json')}`);
+    if (!response.ok) {
+      return null;
+    }
+
+    const payload: NormalizedPayload = await response.json();
+    const rows: any[] = new Array(payload.rowCount);
+    for (let i = 0; i < payload.rowCount; i++) {
+      rows[i] = {};
+    }
+    for (const column of payload.columns) {
+      const values = payload.data[column.key];
+      for (let i = 0; i < payload.rowCount; i++) {
+        rows[i][column.key] = values[i];
+      }
+    }
+    return rows;
+  } catch {
+    return null;
+  }
+}
+
 export async function loadCSVData(fileName: string): Promise<any[]> {
+  const normalized = await loadNormalizedData(fileName);
+  if (normalized) {
+    return normalized;
+  }
+
   try {
     const response = await fetch(`/data/${fileName}`);
     if (!response.ok) {
@@ -98,6 +134,40 @@ export async function loadCSVData(fileName: string): Promise<any[]> {
   }
 }
 
+export interface LeaderboardColumn {
+  count: number;
+  order: number[];
+  ascending: number[];
+  top: Array<{row: number, Player: string, Team: string, PlayerID: string | null, value: number}>;
+}
+
+export interface LeaderboardIndex {
+  source: string;
+  rowCount: number;
+  columns: Record<string, LeaderboardColumn>;
+}
+
+// Sorted row permutations and top-25 slices produced by scripts/leaderboards.py
+export async function loadLeaderboardIndex(fileName: string): Promise<LeaderboardIndex | null> {
+  try {
+    const response = await fetch(`/data/leaderboards/${fileName.replace(/\.csv$/i, '.json')}`);
+    return response.ok ? await response.json() : null;
+  } catch {
+    return null;
+  }
+}
+
+// Row with the highest value in a column: O(1) with a matching index, otherwise a linear scan
+export function findLeader(rows: any[], index: LeaderboardIndex | null, key: string): any {
+  const column = index?.columns[key];
+  if (column && index!.rowCount === rows.length && column.count > 0) {
+    return rows[column.order[0]];
+  }
+  return rows.reduce((prev, current) =>
+    (parseFloat(current[key]) > parseFloat(prev[key])) ? current : prev
+  );
+}
+
 export function getColumnsByStatType(statType: StatType): Array<{key: string, label: string, type: 'string' | 'number'}> {
   switch (statType) {
     case 'receiving':